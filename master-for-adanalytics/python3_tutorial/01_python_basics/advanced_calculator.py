@@ -137,7 +137,7 @@ def main():
     calc = Calculator()
     
     # 저장된 히스토리 불러오기
-    calc.history = load_history()
+    calc.history.extend(load_history())
     
     print_header("고급 공학용 계산기")
     print("계산 결과를 재사용하려면 'ANS'를 입력하세요.")
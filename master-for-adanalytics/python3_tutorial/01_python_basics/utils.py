@@ -5,6 +5,7 @@
 
 import os
 import json
+from collections import deque
 from datetime import datetime
 
 def clear_screen():
@@ -82,7 +83,7 @@ class Calculator:
     """계산기 상태를 관리하는 클래스"""
     def __init__(self):
         self.memory = 0
-        self.history = []
+        self.history = deque(maxlen=100)  # 최대 100개까지만 저장
         self.last_result = 0
     
     def add_to_memory(self, value):
@@ -107,10 +108,7 @@ class Calculator:
             "timestamp": datetime.now().isoformat(),
             "calculation": record
         })
-        # 최대 100개까지만 저장
-        if len(self.history) > 100:
-            self.history.pop(0)
     
     def get_history(self, limit=10):
         """최근 계산 기록을 반환합니다"""
-        return self.history[-limit:]
\ No newline at end of file
+        return list(self.history)[-limit:]
\ No newline at end of file
@@ -32,6 +32,31 @@ from utils import (
     print_header, print_menu, get_choice, Calculator
 )
 
+# 연산 메뉴 전체 (메뉴 번호 -> (이름, 기호))
+ALL_MENUS = {**BASIC_MENU, **ADVANCED_MENU, **TRIGONOMETRY_MENU, **LOGARITHM_MENU}
+
+# 단항 연산 딕셔너리 매핑
+UNARY_OPERATIONS: Dict[str, Callable[[float], Union[float, str, int]]] = {
+    "6": square_root,        # 제곱근
+    "7": factorial,           # 팩토리얼
+    "9": sin_degrees,         # 사인
+    "10": cos_degrees,        # 코사인
+    "11": tan_degrees,        # 탄젠트
+    "12": lambda x: logarithm(x, 10),  # 상용로그
+    "13": natural_log         # 자연로그
+}
+
+# 이항 연산 딕셔너리 매핑
+BINARY_OPERATIONS: Dict[str, Callable[[float, float], Union[float, str]]] = {
+    "1": add,
+    "2": subtract,
+    "3": multiply,
+    "4": divide,
+    "5": power,
+    "8": modulo,
+    "14": logarithm  # 임의 밑 로그
+}
+
 def show_full_menu() -> None:
     """전체 메뉴를 표시합니다"""
     print("\n[기본 연산]")
@@ -161,7 +186,7 @@ def main() -> None:
     calc = Calculator()
     
     # 저장된 히스토리 불러오기
-    calc.history = load_history()
+    calc.history.extend(load_history())
     
     print_header("고급 공학용 계산기")
     print("계산 결과를 재사용하려면 'ANS'를 입력하세요.")
@@ -212,13 +237,11 @@ def main() -> None:
             continue
         
         # 연산 수행
-        all_menus = {**BASIC_MENU, **ADVANCED_MENU, **TRIGONOMETRY_MENU, **LOGARITHM_MENU}
-        
-        if choice not in all_menus:
+        if choice not in ALL_MENUS:
             print("올바른 메뉴를 선택해주세요.")
             continue
         
-        operation_name, operation_symbol = all_menus[choice]
+        operation_name, operation_symbol = ALL_MENUS[choice]
         
         # 숫자 입력
         num1_input = input("첫 번째 숫자 (또는 ANS): ")
@@ -232,20 +255,9 @@ def main() -> None:
                 print("올바른 숫자를 입력해주세요.")
                 continue
         
-        # 단항 연산 딕셔너리 매핑
-        unary_operations: Dict[str, Callable[[float], Union[float, str, int]]] = {
-            "6": square_root,        # 제곱근
-            "7": factorial,           # 팩토리얼
-            "9": sin_degrees,         # 사인
-            "10": cos_degrees,        # 코사인
-            "11": tan_degrees,        # 탄젠트
-            "12": lambda x: logarithm(x, 10),  # 상용로그
-            "13": natural_log         # 자연로그
-        }
-        
         # 단항 연산 처리
-        if choice in unary_operations:
-            result = unary_operations[choice](num1)
+        if choice in UNARY_OPERATIONS:
+            result = UNARY_OPERATIONS[choice](num1)
             record = format_calculation(num1, operation_symbol, None, result)
         
         # 이항 연산
@@ -261,19 +273,8 @@ def main() -> None:
                     print("올바른 숫자를 입력해주세요.")
                     continue
             
-            # 이항 연산 딕셔너리 매핑
-            binary_operations: Dict[str, Callable[[float, float], Union[float, str]]] = {
-                "1": add,
-                "2": subtract,
-                "3": multiply,
-                "4": divide,
-                "5": power,
-                "8": modulo,
-                "14": logarithm  # 임의 밑 로그
-            }
-            
-            if choice in binary_operations:
-                result = binary_operations[choice](num1, num2)
+            if choice in BINARY_OPERATIONS:
+                result = BINARY_OPERATIONS[choice](num1, num2)
             else:
                 result = "에러: 지원되지 않는 연산"
             
@@ -6,6 +6,9 @@
 import math
 from typing import Union
 
+# 0! ~ 170! (결과가 float 범위 안에 드는 구간)은 모듈 로드 시 미리 계산해 둡니다
+_FACTORIALS = tuple(math.factorial(i) for i in range(171))
+
 def power(base: float, exponent: float) -> float:
     """거듭제곱을 계산합니다"""
     return base ** exponent
@@ -25,9 +28,10 @@ def factorial(n: float) -> Union[int, str]:
     """
     if n < 0:
         return "에러: 음수의 팩토리얼은 정의되지 않습니다"
-    if n == 0 or n == 1:
-        return 1
-    return math.factorial(int(n))
+    n = int(n)
+    if n < len(_FACTORIALS):
+        return _FACTORIALS[n]
+    return math.factorial(n)
 
 def sin_degrees(degrees: float) -> float:
     """각도(도)로 사인값을 계산합니다"""
@@ -4,8 +4,9 @@
 """
 
 import json
+from collections import deque
 from datetime import datetime
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Deque, Any, Optional, Union
 
 def format_number(number: Union[float, int, str]) -> str:
     """숫자를 보기 좋게 포맷팅합니다"""
@@ -79,7 +80,7 @@ class Calculator:
     """계산기 상태를 관리하는 클래스"""
     def __init__(self) -> None:
         self.memory: float = 0
-        self.history: List[Dict[str, str]] = []
+        self.history: Deque[Dict[str, str]] = deque(maxlen=100)  # 최대 100개까지만 저장
         self.last_result: float = 0
     
     def add_to_memory(self, value: float) -> None:
@@ -104,17 +105,14 @@ class Calculator:
             "timestamp": datetime.now().isoformat(),
             "calculation": record
         })
-        # 최대 100개까지만 저장
-        if len(self.history) > 100:
-            self.history.pop(0)
     
     def get_history(self, limit: int = 10) -> List[Dict[str, str]]:
         """최근 계산 기록을 반환합니다"""
-        return self.history[-limit:]
+        return list(self.history)[-limit:]
     
     def clear_history(self) -> None:
         """계산 기록을 모두 지웁니다"""
-        self.history = []
+        self.history.clear()
         self.last_result = 0
 
 
@@ -6,6 +6,7 @@ from .gil_demo import GILDemo, measure_gil_impact
 from .async_processor import AsyncProcessor
 from .thread_processor import ThreadProcessor
 from .process_processor import ProcessProcessor
+from .uring_processor import UringProcessor
 
 __all__ = [
     "GILDemo",
@@ -13,4 +14,5 @@ __all__ = [
     "AsyncProcessor",
     "ThreadProcessor",
     "ProcessProcessor",
+    "UringProcessor",
 ]
\ No newline at end of file
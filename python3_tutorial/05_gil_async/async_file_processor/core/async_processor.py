@@ -5,6 +5,7 @@ asyncio를 활용한 효율적인 파일 처리
 
 import asyncio
 import aiofiles
+import aiofiles.os
 import aiohttp
 from pathlib import Path
 from typing import List, Dict, Optional, Callable, AsyncIterator, Any
@@ -12,6 +13,7 @@ from dataclasses import dataclass
 import time
 import hashlib
 import json
+from collections import OrderedDict
 from concurrent.futures import ProcessPoolExecutor
 
 
@@ -37,12 +39,15 @@ class ProcessingResult:
 class AsyncProcessor:
     """비동기 파일 처리기"""
     
-    def __init__(self, max_workers: int = 10, chunk_size: int = 8192):
+    def __init__(self, max_workers: int = 10, chunk_size: int = 8192, cache_size: int = 1024):
         self.max_workers = max_workers
         self.chunk_size = chunk_size
         self.semaphore = asyncio.Semaphore(max_workers)
         self.results: List[ProcessingResult] = []
         self._process_pool = None
+        # (경로, mtime_ns, 크기, 처리기) -> 처리 결과 (최근에 쓴 cache_size개만 유지하는 LRU)
+        self.cache_size = cache_size
+        self._result_cache: OrderedDict[tuple, Any] = OrderedDict()
     
     async def __aenter__(self):
         """컨텍스트 매니저 진입"""
@@ -80,6 +85,19 @@ class AsyncProcessor:
         start_time = time.perf_counter()
         
         try:
+            # stat 기반 캐시 키: 파일이 바뀌면 mtime/크기가 달라져 자동 무효화
+            stat = await aiofiles.os.stat(file_path)
+            cache_key = (file_path, stat.st_mtime_ns, stat.st_size, processor)
+            if cache_key in self._result_cache:
+                self._result_cache.move_to_end(cache_key)
+                # 캐시 적중도 실제로 걸린 시간을 기록 (0으로 두면 통계가 왜곡된다)
+                return ProcessingResult(
+                    file_path=file_path,
+                    success=True,
+                    result=self._result_cache[cache_key],
+                    duration=time.perf_counter() - start_time
+                )
+            
             async with self.semaphore:
                 # 파일 읽기
                 content = await self.read_file_async(file_path)
@@ -97,6 +115,8 @@ class AsyncProcessor:
                 
                 duration = time.perf_counter() - start_time
                 
+                self._cache_result(cache_key, result)
+                
                 return ProcessingResult(
                     file_path=file_path,
                     success=True,
@@ -113,6 +133,16 @@ class AsyncProcessor:
                 duration=duration
             )
     
+    def _cache_result(self, cache_key: tuple, result: Any) -> None:
+        """처리 결과 저장 (cache_size를 넘으면 가장 오래 쓰지 않은 항목부터 제거)"""
+        if self.cache_size <= 0:
+            return
+        
+        self._result_cache[cache_key] = result
+        self._result_cache.move_to_end(cache_key)
+        while len(self._result_cache) > self.cache_size:
+            self._result_cache.popitem(last=False)
+    
     async def process_directory(
         self,
         directory: str,
@@ -134,10 +164,15 @@ class AsyncProcessor:
         if processor is None:
             processor = self._default_processor
         
-        # 비동기 처리
+        # 비동기 처리 (심볼릭 링크를 풀어 같은 파일은 한 번만 처리)
         tasks = []
+        seen = set()
         for file_path in files:
             if file_path.is_file():
+                resolved = file_path.resolve()
+                if resolved in seen:
+                    continue
+                seen.add(resolved)
                 task = self.process_file(str(file_path), processor)
                 tasks.append(task)
         
@@ -3,21 +3,55 @@
 threading과 concurrent.futures를 활용한 파일 처리
 """
 
+import os
 import threading
 import concurrent.futures
-from pathlib import Path
-from typing import List, Dict, Optional, Callable, Any
+from typing import List, Dict, Optional, Callable, Any, Tuple
 from dataclasses import dataclass
+from collections import defaultdict
 import time
 import queue
 import hashlib
-from threading import Lock, Event
 import json
+from pathlib import Path
+from threading import Lock, Event
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    orjson = None
+
+from ..utils.file_utils import _iter_files
+
+
+# JSON으로 그대로 직렬화할 수 있는 결과 타입
+_JSON_NATIVE_TYPES = (dict, list, str, int, float, bool)
+
+# 워커 종료 신호 (워커 수만큼 큐에 넣는다)
+_SENTINEL = object()
+
+# 워커가 로컬에 모아 둔 결과를 공유 리스트로 옮기는 단위
+_RESULTS_FLUSH_SIZE = 16
+
+# 워커가 큐에서 한 번에 꺼내는 최대 작업 수
+_TASK_BATCH_SIZE = 8
+
+# 기본 처리기가 파일을 나눠 읽는 크기 (64 KiB)
+_READ_CHUNK_SIZE = 1 << 16
+
+# bytes.split()이 단어 구분자로 쓰는 공백 문자
+_WHITESPACE = b' \t\n\r\x0b\x0c'
+
+# 바이트 값 -> 공백 여부 룩업 테이블
+_WHITESPACE_TABLE = np.zeros(256, dtype=bool)
+_WHITESPACE_TABLE[list(_WHITESPACE)] = True
 
 
-@dataclass 
+@dataclass(slots=True)
 class ThreadResult:
-    """스레드 처리 결과"""
+    """스레드 처리 결과 (파일마다 생성되므로 __slots__로 인스턴스 크기 축소)"""
     thread_id: int
     file_path: str
     success: bool
@@ -26,76 +60,199 @@ class ThreadResult:
     duration: float = 0.0
 
 
+def _pin_to_core(core: Optional[int]) -> None:
+    """현재 스레드/프로세스를 지정한 코어에 고정 (Linux 전용, 그 외 환경에서는 무시)"""
+    if core is None:
+        return
+    try:
+        os.sched_setaffinity(0, {core})
+    except (AttributeError, OSError):
+        pass
+
+
+def _count_lines_and_words(content: bytes) -> Tuple[int, int]:
+    """줄 수와 단어 수 계산 (len(content.split())처럼 토큰 리스트를 만들지 않음)"""
+    if not content:
+        return 0, 0
+    
+    arr = np.frombuffer(content, dtype=np.uint8)
+    lines = int(np.count_nonzero(arr == 0x0a))
+    
+    # 공백 -> 비공백으로 바뀌는 위치가 단어의 시작
+    is_ws = _WHITESPACE_TABLE[arr]
+    words = int(np.count_nonzero(is_ws[:-1] & ~is_ws[1:]))
+    if not is_ws[0]:
+        words += 1
+    
+    return lines, words
+
+
+def _decode_text(content: bytes) -> str:
+    """사용자 처리기에 넘길 문자열 (텍스트 모드 open()처럼 줄바꿈을 '\\n'으로 통일)"""
+    return content.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+
+
+def default_processor(content: bytes) -> dict:
+    """기본 처리기 (디코딩 없이 바이트 단위로 처리)"""
+    lines, words = _count_lines_and_words(content)
+    return {
+        "size": len(content),
+        "lines": lines,
+        "words": words,
+        "hash": hashlib.md5(content).hexdigest()
+    }
+
+
+def _default_processor_streamed(f) -> dict:
+    """기본 처리기의 스트리밍 버전 (파일 전체를 메모리에 올리지 않음)"""
+    md5 = hashlib.md5()
+    size = lines = words = 0
+    in_word = False
+    
+    for chunk in iter(lambda: f.read(_READ_CHUNK_SIZE), b''):
+        md5.update(chunk)
+        size += len(chunk)
+        chunk_lines, chunk_words = _count_lines_and_words(chunk)
+        lines += chunk_lines
+        words += chunk_words
+        
+        # 청크 경계에서 잘린 단어는 한 번만 센다
+        if in_word and chunk[0] not in _WHITESPACE:
+            words -= 1
+        in_word = chunk[-1] not in _WHITESPACE
+    
+    return {
+        "size": size,
+        "lines": lines,
+        "words": words,
+        "hash": md5.hexdigest()
+    }
+
+
+def process_file_worker(
+    file_path: str,
+    processor: Callable[[str], Any],
+    thread_id: Optional[int] = None
+) -> ThreadResult:
+    """단일 파일 처리 (프로세스 풀에서도 쓸 수 있도록 모듈 레벨에 정의)"""
+    if thread_id is None:
+        thread_id = threading.get_ident()
+    start_time = time.perf_counter()
+    
+    try:
+        # 파일 읽기 (바이너리 모드: read()가 GIL을 놓고 시스템 콜 수행)
+        with open(file_path, 'rb') as f:
+            if processor is default_processor:
+                # 기본 처리기는 청크 단위로 해시/통계를 계산 (메모리 사용량 일정)
+                result = _default_processor_streamed(f)
+            else:
+                # 사용자 처리기에는 문자열 전달
+                content = _decode_text(f.read())
+                result = processor(content)
+        
+        duration = time.perf_counter() - start_time
+        
+        return ThreadResult(
+            thread_id=thread_id,
+            file_path=file_path,
+            success=True,
+            result=result,
+            duration=duration
+        )
+    
+    except Exception as e:
+        duration = time.perf_counter() - start_time
+        return ThreadResult(
+            thread_id=thread_id,
+            file_path=file_path,
+            success=False,
+            error=str(e),
+            duration=duration
+        )
+
+
 class ThreadProcessor:
     """스레드 기반 파일 처리기"""
     
-    def __init__(self, max_workers: int = 10):
+    def __init__(self, max_workers: int = 10, pin_core: Optional[int] = None):
         self.max_workers = max_workers
+        self.pin_core = pin_core  # 스레드 워커를 고정할 CPU 코어 (None이면 고정하지 않음)
         self.results: List[ThreadResult] = []
         self.results_lock = Lock()
         self.task_queue = queue.Queue()
-        self.stop_event = Event()
         self.active_threads = 0
         self.active_threads_lock = Lock()
     
-    def process_file(self, file_path: str, processor: Callable[[str], Any]) -> ThreadResult:
+    def process_file(
+        self,
+        file_path: str,
+        processor: Callable[[str], Any],
+        thread_id: Optional[int] = None
+    ) -> ThreadResult:
         """단일 파일 처리"""
-        thread_id = threading.get_ident()
-        start_time = time.perf_counter()
+        return process_file_worker(file_path, processor, thread_id)
+    
+    def _drain_tasks(self, max_items: int) -> List[Any]:
+        """큐에서 작업을 최대 max_items개까지 꺼내기
         
-        try:
-            # 파일 읽기
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # 처리
-            result = processor(content)
-            
-            duration = time.perf_counter() - start_time
-            
-            return ThreadResult(
-                thread_id=thread_id,
-                file_path=file_path,
-                success=True,
-                result=result,
-                duration=duration
-            )
-            
-        except Exception as e:
-            duration = time.perf_counter() - start_time
-            return ThreadResult(
-                thread_id=thread_id,
-                file_path=file_path,
-                success=False,
-                error=str(e),
-                duration=duration
-            )
+        첫 작업은 블로킹 대기하고, 나머지는 이미 쌓여 있는 것만 가져온다.
+        종료 신호를 만나면 거기서 멈춰 다른 워커의 종료 신호를 가져가지 않는다.
+        """
+        # 빈 큐에서 폴링하지 않고 블로킹 대기
+        items = [self.task_queue.get()]
+        
+        # 나머지는 기다리지 않고 이미 들어와 있는 것만 꺼낸다
+        while len(items) < max_items and items[-1] is not _SENTINEL:
+            try:
+                items.append(self.task_queue.get_nowait())
+            except queue.Empty:
+                break
+        
+        return items
     
     def worker(self, processor: Callable[[str], Any]):
         """워커 스레드"""
         with self.active_threads_lock:
             self.active_threads += 1
         
+        # 결과는 스레드 로컬 리스트에 모았다가 묶어서 반영 (락 획득 횟수 감소)
+        local_results: List[ThreadResult] = []
+        
+        # 코어 간 이동에 따른 캐시 무효화 방지
+        _pin_to_core(self.pin_core)
+        
+        # 스레드 ID는 워커 수명 동안 바뀌지 않으므로 한 번만 조회
+        thread_id = threading.get_ident()
+        
         try:
-            while not self.stop_event.is_set():
-                try:
-                    file_path = self.task_queue.get(timeout=0.1)
-                    
-                    # 파일 처리
-                    result = self.process_file(file_path, processor)
-                    
-                    # 결과 저장
-                    with self.results_lock:
-                        self.results.append(result)
-                    
-                    self.task_queue.task_done()
+            running = True
+            while running:
+                for file_path in self._drain_tasks(_TASK_BATCH_SIZE):
+                    if file_path is _SENTINEL:
+                        self.task_queue.task_done()
+                        running = False
+                        break
                     
-                except queue.Empty:
-                    continue
-                except Exception as e:
-                    print(f"Worker error: {e}")
+                    try:
+                        # 파일 처리
+                        result = self.process_file(file_path, processor, thread_id)
+                        
+                        # 결과 저장
+                        local_results.append(result)
+                        if len(local_results) >= _RESULTS_FLUSH_SIZE:
+                            with self.results_lock:
+                                self.results.extend(local_results)
+                            local_results.clear()
+                        
+                    except Exception as e:
+                        print(f"Worker error: {e}")
+                    finally:
+                        self.task_queue.task_done()
                     
         finally:
+            if local_results:
+                with self.results_lock:
+                    self.results.extend(local_results)
             with self.active_threads_lock:
                 self.active_threads -= 1
     
@@ -107,48 +264,54 @@ class ThreadProcessor:
         recursive: bool = True
     ) -> List[ThreadResult]:
         """스레드를 사용한 디렉토리 처리"""
-        path = Path(directory)
-        
-        if recursive:
-            files = list(path.rglob(pattern))
-        else:
-            files = list(path.glob(pattern))
-        
-        # 파일만 필터링
-        files = [f for f in files if f.is_file()]
-        print(f"📁 {len(files)}개 파일 발견")
-        
         if processor is None:
             processor = self._default_processor
         
-        # 작업 큐에 파일 추가
-        for file_path in files:
-            self.task_queue.put(str(file_path))
-        
-        # 워커 스레드 시작
+        # 워커를 먼저 띄워 디렉토리 순회 중에도 처리가 시작되도록 함
         threads = []
-        for i in range(min(self.max_workers, len(files))):
+        for i in range(self.max_workers):
             t = threading.Thread(target=self.worker, args=(processor,))
             t.start()
             threads.append(t)
         
-        # 진행 상황 모니터링
-        total_files = len(files)
-        while not self.task_queue.empty() or self.active_threads > 0:
-            processed = len(self.results)
-            remaining = self.task_queue.qsize()
-            
-            print(f"\r진행: {processed}/{total_files} | "
-                  f"대기: {remaining} | "
+        # 작업 큐에 파일 추가 (찾는 즉시)
+        total_files = 0
+        try:
+            for file_path in _iter_files(directory, pattern, recursive):
+                self.task_queue.put(file_path)
+                total_files += 1
+        finally:
+            # 워커마다 종료 신호 하나씩 (순회 중 예외나 Ctrl+C가 나도 워커가 멈춰 있지 않도록)
+            for _ in threads:
+                self.task_queue.put(_SENTINEL)
+        print(f"📁 {total_files}개 파일 발견")
+        
+        # 진행 상황 출력은 별도 데몬 스레드에서 (메인 스레드는 폴링하지 않음)
+        done = Event()
+        
+        def print_progress():
+            print(f"\r진행: {len(self.results)}/{total_files} | "
+                  f"대기: {self.task_queue.qsize()} | "
                   f"활성 스레드: {self.active_threads}", end='')
-            
-            time.sleep(0.1)
         
-        # 스레드 종료
-        self.stop_event.set()
+        def report_progress():
+            while not done.wait(0.25):
+                print_progress()
+        
+        progress_thread = threading.Thread(target=report_progress, daemon=True)
+        progress_thread.start()
+        
+        # 모든 task_done() 호출이 끝날 때까지 블로킹 대기
+        self.task_queue.join()
+        done.set()
+        progress_thread.join()
+        
+        # 스레드 종료 대기
         for t in threads:
             t.join()
         
+        print_progress()
+        
         print()  # 줄바꿈
         return self.results
     
@@ -160,95 +323,116 @@ class ThreadProcessor:
         recursive: bool = True
     ) -> List[ThreadResult]:
         """ThreadPoolExecutor를 사용한 디렉토리 처리"""
-        path = Path(directory)
-        
-        if recursive:
-            files = list(path.rglob(pattern))
-        else:
-            files = list(path.glob(pattern))
-        
-        # 파일만 필터링
-        files = [f for f in files if f.is_file()]
-        print(f"📁 {len(files)}개 파일 발견")
-        
         if processor is None:
             processor = self._default_processor
         
         results = []
         
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # 작업 제출
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=_pin_to_core,
+            initargs=(self.pin_core,)
+        ) as executor:
+            # 작업 제출 (디렉토리 순회와 동시에 워커가 처리 시작)
             future_to_file = {
-                executor.submit(self.process_file, str(f), processor): f
-                for f in files
+                executor.submit(self.process_file, file_path, processor): file_path
+                for file_path in _iter_files(directory, pattern, recursive)
             }
+            total_files = len(future_to_file)
+            print(f"📁 {total_files}개 파일 발견")
             
-            # 완료된 작업 처리
+            # 완료된 작업 처리 (성공/실패는 누적 카운터로 O(1) 갱신)
             completed = 0
+            success_count = 0
+            fail_count = 0
             for future in concurrent.futures.as_completed(future_to_file):
                 completed += 1
                 result = future.result()
                 results.append(result)
                 
+                if result.success:
+                    success_count += 1
+                else:
+                    fail_count += 1
+                
                 # 진행 상황 출력
-                success_count = sum(1 for r in results if r.success)
-                print(f"\r진행: {completed}/{len(files)} | "
+                print(f"\r진행: {completed}/{total_files} | "
                       f"성공: {success_count} | "
-                      f"실패: {completed - success_count}", end='')
+                      f"실패: {fail_count}", end='')
         
         print()  # 줄바꿈
         self.results.extend(results)
         return results
     
-    def _default_processor(self, content: str) -> dict:
-        """기본 처리기"""
-        return {
-            "size": len(content),
-            "lines": content.count('\n'),
-            "words": len(content.split()),
-            "hash": hashlib.md5(content.encode()).hexdigest()
-        }
-    
-    def parallel_map_threaded(
+    def process_directory_processes(
         self,
-        func: Callable[[Any], Any],
-        items: List[Any]
-    ) -> List[Any]:
-        """스레드 기반 병렬 map"""
-        results = [None] * len(items)
-        results_lock = Lock()
+        directory: str,
+        pattern: str = "*",
+        processor: Callable[[str], Any] = None,
+        recursive: bool = True
+    ) -> List[ThreadResult]:
+        """ProcessPoolExecutor를 사용한 디렉토리 처리 (CPU 집약적 처리기용)
         
-        def process_item(index: int, item: Any):
-            result = func(item)
-            with results_lock:
-                results[index] = result
+        프로세스마다 GIL이 따로 있으므로 해시 계산 같은 CPU 작업이 코어 수만큼 확장된다.
+        processor는 pickle 가능한 모듈 레벨 함수여야 한다.
+        """
+        paths = list(_iter_files(directory, pattern, recursive))
+        print(f"📁 {len(paths)}개 파일 발견")
         
-        threads = []
-        for i, item in enumerate(items):
-            t = threading.Thread(target=process_item, args=(i, item))
-            t.start()
-            threads.append(t)
-            
-            # 동시 스레드 수 제한
-            if len(threads) >= self.max_workers:
-                threads[0].join()
-                threads.pop(0)
+        if processor is None:
+            processor = default_processor
         
-        # 남은 스레드 대기
-        for t in threads:
-            t.join()
+        chunksize = max(1, len(paths) // (self.max_workers * 4))
+        
+        # pin_core는 스레드 워커에만 적용 (프로세스를 한 코어에 모으면 병렬 처리가 직렬화된다)
+        with concurrent.futures.ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(executor.map(
+                process_file_worker,
+                paths,
+                [processor] * len(paths),
+                chunksize=chunksize
+            ))
         
+        success_count = sum(1 for r in results if r.success)
+        print(f"✅ 완료: {success_count}/{len(results)} 성공")
+        
+        self.results.extend(results)
         return results
     
+    _default_processor = staticmethod(default_processor)
+    
+    def parallel_map_threaded(
+        self,
+        func: Callable[[Any], Any],
+        items: List[Any]
+    ) -> List[Any]:
+        """스레드 기반 병렬 map (고정 크기 스레드 풀 재사용)"""
+        # 항목마다 스레드를 만들지 않고, max_workers개의 스레드가 작업을 나눠 처리
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(func, items))
+    
     def parallel_map_pool(
         self,
         func: Callable[[Any], Any],
         items: List[Any],
         chunksize: int = 1
     ) -> List[Any]:
-        """ThreadPoolExecutor 기반 병렬 map"""
+        """ThreadPoolExecutor 기반 병렬 map
+        
+        ThreadPoolExecutor.map은 chunksize를 무시하므로 직접 묶어서 제출한다.
+        기본값(1)이면 항목 수에 맞춰 chunksize를 자동으로 정한다.
+        """
+        if chunksize == 1 and len(items) > self.max_workers * 4:
+            chunksize = len(items) // (self.max_workers * 4)
+        
         with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            return list(executor.map(func, items, chunksize=chunksize))
+            if chunksize <= 1:
+                return list(executor.map(func, items))
+            
+            # 묶음 단위로 제출해 작업 큐 락/퓨처 생성 비용을 줄임
+            chunks = [items[i:i + chunksize] for i in range(0, len(items), chunksize)]
+            chunk_results = executor.map(lambda chunk: [func(item) for item in chunk], chunks)
+            return [result for results in chunk_results for result in results]
     
     def producer_consumer_pattern(
         self,
@@ -259,7 +443,8 @@ class ThreadProcessor:
     ) -> List[Any]:
         """생산자-소비자 패턴"""
         work_queue = queue.Queue(maxsize=max_queue_size)
-        results_queue = queue.Queue()
+        results = []
+        results_lock = Lock()
         stop_event = Event()
         
         def producer():
@@ -284,11 +469,13 @@ class ThreadProcessor:
                 
                 try:
                     result = consumer_func(item)
-                    results_queue.put(result)
                 except Exception as e:
-                    results_queue.put({"error": str(e)})
-                finally:
-                    work_queue.task_done()
+                    result = {"error": str(e)}
+                
+                with results_lock:
+                    results.append(result)
+                
+                work_queue.task_done()
         
         # 스레드 시작
         producer_thread = threading.Thread(target=producer)
@@ -306,11 +493,7 @@ class ThreadProcessor:
         for t in consumer_threads:
             t.join()
         
-        # 결과 수집
-        results = []
-        while not results_queue.empty():
-            results.append(results_queue.get())
-        
+        # 모든 소비자가 종료했으므로 결과 리스트를 그대로 반환
         return results
     
     def get_statistics(self) -> dict:
@@ -318,18 +501,18 @@ class ThreadProcessor:
         if not self.results:
             return {"message": "No results available"}
         
-        success_count = sum(1 for r in self.results if r.success)
-        failed_count = len(self.results) - success_count
-        total_duration = sum(r.duration for r in self.results)
-        
-        # 스레드별 통계
-        thread_stats = {}
+        # 전체 통계와 스레드별 통계를 한 번의 순회로 집계
+        success_count = 0
+        total_duration = 0.0
+        thread_stats = defaultdict(lambda: {"count": 0, "duration": 0.0})
         for result in self.results:
-            tid = result.thread_id
-            if tid not in thread_stats:
-                thread_stats[tid] = {"count": 0, "duration": 0}
-            thread_stats[tid]["count"] += 1
-            thread_stats[tid]["duration"] += result.duration
+            success_count += result.success
+            total_duration += result.duration
+            stats = thread_stats[result.thread_id]
+            stats["count"] += 1
+            stats["duration"] += result.duration
+        
+        failed_count = len(self.results) - success_count
         
         return {
             "total_files": len(self.results),
@@ -339,7 +522,7 @@ class ThreadProcessor:
             "average_duration": f"{total_duration / len(self.results):.2f}s",
             "throughput": f"{len(self.results) / total_duration:.2f} files/s",
             "threads_used": len(thread_stats),
-            "thread_statistics": thread_stats
+            "thread_statistics": dict(thread_stats)
         }
     
     def save_results(self, output_file: str = "thread_results.json"):
@@ -351,7 +534,10 @@ class ThreadProcessor:
                     "thread_id": r.thread_id,
                     "file_path": r.file_path,
                     "success": r.success,
-                    "result": str(r.result) if r.result else None,
+                    "result": (
+                        r.result if isinstance(r.result, _JSON_NATIVE_TYPES)
+                        else str(r.result) if r.result is not None else None
+                    ),
                     "error": r.error,
                     "duration": r.duration
                 }
@@ -359,8 +545,24 @@ class ThreadProcessor:
             ]
         }
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # orjson은 UTF-8 바이트를 바로 만들어 준다 (ensure_ascii=False와 동일)
+        # 직렬화를 먼저 끝내야 실패해도 기존 파일이 잘리지 않는다
+        content = None
+        if orjson is not None:
+            try:
+                content = orjson.dumps(
+                    data,
+                    default=str,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                )
+            except TypeError:
+                pass  # 64비트를 넘는 정수 등은 표준 json으로
+        
+        if content is None:
+            content = json.dumps(data, indent=2, ensure_ascii=False, default=str).encode('utf-8')
+        
+        with open(output_file, 'wb') as f:
+            f.write(content)
         
         print(f"💾 결과가 {output_file}에 저장되었습니다.")
 
@@ -0,0 +1,221 @@
+"""
+io_uring 기반 파일 처리기
+스레드 없이 커널 큐 하나로 여러 파일을 한꺼번에 읽는 처리기 (Linux 전용)
+"""
+
+import os
+import threading
+import time
+from typing import List, Optional, Callable, Any, Tuple
+
+from .thread_processor import ThreadResult, default_processor, _decode_text
+from ..utils.file_utils import _iter_files
+
+try:
+    import liburing
+except ImportError:  # liburing 미설치 또는 Linux 이외의 환경
+    liburing = None
+
+
+class UringProcessor:
+    """io_uring 기반 파일 처리기
+    
+    파일마다 스레드를 두는 대신 read 요청을 배치로 제출(SQE)하고
+    완료(CQE)를 한 스레드에서 수거한다. liburing이 없으면 일반 read로 동작한다.
+    """
+    
+    def __init__(self, queue_depth: int = 256, max_batch: int = 64):
+        self.queue_depth = queue_depth
+        self.max_batch = min(max_batch, queue_depth)
+        self.results: List[ThreadResult] = []
+    
+    @property
+    def uring_available(self) -> bool:
+        return liburing is not None
+    
+    def _read_batch_uring(
+        self,
+        ring,
+        paths: List[str]
+    ) -> List[Tuple[Optional[bytes], Optional[str]]]:
+        """파일 묶음을 io_uring으로 읽기 (경로 순서대로 (내용, 에러) 반환)
+        
+        중간에 예외가 나면 준비했거나 제출한 요청의 완료를 모두 수거한 뒤에 fd를 닫는다.
+        커널이 닫힌 fd나 해제된 버퍼에 읽기를 하거나, 다음 배치가 남은 CQE를 받지 않게 하기 위해서다.
+        """
+        outcomes: List[Tuple[Optional[bytes], Optional[str]]] = [(None, None)] * len(paths)
+        fds = {}
+        buffers = {}
+        pending = 0  # 준비했지만 아직 완료를 수거하지 않은 요청 수
+        
+        try:
+            # 파일 열기 + 크기 확인 후 read 요청 준비
+            for index, file_path in enumerate(paths):
+                try:
+                    fd = os.open(file_path, os.O_RDONLY)
+                except OSError as e:
+                    outcomes[index] = (None, str(e))
+                    continue
+                
+                fds[index] = fd
+                size = os.fstat(fd).st_size
+                if size == 0:
+                    outcomes[index] = (b'', None)
+                    continue
+                
+                buffers[index] = bytearray(size)
+                sqe = liburing.io_uring_get_sqe(ring)
+                liburing.io_uring_prep_read(sqe, fd, buffers[index], 0)
+                liburing.io_uring_sqe_set_data64(sqe, index)
+                pending += 1
+            
+            if not buffers:
+                return outcomes
+            
+            # 한 번의 시스템 콜로 배치 제출
+            liburing.io_uring_submit(ring)
+            
+            cqe = liburing.Cqe()
+            for _ in range(len(buffers)):
+                liburing.io_uring_wait_cqe(ring, cqe)
+                entry = cqe[0]
+                index = entry.user_data
+                res = entry.res
+                liburing.io_uring_cqe_seen(ring, entry)
+                pending -= 1
+                
+                buf = buffers[index]
+                if res < 0:
+                    outcomes[index] = (None, os.strerror(-res))
+                    continue
+                
+                # 짧게 읽힌 경우 나머지는 pread로 마저 읽는다
+                while res < len(buf):
+                    chunk = os.pread(fds[index], len(buf) - res, res)
+                    if not chunk:
+                        break
+                    buf[res:res + len(chunk)] = chunk
+                    res += len(chunk)
+                
+                outcomes[index] = (bytes(buf[:res]), None)
+        
+        except BaseException:
+            if pending:
+                self._drain_ring(ring, pending)
+            raise
+        
+        finally:
+            for fd in fds.values():
+                os.close(fd)
+        
+        return outcomes
+    
+    @staticmethod
+    def _drain_ring(ring, pending: int) -> None:
+        """남은 요청을 제출하고 완료를 pending개 모두 수거"""
+        liburing.io_uring_submit(ring)  # 준비만 하고 제출하지 않은 SQE가 있으면 제출
+        
+        cqe = liburing.Cqe()
+        for _ in range(pending):
+            liburing.io_uring_wait_cqe(ring, cqe)
+            liburing.io_uring_cqe_seen(ring, cqe[0])
+    
+    def _read_batch_fallback(
+        self,
+        paths: List[str]
+    ) -> List[Tuple[Optional[bytes], Optional[str]]]:
+        """liburing이 없을 때의 일반 read"""
+        outcomes = []
+        for file_path in paths:
+            try:
+                with open(file_path, 'rb') as f:
+                    outcomes.append((f.read(), None))
+            except OSError as e:
+                outcomes.append((None, str(e)))
+        return outcomes
+    
+    def process_directory(
+        self,
+        directory: str,
+        pattern: str = "*",
+        processor: Callable[[str], Any] = None,
+        recursive: bool = True
+    ) -> List[ThreadResult]:
+        """io_uring 배치 읽기를 사용한 디렉토리 처리"""
+        paths = list(_iter_files(directory, pattern, recursive))
+        print(f"📁 {len(paths)}개 파일 발견")
+        
+        if processor is None:
+            processor = default_processor
+        
+        thread_id = threading.get_ident()
+        results = []
+        success_count = 0
+        ring = None
+        
+        if liburing is not None:
+            ring = liburing.Ring()
+            liburing.io_uring_queue_init(self.queue_depth, ring)
+        
+        try:
+            for i in range(0, len(paths), self.max_batch):
+                batch = paths[i:i + self.max_batch]
+                start_time = time.perf_counter()
+                
+                if ring is not None:
+                    try:
+                        outcomes = self._read_batch_uring(ring, batch)
+                    except OSError:
+                        # 링 상태를 믿을 수 없으므로 닫고 이 배치부터는 일반 read로 읽는다
+                        liburing.io_uring_queue_exit(ring)
+                        ring = None
+                        outcomes = self._read_batch_fallback(batch)
+                else:
+                    outcomes = self._read_batch_fallback(batch)
+                
+                # 읽기 시간은 배치 안의 파일들이 나눠 가진다
+                read_duration = (time.perf_counter() - start_time) / len(batch)
+                
+                for file_path, (content, error) in zip(batch, outcomes):
+                    process_start = time.perf_counter()
+                    
+                    if error is None:
+                        try:
+                            # 기본 처리기는 바이트, 사용자 처리기에는 문자열 전달
+                            if processor is not default_processor:
+                                content = _decode_text(content)
+                            result = processor(content)
+                        except Exception as e:
+                            error = str(e)
+                    
+                    duration = read_duration + time.perf_counter() - process_start
+                    
+                    if error is None:
+                        success_count += 1
+                        results.append(ThreadResult(
+                            thread_id=thread_id,
+                            file_path=file_path,
+                            success=True,
+                            result=result,
+                            duration=duration
+                        ))
+                    else:
+                        results.append(ThreadResult(
+                            thread_id=thread_id,
+                            file_path=file_path,
+                            success=False,
+                            error=error,
+                            duration=duration
+                        ))
+                
+                print(f"\r진행: {len(results)}/{len(paths)} | "
+                      f"성공: {success_count} | "
+                      f"실패: {len(results) - success_count}", end='')
+        
+        finally:
+            if ring is not None:
+                liburing.io_uring_queue_exit(ring)
+        
+        print()  # 줄바꿈
+        self.results.extend(results)
+        return results
@@ -5,17 +5,25 @@
 
 import asyncio
 import aiohttp
+import contextlib
 import time
 from typing import List, Dict, Optional
 from dataclasses import dataclass
 import json
-from bs4 import BeautifulSoup
+from lxml import etree
 
 from ..patterns.rate_limiter import AsyncRateLimiter
 from ..patterns.producer_consumer import AsyncProducerConsumer
 from ..utils.monitoring import PerformanceTracker
 
 
+# 수집할 절대 링크의 스킴 접두사
+_HTTP_PREFIXES = ('http://', 'https://')
+
+# 본문 텍스트로 치지 않는 태그 (BeautifulSoup.get_text()도 이 안의 문자열은 건너뛴다)
+_NON_TEXT_TAGS = frozenset(('script', 'style', 'template'))
+
+
 @dataclass
 class WebPage:
     """웹 페이지 정보"""
@@ -31,13 +39,91 @@ class WebPage:
             self.links = []
 
 
+class _PageCollector:
+    """lxml 파서 타깃 - DOM을 만들지 않고 제목, 링크, 앞부분 텍스트만 수집"""
+    
+    CONTENT_LIMIT = 500
+    
+    def __init__(self):
+        self.title_parts: List[str] = []
+        self.links: List[str] = []
+        self._seen_links = set()  # 페이지 내 중복 링크 제거 (네비게이션 바 등)
+        self.text_parts: List[str] = []
+        self._content_length = 0  # 공백을 제외한 수집 글자 수
+        self._in_title = False
+        self._skip_depth = 0  # 열려 있는 script/style/template 수
+    
+    def start(self, tag, attrib):
+        if tag in _NON_TEXT_TAGS:
+            self._skip_depth += 1
+        elif tag == 'title':
+            self._in_title = True
+        elif tag == 'a':
+            href = attrib.get('href')
+            if href and href.startswith(_HTTP_PREFIXES) and href not in self._seen_links:
+                self._seen_links.add(href)
+                self.links.append(href)
+    
+    def end(self, tag):
+        if tag in _NON_TEXT_TAGS:
+            self._skip_depth -= 1
+        elif tag == 'title':
+            self._in_title = False
+    
+    def data(self, text):
+        if self._skip_depth:
+            return
+        
+        if self._in_title:
+            self.title_parts.append(text)
+        
+        # 본문은 앞 500자만 필요하므로 그 이후 텍스트는 버린다
+        if self._content_length < self.CONTENT_LIMIT:
+            self.text_parts.append(text)
+            self._content_length += len(text) - sum(map(text.count, ' \t\n\r\f\v'))
+    
+    @property
+    def content(self) -> str:
+        return ' '.join(''.join(self.text_parts).split())[:self.CONTENT_LIMIT]
+    
+    def close(self):
+        return self
+
+
 class WebScraperExample:
     """웹 스크래퍼 예제"""
     
-    def __init__(self):
+    def __init__(self, max_concurrent: int = 10):
+        self.max_concurrent = max_concurrent
         self.rate_limiter = AsyncRateLimiter(rate=5, per=1.0)  # 5 requests/second
         self.tracker = PerformanceTracker()
         self.session: Optional[aiohttp.ClientSession] = None
+        self._semaphore = asyncio.Semaphore(max_concurrent)  # 동시 요청 수 제한
+    
+    async def __aenter__(self):
+        """컨텍스트 매니저 진입 - 세션 하나를 모든 요청이 공유"""
+        connector = aiohttp.TCPConnector(limit=self.max_concurrent, limit_per_host=5)
+        self.session = aiohttp.ClientSession(connector=connector)
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """컨텍스트 매니저 종료"""
+        if self.session:
+            await self.session.close()
+            self.session = None
+    
+    @contextlib.asynccontextmanager
+    async def _session_scope(self):
+        """열린 세션이 있으면 그대로 쓰고, 없으면 이 호출 동안만 연다"""
+        if self.session is not None:
+            yield
+            return
+        
+        await self.__aenter__()
+        try:
+            yield
+        finally:
+            await self.__aexit__(None, None, None)
     
     async def fetch_page(self, url: str) -> WebPage:
         """페이지 가져오기"""
@@ -48,27 +134,30 @@ class WebScraperExample:
         start_time = time.time()
         
         try:
-            async with self.tracker.track_async(f"Fetch {url}"):
+            async with self._semaphore, self.tracker.track_async(f"Fetch {url}"):
                 async with self.session.get(url, timeout=10) as response:
                     if response.status == 200:
-                        html = await response.text()
+                        # 받는 즉시 lxml 타깃 파서에 넣어 네트워크 I/O와 파싱을 겹친다
+                        collector = _PageCollector()
+                        parser = etree.HTMLParser(target=collector)
+                        
+                        async for chunk in response.content.iter_chunked(65536):
+                            parser.feed(chunk)
                         
-                        # BeautifulSoup으로 파싱
-                        soup = BeautifulSoup(html, 'html.parser')
+                        try:
+                            parser.close()
+                        except etree.XMLSyntaxError:
+                            pass  # 빈 문서
                         
                         # 제목 추출
-                        title_tag = soup.find('title')
-                        page.title = title_tag.text.strip() if title_tag else "No Title"
+                        title = ''.join(collector.title_parts).strip()
+                        page.title = title or "No Title"
                         
                         # 본문 추출 (첫 500자)
-                        text = soup.get_text()
-                        page.content = ' '.join(text.split())[:500]
+                        page.content = collector.content
                         
                         # 링크 추출
-                        for link in soup.find_all('a', href=True):
-                            href = link['href']
-                            if href.startswith('http'):
-                                page.links.append(href)
+                        page.links = collector.links
                         
                         page.fetch_time = time.time() - start_time
                     else:
@@ -82,141 +171,137 @@ class WebScraperExample:
         return page
     
     async def scrape_urls(self, urls: List[str]) -> List[WebPage]:
-        """여러 URL 스크래핑"""
-        self.session = aiohttp.ClientSession()
+        """여러 URL 스크래핑 (async with 밖에서 부르면 임시 세션 사용)"""
+        # 생산자-소비자 패턴 사용
+        pc = AsyncProducerConsumer[str, WebPage](
+            max_queue_size=20,
+            num_consumers=5
+        )
         
-        try:
-            # 생산자-소비자 패턴 사용
-            pc = AsyncProducerConsumer[str, WebPage](
-                max_queue_size=20,
-                num_consumers=5
-            )
-            
-            # URL 생성기
-            async def url_generator():
-                for url in urls:
-                    yield url
-            
-            # 페이지 처리 함수
-            async def process_url(url: str) -> WebPage:
-                return await self.fetch_page(url)
-            
-            # 실행
+        # URL 생성기
+        async def url_generator():
+            for url in urls:
+                yield url
+        
+        # 페이지 처리 함수
+        async def process_url(url: str) -> WebPage:
+            return await self.fetch_page(url)
+        
+        # 실행
+        async with self._session_scope():
             results = await pc.run(
                 source=url_generator(),
                 processor=process_url
             )
-            
-            # 결과 추출
-            pages = []
-            for result in results:
-                if "result" in result and result["result"]:
-                    pages.append(result["result"])
-            
-            return pages
         
-        finally:
-            await self.session.close()
+        # 결과 추출
+        pages = []
+        for result in results:
+            if "result" in result and result["result"]:
+                pages.append(result["result"])
+        
+        return pages
     
     async def crawl_recursive(self, start_url: str, max_depth: int = 2, max_pages: int = 20) -> Dict[str, WebPage]:
-        """재귀적 크롤링"""
+        """재귀적 크롤링 (깊이별 BFS)"""
         visited = set()
-        to_visit = {(start_url, 0)}  # (url, depth)
+        frontier = {start_url}  # 현재 깊이에서 방문할 URL
         pages = {}
+        depth = 0
         
-        self.session = aiohttp.ClientSession()
+        # 한 번에 제출하는 URL 수 제한
+        batch_size = self.max_concurrent * 2
         
-        try:
-            while to_visit and len(pages) < max_pages:
-                # 현재 레벨의 URL들
-                current_batch = []
-                current_depth = None
-                
+        # 모든 깊이가 세션 하나를 공유
+        async with self._session_scope():
+            while frontier and len(pages) < max_pages:
                 # 같은 깊이의 URL들 배치 처리
-                for url, depth in list(to_visit):
-                    if current_depth is None:
-                        current_depth = depth
-                    
-                    if depth == current_depth and url not in visited:
-                        current_batch.append(url)
-                        to_visit.remove((url, depth))
-                        visited.add(url)
+                current_batch = list(frontier - visited)
+                visited |= frontier
+                next_frontier = set()
                 
                 if not current_batch:
                     break
                 
-                print(f"\n깊이 {current_depth}: {len(current_batch)}개 페이지 크롤링")
+                print(f"\n깊이 {depth}: {len(current_batch)}개 페이지 크롤링")
                 
-                # 배치 처리
-                batch_pages = await self.scrape_urls(current_batch)
+                for i in range(0, len(current_batch), batch_size):
+                    if len(pages) >= max_pages:
+                        break
+                    
+                    # 배치 처리
+                    batch_pages = await self.scrape_urls(current_batch[i:i + batch_size])
+                    
+                    # 결과 저장 및 새 링크 추가
+                    for page in batch_pages:
+                        if not page.error:
+                            pages[page.url] = page
+                            
+                            # 다음 깊이 링크 추가
+                            if depth < max_depth - 1:
+                                next_frontier.update(
+                                    link for link in page.links[:5]  # 각 페이지당 최대 5개 링크
+                                    if link not in visited
+                                )
                 
-                # 결과 저장 및 새 링크 추가
-                for page in batch_pages:
-                    if not page.error:
-                        pages[page.url] = page
-                        
-                        # 다음 깊이 링크 추가
-                        if current_depth < max_depth - 1:
-                            for link in page.links[:5]:  # 각 페이지당 최대 5개 링크
-                                if link not in visited:
-                                    to_visit.add((link, current_depth + 1))
-            
-            return pages
+                frontier = next_frontier
+                depth += 1
         
-        finally:
-            await self.session.close()
+        return pages
     
     async def run(self):
         """예제 실행"""
         print("🌐 웹 스크래핑 예제")
         print("=" * 60)
         
-        # 1. 단순 스크래핑
-        print("\n1. 여러 페이지 동시 스크래핑")
-        
-        urls = [
-            "https://example.com",
-            "https://httpbin.org/html",
-            "https://httpbin.org/delay/1",
-            "https://httpbin.org/status/200",
-            "https://httpbin.org/json"
-        ]
-        
-        start_time = time.time()
-        pages = await self.scrape_urls(urls)
-        duration = time.time() - start_time
-        
-        print(f"\n✅ {len(pages)}개 페이지 스크래핑 완료 ({duration:.2f}초)")
-        
-        for page in pages:
-            if page.error:
-                print(f"  ❌ {page.url}: {page.error}")
-            else:
-                print(f"  ✅ {page.url}: {page.title} ({page.fetch_time:.2f}초)")
-        
-        # 2. 재귀적 크롤링 (시뮬레이션)
-        print("\n\n2. 재귀적 웹 크롤링 (example.com 기준)")
-        
-        crawled_pages = await self.crawl_recursive(
-            "https://example.com",
-            max_depth=2,
-            max_pages=10
-        )
-        
-        print(f"\n✅ 총 {len(crawled_pages)}개 페이지 크롤링")
-        
-        # 깊이별 통계
-        depth_stats = {}
-        for url, page in crawled_pages.items():
-            # URL 기반으로 깊이 추정 (실제로는 크롤링 중 추적)
-            depth = 0 if url == "https://example.com" else 1
-            if depth not in depth_stats:
-                depth_stats[depth] = 0
-            depth_stats[depth] += 1
-        
-        print("\n📊 깊이별 페이지 수:")
-        for depth, count in sorted(depth_stats.items()):
-            print(f"  깊이 {depth}: {count}개")
+        # 세션 하나로 모든 요청 처리
+        async with self:
+            # 1. 단순 스크래핑
+            print("\n1. 여러 페이지 동시 스크래핑")
+            
+            urls = [
+                "https://example.com",
+                "https://httpbin.org/html",
+                "https://httpbin.org/delay/1",
+                "https://httpbin.org/status/200",
+                "https://httpbin.org/json"
+            ]
+            
+            start_time = time.time()
+            pages = await self.scrape_urls(urls)
+            duration = time.time() - start_time
+            
+            print(f"\n✅ {len(pages)}개 페이지 스크래핑 완료 ({duration:.2f}초)")
+            
+            for page in pages:
+                if page.error:
+                    print(f"  ❌ {page.url}: {page.error}")
+                else:
+                    print(f"  ✅ {page.url}: {page.title} ({page.fetch_time:.2f}초)")
+            
+            # 2. 재귀적 크롤링 (시뮬레이션)
+            print("\n\n2. 재귀적 웹 크롤링 (example.com 기준)")
+            
+            crawled_pages = await self.crawl_recursive(
+                "https://example.com",
+                max_depth=2,
+                max_pages=10
+            )
+            
+            print(f"\n✅ 총 {len(crawled_pages)}개 페이지 크롤링")
+            
+            # 깊이별 통계
+            depth_stats = {}
+            for url, page in crawled_pages.items():
+                # URL 기반으로 깊이 추정 (실제로는 크롤링 중 추적)
+                depth = 0 if url == "https://example.com" else 1
+                if depth not in depth_stats:
+                    depth_stats[depth] = 0
+                depth_stats[depth] += 1
+            
+            print("\n📊 깊이별 페이지 수:")
+            for depth, count in sorted(depth_stats.items()):
+                print(f"  깊이 {depth}: {count}개")
         
         # 3. 성능 통계
         print("\n\n3. 성능 통계")
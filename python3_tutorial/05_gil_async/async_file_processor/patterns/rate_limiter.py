@@ -3,17 +3,26 @@
 API 호출이나 리소스 접근을 제한하는 패턴
 """
 
+import array
 import asyncio
+import bisect
 import time
 import threading
-from typing import Optional, Callable, Any
+from typing import Optional, Callable, Any, Deque
 from dataclasses import dataclass, field
 from collections import deque
 import functools
 
 
 class TokenBucket:
-    """토큰 버킷 알고리즘 구현"""
+    """토큰 버킷 알고리즘 구현
+    
+    시간은 time.monotonic()(NTP 보정 영향 없음)의 초 단위로 잰다.
+    C 확장(_token_bucket.pyx)과 같은 단위와 같은 쓰기 가능한 속성을 쓴다.
+    """
+    
+    # 전역 time 모듈 대신 클래스 속성으로 시계 조회
+    _monotonic = staticmethod(time.monotonic)
     
     def __init__(self, capacity: int, refill_rate: float):
         """
@@ -24,17 +33,16 @@ class TokenBucket:
         self.capacity = capacity
         self.refill_rate = refill_rate
         self.tokens = capacity
-        self.last_refill = time.time()
+        self.last_refill = self._monotonic()
         self.lock = threading.Lock()
     
     def _refill(self):
         """토큰 충전"""
-        now = time.time()
-        elapsed = now - self.last_refill
+        now = self._monotonic()
         
         # 경과 시간만큼 토큰 추가
-        tokens_to_add = elapsed * self.refill_rate
-        self.tokens = min(self.capacity, self.tokens + tokens_to_add)
+        tokens = self.tokens + (now - self.last_refill) * self.refill_rate
+        self.tokens = tokens if tokens < self.capacity else self.capacity
         self.last_refill = now
     
     def consume(self, tokens: int = 1) -> bool:
@@ -56,14 +64,22 @@ class TokenBucket:
                 return 0
             
             # 필요한 토큰까지 대기 시간 계산
-            needed = tokens - self.tokens
-            wait_time = needed / self.refill_rate
-            return wait_time
+            return (tokens - self.tokens) / self.refill_rate
+
+
+# C 확장(_token_bucket.pyx)이 빌드되어 있으면 같은 API의 구현으로 교체
+try:
+    from ._token_bucket import TokenBucket
+except ImportError:
+    pass
 
 
 class RateLimiter:
     """동기 속도 제한기"""
     
+    # 통계는 dict 대신 속성 카운터로 보관 (get_statistics에서만 dict 생성)
+    __slots__ = ('rate', 'per', 'token_bucket', '_allowed', '_rejected', '_wait')
+    
     def __init__(self, rate: int, per: float = 1.0):
         """
         Args:
@@ -73,20 +89,18 @@ class RateLimiter:
         self.rate = rate
         self.per = per
         self.token_bucket = TokenBucket(rate, rate / per)
-        self.stats = {
-            "allowed": 0,
-            "rejected": 0,
-            "total_wait_time": 0
-        }
+        self._allowed = 0
+        self._rejected = 0
+        self._wait = 0
     
     def allow(self) -> bool:
         """요청 허용 여부"""
         allowed = self.token_bucket.consume()
         
         if allowed:
-            self.stats["allowed"] += 1
+            self._allowed += 1
         else:
-            self.stats["rejected"] += 1
+            self._rejected += 1
         
         return allowed
     
@@ -95,11 +109,11 @@ class RateLimiter:
         wait_time = self.token_bucket.wait_for_tokens()
         
         if wait_time > 0:
-            self.stats["total_wait_time"] += wait_time
+            self._wait += wait_time
             time.sleep(wait_time)
             self.token_bucket.consume()
         
-        self.stats["allowed"] += 1
+        self._allowed += 1
     
     def __call__(self, func: Callable) -> Callable:
         """데코레이터로 사용"""
@@ -111,16 +125,16 @@ class RateLimiter:
     
     def get_statistics(self) -> dict:
         """통계 반환"""
-        total = self.stats["allowed"] + self.stats["rejected"]
+        total = self._allowed + self._rejected
         
         return {
-            "allowed": self.stats["allowed"],
-            "rejected": self.stats["rejected"],
+            "allowed": self._allowed,
+            "rejected": self._rejected,
             "total": total,
             "rejection_rate": (
-                self.stats["rejected"] / total * 100 if total > 0 else 0
+                self._rejected / total * 100 if total > 0 else 0
             ),
-            "total_wait_time": self.stats["total_wait_time"],
+            "total_wait_time": self._wait,
             "current_tokens": self.token_bucket.tokens
         }
 
@@ -128,6 +142,14 @@ class RateLimiter:
 class AsyncRateLimiter:
     """비동기 속도 제한기"""
     
+    # 전역 time 모듈 대신 클래스 속성으로 시계 조회
+    _monotonic = staticmethod(time.monotonic)
+    
+    __slots__ = (
+        'rate', 'per', 'burst', '_size', 'calls', '_head', '_tail', 'lock',
+        '_waiters', '_wakeup_task', '_allowed', '_rejected', '_wait'
+    )
+    
     def __init__(self, rate: int, per: float = 1.0, burst: Optional[int] = None):
         """
         Args:
@@ -139,58 +161,108 @@ class AsyncRateLimiter:
         self.per = per
         self.burst = burst or rate
         
-        # 슬라이딩 윈도우 방식
-        self.calls = deque()
+        # 슬라이딩 윈도우 방식 (고정 크기 링 버퍼, 단조 시계 기준)
+        # _head/_tail은 계속 증가하는 논리 인덱스, 실제 위치는 % _size
+        self._size = max(self.rate, self.burst, 1)
+        self.calls = array.array('d', [0.0]) * self._size
+        self._head = 0
+        self._tail = 0
         self.lock = asyncio.Lock()
         
-        self.stats = {
-            "allowed": 0,
-            "rejected": 0,
-            "total_wait_time": 0
-        }
-    
-    async def _clean_old_calls(self):
-        """오래된 호출 기록 정리"""
-        now = time.time()
+        # acquire 대기자 (Future) 와 이들을 깨우는 태스크
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._wakeup_task: Optional[asyncio.Task] = None
+        
+        self._allowed = 0
+        self._rejected = 0
+        self._wait = 0
+    
+    def _clean(self, now: float):
+        """오래된 호출 기록 정리 (I/O가 없으므로 코루틴이 아님)"""
+        head, tail = self._head, self._tail
+        if head == tail:
+            return
+        
+        calls, size = self.calls, self._size
         cutoff = now - self.per
+        if calls[head % size] >= cutoff:
+            return
         
-        while self.calls and self.calls[0] < cutoff:
-            self.calls.popleft()
+        # 기록은 시간 순으로 쌓이므로 만료 경계를 이진 탐색으로 찾는다
+        self._head = bisect.bisect_left(
+            range(head, tail), cutoff, key=lambda i: calls[i % size]
+        ) + head
+    
+    def _record_call(self, now: float):
+        """호출 기록 추가"""
+        self.calls[self._tail % self._size] = now
+        self._tail += 1
     
     async def allow(self) -> bool:
         """요청 허용 여부 (논블로킹)"""
         async with self.lock:
-            await self._clean_old_calls()
+            now = self._monotonic()
+            self._clean(now)
             
-            if len(self.calls) < self.rate:
-                self.calls.append(time.time())
-                self.stats["allowed"] += 1
+            if not self._waiters and self._tail - self._head < self.rate:
+                self._record_call(now)
+                self._allowed += 1
                 return True
             else:
-                self.stats["rejected"] += 1
+                self._rejected += 1
                 return False
     
     async def acquire(self):
-        """토큰 획득 (블로킹)"""
-        while True:
+        """토큰 획득 (블로킹)
+        
+        바로 쓸 수 있는 토큰이 없으면 Future를 대기열에 넣고 기다린다.
+        깨우기 태스크 하나가 토큰이 생길 때마다 먼저 온 대기자부터 깨운다.
+        """
+        async with self.lock:
+            now = self._monotonic()
+            self._clean(now)
+            
+            # 대기자가 있으면 새 요청이 앞지르지 않도록 줄을 선다
+            if not self._waiters and self._tail - self._head < self.rate:
+                self._record_call(now)
+                self._allowed += 1
+                return
+            
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            
+            if self._wakeup_task is None or self._wakeup_task.done():
+                self._wakeup_task = asyncio.create_task(self._wake_waiters())
+        
+        start = self._monotonic()
+        await waiter
+        self._wait += self._monotonic() - start
+    
+    async def _wake_waiters(self):
+        """토큰이 생길 때마다 대기자를 순서대로 깨우는 백그라운드 태스크"""
+        while self._waiters:
+            wait_time = 0
+            
             async with self.lock:
-                await self._clean_old_calls()
-                
-                if len(self.calls) < self.rate:
-                    self.calls.append(time.time())
-                    self.stats["allowed"] += 1
-                    return
+                now = self._monotonic()
+                self._clean(now)
                 
-                # 다음 토큰이 사용 가능할 때까지 대기
-                if self.calls:
-                    oldest = self.calls[0]
-                    wait_time = oldest + self.per - time.time()
+                # 토큰을 대기자 몫으로 기록한 뒤 깨운다
+                while self._waiters and self._tail - self._head < self.rate:
+                    waiter = self._waiters.popleft()
+                    if waiter.done():  # 취소된 대기자
+                        continue
                     
-                    if wait_time > 0:
-                        self.stats["total_wait_time"] += wait_time
+                    self._record_call(now)
+                    self._allowed += 1
+                    waiter.set_result(None)
+                
+                # 가장 오래된 호출이 만료될 때까지 대기
+                if self._waiters and self._tail > self._head:
+                    oldest = self.calls[self._head % self._size]
+                    wait_time = oldest + self.per - now
             
-            if wait_time > 0:
-                await asyncio.sleep(wait_time)
+            await asyncio.sleep(max(0, wait_time))
     
     def __call__(self, func: Callable) -> Callable:
         """비동기 데코레이터로 사용"""
@@ -203,26 +275,32 @@ class AsyncRateLimiter:
     async def get_statistics(self) -> dict:
         """통계 반환"""
         async with self.lock:
-            await self._clean_old_calls()
+            self._clean(self._monotonic())
             
-            total = self.stats["allowed"] + self.stats["rejected"]
-            current_rate = len(self.calls)
+            total = self._allowed + self._rejected
+            current_rate = self._tail - self._head
             
             return {
-                "allowed": self.stats["allowed"],
-                "rejected": self.stats["rejected"],
+                "allowed": self._allowed,
+                "rejected": self._rejected,
                 "total": total,
                 "rejection_rate": (
-                    self.stats["rejected"] / total * 100 if total > 0 else 0
+                    self._rejected / total * 100 if total > 0 else 0
                 ),
-                "total_wait_time": self.stats["total_wait_time"],
+                "total_wait_time": self._wait,
                 "current_rate": current_rate,
                 "available": self.rate - current_rate
             }
 
 
 class LeakyBucket:
-    """Leaky Bucket 알고리즘"""
+    """Leaky Bucket 알고리즘
+    
+    상태 갱신 중에 await가 없으므로 이벤트 루프 안에서 원자적으로 실행된다.
+    그래서 asyncio.Lock 없이 동작한다 (같은 루프의 코루틴 간 공유 전제).
+    """
+    
+    __slots__ = ('capacity', 'leak_rate', 'water_level', 'last_leak')
     
     def __init__(self, capacity: int, leak_rate: float):
         """
@@ -233,12 +311,11 @@ class LeakyBucket:
         self.capacity = capacity
         self.leak_rate = leak_rate
         self.water_level = 0
-        self.last_leak = time.time()
-        self.lock = asyncio.Lock()
+        self.last_leak = time.monotonic()
     
-    async def _leak(self):
+    def _leak(self):
         """물 누출 처리"""
-        now = time.time()
+        now = time.monotonic()
         elapsed = now - self.last_leak
         
         # 경과 시간만큼 물 누출
@@ -248,26 +325,24 @@ class LeakyBucket:
     
     async def add(self, amount: float = 1.0) -> bool:
         """물 추가 (요청 처리)"""
-        async with self.lock:
-            await self._leak()
-            
-            if self.water_level + amount <= self.capacity:
-                self.water_level += amount
-                return True
-            return False
+        self._leak()
+        
+        if self.water_level + amount <= self.capacity:
+            self.water_level += amount
+            return True
+        return False
     
     async def wait_time(self, amount: float = 1.0) -> float:
         """추가 가능할 때까지 대기 시간"""
-        async with self.lock:
-            await self._leak()
-            
-            if self.water_level + amount <= self.capacity:
-                return 0
-            
-            # 필요한 공간이 생길 때까지 대기 시간
-            overflow = (self.water_level + amount) - self.capacity
-            wait_time = overflow / self.leak_rate
-            return wait_time
+        self._leak()
+        
+        if self.water_level + amount <= self.capacity:
+            return 0
+        
+        # 필요한 공간이 생길 때까지 대기 시간
+        overflow = (self.water_level + amount) - self.capacity
+        wait_time = overflow / self.leak_rate
+        return wait_time
 
 
 async def example_rate_limiting():
@@ -4,17 +4,101 @@
 """
 
 import os
+import fnmatch
 import shutil
 from pathlib import Path
-from typing import List, Optional, Generator, Tuple
+from typing import List, Optional, Generator, Tuple, Iterator
 import hashlib
 import mimetypes
+import mmap
 import json
 import csv
+import operator
+import math
+import re
 import asyncio
+import time
 import aiofiles
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    orjson = None
+
+try:
+    import xxhash
+except ImportError:  # xxhash 미설치 시 md5 사용
+    xxhash = None
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:  # watchdog 미설치 시 폴링으로 감시
+    Observer = None
+
+
+# 음수 19자리/20자리 이상 숫자열: orjson이 i64/u64 범위를 넘는 정수를 float로 읽어 버릴 수 있는 입력
+_LONG_DIGITS_RE = re.compile(rb'-\d{19}|\d{20}')
+
+
+def _has_non_finite(obj) -> bool:
+    """NaN/Infinity float가 들어 있는지 확인 (orjson은 이를 null로 바꿔 쓰므로)"""
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(map(_has_non_finite, obj.values()))
+    if isinstance(obj, (list, tuple)):
+        return any(map(_has_non_finite, obj))
+    return False
+
+
+def _scan_files(directory: str, recursive: bool = True) -> Iterator[os.DirEntry]:
+    """os.scandir 기반 파일 순회 (디렉토리 심볼릭 링크는 따라가지 않음)
+    
+    is_dir/is_file은 getdents의 d_type을 쓰므로 대부분 추가 stat 호출이 없다.
+    """
+    try:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    except OSError:
+        return
+    
+    for entry in entries:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                if recursive:
+                    yield from _scan_files(entry.path, recursive)
+            elif entry.is_file():
+                yield entry
+        except OSError:
+            continue
+
+
+def _match_files(directory: str, pattern: str, recursive: bool = True) -> Iterator:
+    """패턴에 맞는 파일 순회 (Path.rglob/glob과 같은 의미)
+    
+    파일 이름만 보는 패턴은 _scan_files의 DirEntry로 거르고, 경로 구분자나 '**'가
+    들어 있는 패턴은 이름만으로 판단할 수 없으므로 pathlib에 맡긴다.
+    어느 쪽이든 name, stat(), os.fspath()를 쓸 수 있는 객체를 내보낸다.
+    """
+    if '/' in pattern or os.sep in pattern or '**' in pattern:
+        path = Path(directory)
+        for match in (path.rglob(pattern) if recursive else path.glob(pattern)):
+            if match.is_file():
+                yield match
+        return
+    
+    for entry in _scan_files(directory, recursive):
+        if fnmatch.fnmatch(entry.name, pattern):
+            yield entry
+
+
+def _iter_files(directory: str, pattern: str = "*", recursive: bool = True) -> Iterator[str]:
+    """_match_files와 같은 파일을 경로 문자열로 순회 (처리기 워커에 넘기는 용도)"""
+    return map(os.fspath, _match_files(directory, pattern, recursive))
+
 
 class FileUtils:
     """파일 관련 유틸리티"""
@@ -52,16 +136,69 @@ class FileUtils:
         return f"{size:.2f} PB"
     
     @staticmethod
-    def calculate_checksum(file_path: str, algorithm: str = 'md5') -> str:
-        """파일 체크섬 계산"""
-        hash_func = getattr(hashlib, algorithm)()
+    def calculate_checksum(
+        file_path: str,
+        algorithm: str = 'md5',
+        chunk_size: int = 1 << 20  # 1MB
+    ) -> str:
+        """파일 체크섬 계산
+        
+        해시 계산은 OpenSSL이 담당하므로 sha1/sha256은 SHA-NI(x86),
+        ARMv8 암호화 확장이 있는 CPU에서 하드웨어 가속된다.
+        """
+        hash_func = hashlib.new(algorithm)
         
         with open(file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(8192), b''):
-                hash_func.update(chunk)
+            try:
+                # 파일 전체를 매핑해 update 한 번으로 해시 (복사/루프 없음)
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    hash_func.update(mm)
+            except (ValueError, OSError):
+                # 빈 파일이나 mmap 불가능한 파일
+                if hasattr(hashlib, 'file_digest'):
+                    # 재사용 버퍼에 readinto 하는 C 구현 (Python 3.11+)
+                    return hashlib.file_digest(f, algorithm).hexdigest()
+                
+                while chunk := f.read(chunk_size):
+                    hash_func.update(chunk)
         
         return hash_func.hexdigest()
     
+    @staticmethod
+    def calculate_checksum_parallel(
+        file_path: str,
+        algorithm: str = 'sha256',
+        shards: int = 8
+    ) -> str:
+        """병렬 파일 체크섬 계산 (트리 해시)
+        
+        파일을 shards개 구간으로 나눠 스레드마다 해시한 뒤(hashlib은 GIL을 놓는다)
+        구간 다이제스트를 이어 붙여 다시 해시한다. 결과는 calculate_checksum의
+        값과 다르고 shards에 따라서도 달라지므로, 같은 shards로 만든 값끼리만
+        비교해야 한다.
+        """
+        workers = min(shards, os.cpu_count() or 1)
+        
+        with open(file_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return hashlib.new(algorithm, hashlib.new(algorithm).digest()).hexdigest()
+            
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                view = memoryview(mm)
+                step = -(-size // shards)
+                
+                def hash_shard(start: int) -> bytes:
+                    return hashlib.new(algorithm, view[start:start + step]).digest()
+                
+                try:
+                    with ThreadPoolExecutor(max_workers=workers) as executor:
+                        digests = list(executor.map(hash_shard, range(0, size, step)))
+                finally:
+                    view.release()
+        
+        return hashlib.new(algorithm, b''.join(digests)).hexdigest()
+    
     @staticmethod
     async def calculate_checksum_async(file_path: str, algorithm: str = 'md5') -> str:
         """비동기 파일 체크섬 계산"""
@@ -83,30 +220,27 @@ class FileUtils:
         extensions: Optional[List[str]] = None
     ) -> List[Path]:
         """조건에 맞는 파일 찾기"""
-        path = Path(directory)
-        
-        if recursive:
-            files = path.rglob(pattern)
-        else:
-            files = path.glob(pattern)
+        # 필터 조건은 루프 밖에서 한 번만 준비
+        ext_set = frozenset(e.lower() for e in extensions) if extensions else None
+        check_min = min_size is not None
+        check_max = max_size is not None
+        check_size = check_min or check_max
         
         result = []
-        for file in files:
-            if not file.is_file():
-                continue
-            
-            # 크기 필터
-            size = file.stat().st_size
-            if min_size and size < min_size:
-                continue
-            if max_size and size > max_size:
-                continue
-            
+        for entry in _match_files(directory, pattern, recursive):
             # 확장자 필터
-            if extensions and file.suffix.lower() not in extensions:
+            if ext_set is not None and os.path.splitext(entry.name)[1].lower() not in ext_set:
                 continue
             
-            result.append(file)
+            # 크기 필터 (필요할 때만 stat, DirEntry.stat()은 결과를 캐시한다)
+            if check_size:
+                size = entry.stat().st_size
+                if check_min and size < min_size:
+                    continue
+                if check_max and size > max_size:
+                    continue
+            
+            result.append(Path(entry))
         
         return result
     
@@ -149,13 +283,36 @@ class FileUtils:
         output_file: str
     ) -> str:
         """분할된 파일 병합"""
+        # split_file이 만든 .part000 형식은 0 패딩이라 사전순 정렬이 곧 순서
         with open(output_file, 'wb') as output:
             for chunk_file in sorted(chunk_files):
                 with open(chunk_file, 'rb') as chunk:
-                    output.write(chunk.read())
+                    FileUtils._copy_file_object(chunk, output)
         
         return output_file
     
+    @staticmethod
+    def _copy_file_object(src, dst, length: int = 1 << 20) -> None:
+        """파일 객체 복사 (가능하면 sendfile로 커널 안에서 복사)"""
+        size = os.fstat(src.fileno()).st_size
+        
+        if hasattr(os, 'sendfile') and size > 0:
+            dst.flush()
+            offset = 0
+            try:
+                while offset < size:
+                    sent = os.sendfile(dst.fileno(), src.fileno(), offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+                return
+            except OSError:
+                # sendfile을 지원하지 않는 조합이면 이어서 일반 복사
+                src.seek(offset)
+                dst.seek(0, os.SEEK_END)
+        
+        shutil.copyfileobj(src, dst, length)
+    
     @staticmethod
     async def stream_large_file(
         file_path: str,
@@ -167,8 +324,17 @@ class FileUtils:
                 yield chunk
     
     @staticmethod
-    def compare_files(file1: str, file2: str) -> dict:
-        """두 파일 비교"""
+    def compare_files(
+        file1: str,
+        file2: str,
+        include_hash: bool = False,
+        fast: bool = True
+    ) -> dict:
+        """두 파일 비교
+        
+        include_hash=True면 체크섬도 함께 반환한다. fast=True이고 xxhash가 있으면
+        md5 대신 비암호화 해시 xxh3_128을 쓴다 (동일성 확인 용도로 충분).
+        """
         path1 = Path(file1)
         path2 = Path(file2)
         
@@ -187,16 +353,52 @@ class FileUtils:
                 "size2": size2
             }
         
-        # 내용 비교 (체크섬)
-        hash1 = FileUtils.calculate_checksum(file1)
-        hash2 = FileUtils.calculate_checksum(file2)
-        
-        return {
-            "equal": hash1 == hash2,
-            "size": size1,
-            "hash1": hash1,
-            "hash2": hash2
+        # 내용 비교 (해시 대신 바이트 비교, 첫 차이에서 바로 종료)
+        result = {
+            "equal": FileUtils._compare_contents(file1, file2, size1),
+            "size": size1
         }
+        
+        if include_hash:
+            if fast and xxhash is not None:
+                checksum = FileUtils._fast_checksum
+            else:
+                checksum = FileUtils.calculate_checksum
+            result["hash1"] = checksum(file1)
+            result["hash2"] = checksum(file2)
+        
+        return result
+    
+    @staticmethod
+    def _fast_checksum(file_path: str) -> str:
+        """xxh3_128 체크섬 (비암호화, SIMD 가속)"""
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return xxhash.xxh3_128_hexdigest(b'')
+            
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return xxhash.xxh3_128_hexdigest(mm)
+    
+    @staticmethod
+    def _compare_contents(file1: str, file2: str, size: int, chunk_size: int = 1 << 20) -> bool:
+        """같은 크기의 두 파일 내용을 mmap으로 비교"""
+        if size == 0:
+            return True
+        
+        with open(file1, 'rb') as f1, open(file2, 'rb') as f2:
+            with mmap.mmap(f1.fileno(), 0, access=mmap.ACCESS_READ) as mm1, \
+                    mmap.mmap(f2.fileno(), 0, access=mmap.ACCESS_READ) as mm2:
+                if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    mm1.madvise(mmap.MADV_SEQUENTIAL)
+                    mm2.madvise(mmap.MADV_SEQUENTIAL)
+                
+                # 청크 비교는 memcmp로 처리된다
+                for offset in range(0, size, chunk_size):
+                    end = offset + chunk_size
+                    if mm1[offset:end] != mm2[offset:end]:
+                        return False
+        
+        return True
     
     @staticmethod
     def backup_file(
@@ -233,43 +435,71 @@ class FileUtils:
         dry_run: bool = True
     ) -> List[dict]:
         """오래된 파일 정리"""
-        path = Path(directory)
         cutoff_time = datetime.now().timestamp() - (days_old * 24 * 60 * 60)
         
         removed_files = []
         
-        for file in path.glob(pattern):
-            if not file.is_file():
+        for entry in _match_files(directory, pattern, recursive=False):
+            # stat은 파일당 한 번만 (DirEntry가 결과를 캐시)
+            st = entry.stat()
+            if st.st_mtime >= cutoff_time:
                 continue
             
-            if file.stat().st_mtime < cutoff_time:
-                file_info = {
-                    "path": str(file),
-                    "size": file.stat().st_size,
-                    "modified": datetime.fromtimestamp(file.stat().st_mtime).isoformat()
-                }
-                
-                if not dry_run:
-                    file.unlink()
-                    file_info["removed"] = True
-                else:
-                    file_info["removed"] = False
-                
-                removed_files.append(file_info)
+            file_info = {
+                "path": os.fspath(entry),
+                "size": st.st_size,
+                "modified": datetime.fromtimestamp(st.st_mtime).isoformat()
+            }
+            
+            if not dry_run:
+                os.unlink(entry)
+                file_info["removed"] = True
+            else:
+                file_info["removed"] = False
+            
+            removed_files.append(file_info)
         
         return removed_files
     
     @staticmethod
     def read_json_file(file_path: str) -> dict:
         """JSON 파일 읽기"""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(file_path, 'rb') as f:
+            content = f.read()
+        
+        if orjson is not None and _LONG_DIGITS_RE.search(content) is None:
+            try:
+                return orjson.loads(content)
+            except orjson.JSONDecodeError:
+                pass  # NaN/Infinity처럼 표준 json만 받아들이는 입력은 아래에서 다시 파싱
+        
+        return json.loads(content)
     
     @staticmethod
     def write_json_file(file_path: str, data: dict, indent: int = 2) -> None:
-        """JSON 파일 쓰기"""
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=indent, ensure_ascii=False)
+        """JSON 파일 쓰기
+        
+        직렬화를 먼저 끝낸 뒤 파일을 열므로 직렬화에 실패해도 기존 파일은 그대로 남는다.
+        """
+        content = None
+        
+        # orjson은 들여쓰기 2칸만 지원하고, 64비트를 넘는 정수는 거부하며(TypeError),
+        # NaN/Infinity는 null로 바꿔 쓰므로 이런 경우에는 표준 json 사용
+        if orjson is not None and indent in (None, 2) and not _has_non_finite(data):
+            option = orjson.OPT_NON_STR_KEYS
+            if indent == 2:
+                option |= orjson.OPT_INDENT_2
+            
+            try:
+                content = orjson.dumps(data, option=option)
+            except TypeError:
+                pass
+        
+        if content is None:
+            content = json.dumps(data, indent=indent, ensure_ascii=False).encode('utf-8')
+        
+        with open(file_path, 'wb') as f:
+            f.write(content)
     
     @staticmethod
     def read_csv_file(
@@ -277,10 +507,19 @@ class FileUtils:
         delimiter: str = ',',
         has_header: bool = True
     ) -> List[dict]:
-        """CSV 파일 읽기"""
-        with open(file_path, 'r', encoding='utf-8') as f:
+        """CSV 파일 읽기 (대용량 파일은 iter_csv_file 사용 권장)"""
+        return list(FileUtils.iter_csv_file(file_path, delimiter, has_header))
+    
+    @staticmethod
+    def iter_csv_file(
+        file_path: str,
+        delimiter: str = ',',
+        has_header: bool = True
+    ) -> Iterator[dict]:
+        """CSV 파일을 한 행씩 읽기 (전체를 메모리에 올리지 않음)"""
+        with open(file_path, 'r', encoding='utf-8', newline='') as f:
             reader = csv.DictReader(f, delimiter=delimiter) if has_header else csv.reader(f, delimiter=delimiter)
-            return list(reader)
+            yield from reader
     
     @staticmethod
     def write_csv_file(
@@ -289,14 +528,40 @@ class FileUtils:
         delimiter: str = ',',
         headers: Optional[List[str]] = None
     ) -> None:
-        """CSV 파일 쓰기"""
+        """CSV 파일 쓰기
+        
+        DictWriter와 같은 규칙을 따른다: 빠진 컬럼은 빈 값으로 채우고,
+        headers에 없는 키가 있으면 ValueError를 낸다.
+        """
         if not data:
             return
         
         if headers is None:
             headers = list(data[0].keys())
         
-        with open(file_path, 'w', encoding='utf-8', newline='') as f:
+        # dict -> 튜플 변환은 C로 구현된 itemgetter에 맡긴다
+        if len(headers) == 1:
+            key = headers[0]
+            getter = lambda row: (row[key],)
+        else:
+            getter = operator.itemgetter(*headers)
+        
+        # 모든 행의 키 개수가 컬럼 수와 같을 때만 빠른 경로 사용
+        # (개수가 같고 컬럼을 모두 찾았다면 남는 키가 없다)
+        fast = set(map(len, data)) == {len(set(headers))}
+        
+        with open(file_path, 'w', encoding='utf-8', newline='', buffering=1 << 20) as f:
+            if fast:
+                try:
+                    writer = csv.writer(f, delimiter=delimiter)
+                    writer.writerow(headers)
+                    writer.writerows(map(getter, data))
+                    return
+                except KeyError:
+                    f.seek(0)
+                    f.truncate()
+            
+            # 빠진 컬럼이나 남는 키가 있는 행은 DictWriter가 처리
             writer = csv.DictWriter(f, fieldnames=headers, delimiter=delimiter)
             writer.writeheader()
             writer.writerows(data)
@@ -307,9 +572,71 @@ class FileUtils:
         callback: callable,
         interval: float = 1.0
     ) -> None:
-        """파일 변경 모니터링"""
+        """파일 변경 모니터링
+        
+        watchdog이 있으면 OS 이벤트(inotify/FSEvents/ReadDirectoryChangesW)로,
+        없으면 interval초 간격 폴링으로 감시한다.
+        """
+        if Observer is not None:
+            FileUtils._monitor_with_watchdog(file_path, callback)
+        else:
+            FileUtils._monitor_with_polling(file_path, callback, interval)
+    
+    @staticmethod
+    def _monitor_with_watchdog(file_path: str, callback: callable) -> None:
+        """watchdog 이벤트 기반 파일 감시
+        
+        이벤트는 실제 파일이 있는 디렉토리에서 오므로, 심볼릭 링크는 따라가서
+        대상 파일의 부모 디렉토리를 감시하고 대상 경로와 비교한다.
+        """
+        path = Path(file_path).resolve()
+        state = {"mtime": path.stat().st_mtime if path.exists() else 0}
+        
+        def check(event):
+            # 부모 디렉토리를 감시하므로 대상 파일 이벤트만 처리
+            paths = {event.src_path, getattr(event, 'dest_path', '')}
+            if str(path) not in paths:
+                return
+            
+            try:
+                if path.exists():
+                    # 이벤트가 중복돼도 mtime이 바뀐 경우만 알린다
+                    current_modified = path.stat().st_mtime
+                    if current_modified != state["mtime"]:
+                        callback(file_path, "modified")
+                        state["mtime"] = current_modified
+                elif state["mtime"] > 0:
+                    callback(file_path, "deleted")
+                    state["mtime"] = 0
+            except Exception as e:
+                print(f"Error monitoring {file_path}: {e}")
+        
+        handler = FileSystemEventHandler()
+        handler.on_any_event = check
+        
+        observer = Observer()
+        observer.schedule(handler, str(path.parent), recursive=False)
+        observer.start()
+        
+        try:
+            while observer.is_alive():
+                observer.join(1)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            observer.stop()
+            observer.join()
+    
+    @staticmethod
+    def _monitor_with_polling(
+        file_path: str,
+        callback: callable,
+        interval: float = 1.0
+    ) -> None:
+        """stat 폴링 기반 파일 감시"""
         path = Path(file_path)
         last_modified = path.stat().st_mtime if path.exists() else 0
+        next_check = time.monotonic()
         
         while True:
             try:
@@ -322,7 +649,9 @@ class FileUtils:
                     callback(file_path, "deleted")
                     last_modified = 0
                 
-                time.sleep(interval)
+                # 콜백 실행 시간과 관계없이 일정한 간격 유지
+                next_check += interval
+                time.sleep(max(0, next_check - time.monotonic()))
             except KeyboardInterrupt:
                 break
             except Exception as e:
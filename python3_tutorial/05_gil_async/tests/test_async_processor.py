@@ -4,6 +4,7 @@
 
 import pytest
 import asyncio
+import os
 import tempfile
 from pathlib import Path
 from async_file_processor.core.async_processor import AsyncProcessor, ProcessingResult
@@ -157,4 +158,80 @@ class TestAsyncProcessor:
         
         assert len(results) == 3
         assert all(r.success for r in results)
-        assert all(r.result > 0 for r in results)
\ No newline at end of file
+        assert all(r.result > 0 for r in results)    
+    @staticmethod
+    def _counting_processor(calls: list):
+        """호출될 때마다 calls에 기록하는 처리기"""
+        def count_chars(content: str) -> int:
+            calls.append(content)
+            return len(content)
+        return count_chars
+    
+    @pytest.mark.asyncio
+    async def test_result_cache_hit(self, temp_files):
+        """같은 파일과 처리기는 다시 처리하지 않고, 걸린 시간은 그대로 기록"""
+        processor = AsyncProcessor()
+        calls = []
+        count_chars = self._counting_processor(calls)
+        
+        first = await processor.process_file(temp_files[0], count_chars)
+        second = await processor.process_file(temp_files[0], count_chars)
+        
+        assert len(calls) == 1
+        assert second.success and second.result == first.result
+        assert second.duration > 0
+    
+    @pytest.mark.asyncio
+    async def test_result_cache_invalidation(self, temp_files):
+        """파일 크기나 mtime이 바뀌면 다시 처리"""
+        processor = AsyncProcessor()
+        calls = []
+        count_chars = self._counting_processor(calls)
+        path = Path(temp_files[0])
+        
+        await processor.process_file(str(path), count_chars)
+        
+        path.write_text("changed size")
+        result = await processor.process_file(str(path), count_chars)
+        assert len(calls) == 2 and result.result == len("changed size")
+        
+        # 크기는 같고 mtime만 다른 경우
+        path.write_text("changed SIZE")
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        await processor.process_file(str(path), count_chars)
+        assert calls[-1] == "changed SIZE" and len(calls) == 3
+    
+    @pytest.mark.asyncio
+    async def test_result_cache_is_bounded(self, temp_files):
+        """cache_size를 넘으면 가장 오래 쓰지 않은 항목부터 제거"""
+        processor = AsyncProcessor(cache_size=2)
+        calls = []
+        count_chars = self._counting_processor(calls)
+        
+        for file in temp_files:
+            await processor.process_file(file, count_chars)
+        
+        assert len(processor._result_cache) == 2
+        
+        await processor.process_file(temp_files[0], count_chars)
+        assert len(calls) == len(temp_files) + 1
+    
+    @pytest.mark.asyncio
+    async def test_process_directory_skips_symlink_duplicates(self, temp_files):
+        """심볼릭 링크로 가리키는 같은 파일은 한 번만 처리"""
+        directory = Path(temp_files[0]).parent
+        link = directory / "link.txt"
+        link.symlink_to(temp_files[0])
+        
+        try:
+            processor = AsyncProcessor()
+            calls = []
+            results = await processor.process_directory(
+                str(directory), "*.txt", self._counting_processor(calls)
+            )
+        finally:
+            link.unlink()
+        
+        assert len(results) == len(temp_files)
+        assert len(calls) == len(temp_files)
@@ -0,0 +1,55 @@
+"""
+파일 유틸리티 테스트
+"""
+
+import pytest
+from async_file_processor.utils.file_utils import FileUtils
+
+
+class TestFileUtils:
+    """FileUtils 테스트"""
+
+    @pytest.fixture
+    def tree(self, tmp_path):
+        """하위 디렉토리가 있는 파일 트리"""
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "top.txt").write_text("top")
+        (tmp_path / "sub" / "inner.txt").write_text("inner")
+        (tmp_path / "sub" / "inner.log").write_text("log")
+        return tmp_path
+
+    def test_find_files_name_pattern(self, tree):
+        """이름 패턴 검색 테스트"""
+        found = FileUtils.find_files(str(tree), "*.txt")
+        assert sorted(p.name for p in found) == ["inner.txt", "top.txt"]
+
+        found = FileUtils.find_files(str(tree), "*.txt", recursive=False)
+        assert [p.name for p in found] == ["top.txt"]
+
+    def test_find_files_directory_pattern(self, tree):
+        """디렉토리가 들어간 패턴 검색 테스트 (Path.glob과 같은 결과)"""
+        found = FileUtils.find_files(str(tree), "sub/*.txt", recursive=False)
+        assert found == [tree / "sub" / "inner.txt"]
+
+        found = FileUtils.find_files(str(tree), "**/*.log")
+        assert found == [tree / "sub" / "inner.log"]
+
+    def test_clean_directory_directory_pattern(self, tree):
+        """디렉토리가 들어간 패턴으로 오래된 파일 정리 테스트"""
+        removed = FileUtils.clean_directory(str(tree), days_old=0, pattern="sub/*.log", dry_run=False)
+        assert [info["path"] for info in removed] == [str(tree / "sub" / "inner.log")]
+        assert not (tree / "sub" / "inner.log").exists()
+        assert (tree / "sub" / "inner.txt").exists()
+
+        removed = FileUtils.clean_directory(str(tree), days_old=0, pattern="*.txt")
+        assert [info["path"] for info in removed] == [str(tree / "top.txt")]
+        assert not removed[0]["removed"]
+
+    def test_read_json_file_keeps_large_integers(self, tmp_path):
+        """i64/u64 범위를 막 넘는 정수도 float로 바뀌지 않음"""
+        values = [-9223372036854775809, 18446744073709551616, -9223372036854775808, 18446744073709551615]
+        path = tmp_path / "numbers.json"
+        path.write_text('{"n": [%s]}' % ", ".join(map(str, values)))
+
+        assert FileUtils.read_json_file(str(path)) == {"n": values}
+        assert all(isinstance(n, int) for n in FileUtils.read_json_file(str(path))["n"])
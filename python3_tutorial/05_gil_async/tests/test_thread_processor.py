@@ -0,0 +1,40 @@
+"""
+스레드 처리기 테스트
+"""
+
+from async_file_processor.core.thread_processor import ThreadProcessor, process_file_worker
+
+
+class TestProcessFileWorker:
+    """process_file_worker 테스트"""
+
+    def test_custom_processor_gets_universal_newlines(self, tmp_path):
+        """사용자 처리기는 텍스트 모드 open()처럼 '\\n'으로 통일된 문자열을 받음"""
+        path = tmp_path / "crlf.txt"
+        path.write_bytes("첫 줄\r\n둘째 줄\r셋째 줄\n".encode('utf-8'))
+
+        result = process_file_worker(str(path), lambda content: content)
+
+        assert result.success
+        assert result.result == "첫 줄\n둘째 줄\n셋째 줄\n"
+
+
+class TestThreadProcessor:
+    """ThreadProcessor 디렉토리 처리 테스트"""
+
+    def test_process_directory_pool_patterns(self, tmp_path):
+        """이름 패턴과 디렉토리가 들어간 패턴 모두 Path.rglob과 같은 파일 처리"""
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "top.txt").write_text("a b")
+        (tmp_path / "sub" / "inner.txt").write_text("c")
+        (tmp_path / "sub" / "inner.log").write_text("d")
+
+        processor = ThreadProcessor(max_workers=2)
+
+        results = processor.process_directory_pool(str(tmp_path), "*.txt")
+        assert sorted(r.file_path for r in results) == sorted(
+            str(p) for p in tmp_path.rglob("*.txt"))
+
+        results = processor.process_directory_pool(str(tmp_path), "sub/*.log")
+        assert [r.file_path for r in results] == [str(tmp_path / "sub" / "inner.log")]
+        assert all(r.success for r in results)
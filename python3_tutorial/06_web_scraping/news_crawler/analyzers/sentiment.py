@@ -4,11 +4,47 @@
 """
 
 import re
-from typing import Dict, List, Optional, Union
-from collections import Counter
+import math
+import functools
+from typing import Dict, List, Optional, Union, NamedTuple, Tuple
 import logging
 
 
+_EMPTY = frozenset()
+
+# 정규식은 모듈 로드 시 한 번만 컴파일
+_RE_NON_WORD_RUN = re.compile(r'\W+')
+_RE_NON_HANGUL_RUN = re.compile(r'[^가-힣]+')
+_RE_SENT = re.compile(r'[.!?]+')
+
+
+class _PunctuationTable(dict):
+    """str.translate용 표: 단어 문자(\\w)와 공백(\\s)은 그대로, 나머지는 공백으로
+    
+    전체 유니코드 표를 미리 만들지 않고 처음 보는 문자만 계산해 채워 두므로
+    이후에는 C 수준의 dict 조회만 일어난다.
+    """
+    
+    def __missing__(self, codepoint: int) -> int:
+        char = chr(codepoint)
+        # 정규식 [^\w\s가-힣]와 같은 판정 (\w == isalnum() 또는 '_')
+        keep = char.isalnum() or char == '_' or char.isspace()
+        value = self[codepoint] = codepoint if keep else 0x20
+        return value
+
+
+_TRANSLATE_TABLE = _PunctuationTable()
+
+
+class _TextScan(NamedTuple):
+    """한 번의 순회로 얻은 감정 분석 중간 결과"""
+    positive_score: float
+    negative_score: float
+    positive_found: Dict[str, None]  # 처음 나온 순서를 유지하는 중복 제거
+    negative_found: Dict[str, None]
+    word_count: int
+
+
 class SentimentAnalyzer:
     """감정 분석기"""
     
@@ -16,48 +52,71 @@ class SentimentAnalyzer:
         self.logger = logging.getLogger(self.__class__.__name__)
         
         # 감정 단어 사전 (간단한 한국어/영어)
+        # 단어 포함 여부만 확인하므로 frozenset 사용 (O(1) 조회)
         self.positive_words = {
-            'ko': [
+            'ko': frozenset([
                 '좋다', '훌륭하다', '멋지다', '완벽하다', '최고', '우수하다',
                 '성공', '발전', '향상', '개선', '효과적', '긍정적', '만족',
                 '행복', '기쁘다', '즐겁다', '감사', '축하', '환영', '희망'
-            ],
-            'en': [
+            ]),
+            'en': frozenset([
                 'good', 'great', 'excellent', 'perfect', 'amazing', 'wonderful',
                 'success', 'improve', 'positive', 'happy', 'joy', 'love',
                 'thank', 'congratulation', 'welcome', 'hope', 'best'
-            ]
+            ])
         }
         
         self.negative_words = {
-            'ko': [
+            'ko': frozenset([
                 '나쁘다', '최악', '끔찍하다', '실망', '문제', '심각하다',
                 '실패', '위험', '걱정', '불안', '화나다', '슬프다',
                 '비판', '반대', '거부', '충격', '우려', '위기', '손실'
-            ],
-            'en': [
+            ]),
+            'en': frozenset([
                 'bad', 'terrible', 'awful', 'worst', 'hate', 'angry',
                 'sad', 'disappointed', 'problem', 'serious', 'fail',
                 'danger', 'worry', 'concern', 'crisis', 'loss', 'shock'
-            ]
+            ])
         }
         
         # 감정 강도 수식어
         self.intensifiers = {
-            'ko': ['매우', '정말', '너무', '아주', '완전히', '굉장히'],
-            'en': ['very', 'really', 'extremely', 'quite', 'totally', 'absolutely']
+            'ko': frozenset(['매우', '정말', '너무', '아주', '완전히', '굉장히']),
+            'en': frozenset(['very', 'really', 'extremely', 'quite', 'totally', 'absolutely'])
         }
         
         self.diminishers = {
-            'ko': ['조금', '약간', '다소', '그냥', '별로'],
-            'en': ['little', 'slightly', 'somewhat', 'barely', 'hardly']
+            'ko': frozenset(['조금', '약간', '다소', '그냥', '별로']),
+            'en': frozenset(['little', 'slightly', 'somewhat', 'barely', 'hardly'])
         }
+        
+        # 사전에서 만든 언어별 조회 테이블
+        self._tables: Dict[str, Tuple[Dict[str, bool], Dict[str, float]]] = {}
+        
+        # 같은 (텍스트, 언어)는 결과가 같으므로 인스턴스별로 캐시
+        self._analyze_cached = functools.lru_cache(maxsize=8192)(self._analyze_impl)
     
     def analyze(self, text: str, language: str = 'auto') -> Dict[str, Union[str, float, int]]:
         """텍스트 감정 분석"""
         if not text:
             return self._empty_result()
         
+        return self._copy_result(self._analyze_cached(text, language))
+    
+    def clear_cache(self) -> None:
+        """분석 결과/조회 테이블 캐시 비우기 (감정 사전을 수정한 뒤 호출)"""
+        self._analyze_cached.cache_clear()
+        self._tables.clear()
+    
+    def _copy_result(self, cached: Dict) -> Dict[str, Union[str, float, int]]:
+        """캐시된 결과를 호출자가 수정해도 되는 새 dict로 복사"""
+        result = dict(cached)
+        result['positive_words'] = list(cached['positive_words'])
+        result['negative_words'] = list(cached['negative_words'])
+        return result
+    
+    def _analyze_impl(self, text: str, language: str) -> Dict[str, Union[str, float, int]]:
+        """감정 분석 본체 (같은 입력이면 같은 결과이므로 캐시됨)"""
         # 언어 감지
         if language == 'auto':
             language = self._detect_language(text)
@@ -65,8 +124,9 @@ class SentimentAnalyzer:
         # 텍스트 전처리
         processed_text = self._preprocess_text(text)
         
-        # 감정 점수 계산
-        sentiment_score = self._calculate_sentiment_score(processed_text, language)
+        # 점수, 감정 단어, 단어 수를 한 번의 순회로 계산
+        scan = self._scan(processed_text, language)
+        sentiment_score = self._normalize_score(scan.positive_score, scan.negative_score)
         
         # 감정 분류
         sentiment_label = self._classify_sentiment(sentiment_score)
@@ -74,25 +134,25 @@ class SentimentAnalyzer:
         # 신뢰도 계산
         confidence = self._calculate_confidence(sentiment_score)
         
-        # 감정 단어 추출
-        emotion_words = self._extract_emotion_words(processed_text, language)
-        
         return {
             'sentiment': sentiment_label,
             'score': sentiment_score,
             'confidence': confidence,
             'language': language,
-            'positive_words': emotion_words['positive'],
-            'negative_words': emotion_words['negative'],
-            'word_count': len(processed_text.split()),
+            # 캐시에 저장되므로 변경 불가능한 튜플로 보관
+            'positive_words': tuple(scan.positive_found),
+            'negative_words': tuple(scan.negative_found),
+            'word_count': scan.word_count,
             'sentence_count': len(self._split_sentences(text))
         }
     
     def _detect_language(self, text: str) -> str:
         """언어 감지"""
         # 한글 문자 비율 확인
-        korean_chars = len(re.findall(r'[가-힣]', text))
-        total_chars = len(re.findall(r'\w', text))
+        # 문자 하나마다 리스트 원소를 만드는 findall 대신 나머지를 지우고 길이를 잰다
+        word_chars = _RE_NON_WORD_RUN.sub('', text)
+        total_chars = len(word_chars)
+        korean_chars = len(_RE_NON_HANGUL_RUN.sub('', word_chars))
         
         if total_chars > 0:
             korean_ratio = korean_chars / total_chars
@@ -107,55 +167,74 @@ class SentimentAnalyzer:
         text = text.lower()
         
         # 특수문자 제거 (한글, 영문, 숫자, 공백만 유지)
-        text = re.sub(r'[^\w\s가-힣]', ' ', text)
+        text = text.translate(_TRANSLATE_TABLE)
         
-        # 연속된 공백 제거
-        text = re.sub(r'\s+', ' ', text)
-        
-        return text.strip()
+        # 연속된 공백 제거 (split/join이 앞뒤 공백도 함께 제거)
+        return ' '.join(text.split())
     
-    def _calculate_sentiment_score(self, text: str, language: str) -> float:
-        """감정 점수 계산 (-1.0 ~ 1.0)"""
+    def _lookup_tables(self, language: str) -> Tuple[Dict[str, bool], Dict[str, float]]:
+        """언어별 조회 테이블 (감정 단어 -> 긍정 여부, 수식어 -> 가중치)"""
+        tables = self._tables.get(language)
+        if tables is None:
+            # 원래 검사 순서(긍정 > 부정, 강화어 > 약화어)대로 나중에 덮어쓴다
+            emotion = dict.fromkeys(self.negative_words.get(language, _EMPTY), False)
+            emotion.update(dict.fromkeys(self.positive_words.get(language, _EMPTY), True))
+            modifiers = dict.fromkeys(self.diminishers.get(language, _EMPTY), 0.5)
+            modifiers.update(dict.fromkeys(self.intensifiers.get(language, _EMPTY), 1.5))
+            
+            tables = self._tables[language] = (emotion, modifiers)
+        return tables
+    
+    def _scan(self, text: str, language: str) -> _TextScan:
+        """전처리된 텍스트를 한 번 순회하며 감정 점수와 감정 단어 수집"""
         words = text.split()
         
         positive_score = 0
         negative_score = 0
+        positive_found = {}
+        negative_found = {}
         
-        for i, word in enumerate(words):
-            # 긍정 단어 체크
-            if word in self.positive_words.get(language, []):
+        # 단어마다 dict 조회 한 번으로 감정 단어 여부와 극성을 함께 확인
+        emotion, modifiers = self._lookup_tables(language)
+        emotion_get = emotion.get
+        modifier_get = modifiers.get
+        
+        previous = None
+        for word in words:
+            is_positive = emotion_get(word)
+            if is_positive is not None:
                 score = 1.0
                 
-                # 이전 단어가 강화어인지 확인
-                if i > 0 and words[i-1] in self.intensifiers.get(language, []):
-                    score *= 1.5
-                elif i > 0 and words[i-1] in self.diminishers.get(language, []):
-                    score *= 0.5
+                # 이전 단어가 강화어/약화어인지 확인
+                if previous is not None:
+                    score *= modifier_get(previous, 1.0)
                 
-                positive_score += score
+                if is_positive:
+                    positive_score += score
+                    positive_found[word] = None
+                else:
+                    negative_score += score
+                    negative_found[word] = None
             
-            # 부정 단어 체크
-            elif word in self.negative_words.get(language, []):
-                score = 1.0
-                
-                # 이전 단어가 강화어인지 확인
-                if i > 0 and words[i-1] in self.intensifiers.get(language, []):
-                    score *= 1.5
-                elif i > 0 and words[i-1] in self.diminishers.get(language, []):
-                    score *= 0.5
-                
-                negative_score += score
+            previous = word
         
-        # 정규화
+        return _TextScan(positive_score, negative_score, positive_found, negative_found, len(words))
+    
+    def _normalize_score(self, positive_score: float, negative_score: float) -> float:
+        """긍정/부정 점수를 -1.0 ~ 1.0 범위로 정규화"""
         total_emotional_words = positive_score + negative_score
         if total_emotional_words == 0:
             return 0.0
         
-        # -1.0 ~ 1.0 범위로 정규화
         sentiment_score = (positive_score - negative_score) / total_emotional_words
         
         return max(-1.0, min(1.0, sentiment_score))
     
+    def _calculate_sentiment_score(self, text: str, language: str) -> float:
+        """감정 점수 계산 (-1.0 ~ 1.0)"""
+        scan = self._scan(text, language)
+        return self._normalize_score(scan.positive_score, scan.negative_score)
+    
     def _classify_sentiment(self, score: float) -> str:
         """감정 분류"""
         if score > 0.1:
@@ -175,26 +254,17 @@ class SentimentAnalyzer:
     
     def _extract_emotion_words(self, text: str, language: str) -> Dict[str, List[str]]:
         """감정 단어 추출"""
-        words = text.split()
-        
-        positive_found = []
-        negative_found = []
-        
-        for word in words:
-            if word in self.positive_words.get(language, []):
-                positive_found.append(word)
-            elif word in self.negative_words.get(language, []):
-                negative_found.append(word)
+        scan = self._scan(text, language)
         
         return {
-            'positive': list(set(positive_found)),
-            'negative': list(set(negative_found))
+            'positive': list(scan.positive_found),
+            'negative': list(scan.negative_found)
         }
     
     def _split_sentences(self, text: str) -> List[str]:
         """문장 분할"""
         # 간단한 문장 분할 (마침표, 느낌표, 물음표 기준)
-        sentences = re.split(r'[.!?]+', text)
+        sentences = _RE_SENT.split(text)
         return [s.strip() for s in sentences if s.strip()]
     
     def _empty_result(self) -> Dict[str, Union[str, float, int]]:
@@ -211,30 +281,50 @@ class SentimentAnalyzer:
         }
     
     def analyze_batch(self, texts: List[str], language: str = 'auto') -> List[Dict]:
-        """배치 감정 분석"""
-        return [self.analyze(text, language) for text in texts]
+        """배치 감정 분석 (중복 텍스트는 한 번만 분석)"""
+        analyzed = {text: self.analyze(text, language) for text in dict.fromkeys(texts)}
+        return [self._copy_result(analyzed[text]) for text in texts]
     
     def get_summary(self, results: List[Dict]) -> Dict[str, Union[int, float]]:
         """분석 결과 요약"""
         if not results:
             return {}
         
-        sentiments = [r['sentiment'] for r in results]
-        scores = [r['score'] for r in results]
+        # 한 번의 순회로 개수, 합계, 최댓값, 최솟값 계산
+        positive_count = negative_count = neutral_count = 0
+        total_score = 0.0
+        max_score = -math.inf
+        min_score = math.inf
+        
+        for r in results:
+            sentiment = r['sentiment']
+            if sentiment == 'positive':
+                positive_count += 1
+            elif sentiment == 'negative':
+                negative_count += 1
+            elif sentiment == 'neutral':
+                neutral_count += 1
+            
+            score = r['score']
+            total_score += score
+            if score > max_score:
+                max_score = score
+            if score < min_score:
+                min_score = score
         
-        sentiment_counts = Counter(sentiments)
+        count = len(results)
         
         return {
-            'total_count': len(results),
-            'positive_count': sentiment_counts.get('positive', 0),
-            'negative_count': sentiment_counts.get('negative', 0),
-            'neutral_count': sentiment_counts.get('neutral', 0),
-            'positive_ratio': sentiment_counts.get('positive', 0) / len(results),
-            'negative_ratio': sentiment_counts.get('negative', 0) / len(results),
-            'neutral_ratio': sentiment_counts.get('neutral', 0) / len(results),
-            'average_score': sum(scores) / len(scores),
-            'max_score': max(scores),
-            'min_score': min(scores)
+            'total_count': count,
+            'positive_count': positive_count,
+            'negative_count': negative_count,
+            'neutral_count': neutral_count,
+            'positive_ratio': positive_count / count,
+            'negative_ratio': negative_count / count,
+            'neutral_ratio': neutral_count / count,
+            'average_score': total_score / count,
+            'max_score': max_score,
+            'min_score': min_score
         }
     
     def compare_sentiments(self, text1: str, text2: str) -> Dict[str, any]:
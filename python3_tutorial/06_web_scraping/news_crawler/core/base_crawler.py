@@ -8,7 +8,7 @@ from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Any
 from datetime import datetime
 import logging
-from urllib.parse import urlparse, urljoin
+from urllib.parse import urlparse, urlsplit, urljoin
 
 
 @dataclass
@@ -47,12 +47,16 @@ class CrawlResult:
 class BaseCrawler(ABC):
     """크롤러 기본 클래스"""
     
+    # 크롤링에서 제외할 확장자 (이미지, 문서 파일 등)
+    EXCLUDED_EXTENSIONS = ('.jpg', '.png', '.pdf', '.zip', '.mp4')
+    
     def __init__(self, 
                  timeout: int = 30,
                  retry_count: int = 3,
                  delay: float = 1.0,
                  user_agent: Optional[str] = None,
-                 proxy: Optional[str] = None):
+                 proxy: Optional[str] = None,
+                 keep_raw_html: bool = False):
         """
         Args:
             timeout: 요청 타임아웃 (초)
@@ -60,16 +64,21 @@ class BaseCrawler(ABC):
             delay: 요청 간 지연 시간 (초)
             user_agent: User-Agent 헤더
             proxy: 프록시 서버 URL
+            keep_raw_html: 결과에 원본 HTML 보관 여부 (대량 크롤링 시 메모리 절약을 위해 기본 False)
         """
         self.timeout = timeout
         self.retry_count = retry_count
         self.delay = delay
         self.user_agent = user_agent or self._get_default_user_agent()
         self.proxy = proxy
+        self.keep_raw_html = keep_raw_html
         
         # 로거 설정
         self.logger = logging.getLogger(self.__class__.__name__)
         
+        # 호스트별 허용 여부 캐시 (같은 도메인은 한 번만 판단)
+        self._host_allowed: Dict[str, bool] = {}
+        
         # 통계
         self.stats = {
             "total_requests": 0,
@@ -111,18 +120,41 @@ class BaseCrawler(ABC):
     
     def should_crawl(self, url: str) -> bool:
         """크롤링 가능 여부 확인"""
-        # robots.txt 확인 등
-        # 여기서는 간단히 구현
-        if not self.validate_url(url):
+        try:
+            parsed = urlsplit(url)
+        except Exception:
+            return False
+        
+        if not parsed.scheme or not self._is_host_allowed(parsed.netloc):
             return False
         
         # 이미지, 문서 파일 등 제외
-        excluded_extensions = ['.jpg', '.png', '.pdf', '.zip', '.mp4']
-        for ext in excluded_extensions:
-            if url.lower().endswith(ext):
-                return False
+        return not url.lower().endswith(self.EXCLUDED_EXTENSIONS)
+    
+    def _is_host_allowed(self, host: str) -> bool:
+        """호스트 단위 허용 여부 (호스트마다 한 번만 계산)"""
+        allowed = self._host_allowed.get(host)
+        
+        if allowed is None:
+            allowed = self._check_host(host)
+            self._host_allowed[host] = allowed
+        
+        return allowed
+    
+    def _check_host(self, host: str) -> bool:
+        """호스트 허용 여부 판단"""
+        # robots.txt 확인 등
+        # 여기서는 간단히 구현
+        return bool(host)
+    
+    @staticmethod
+    def decode_html(content: bytes, encoding: Optional[str] = None) -> str:
+        """응답 바이트를 문자열로 디코딩
         
-        return True
+        파서가 메타 태그에서 찾은 인코딩(HTMLParser.parse의 두 번째 값)을 그대로 써서
+        chardet 같은 인코딩 추측 과정을 다시 거치지 않는다.
+        """
+        return content.decode(encoding or 'utf-8', errors='replace')
     
     def _get_default_user_agent(self) -> str:
         """기본 User-Agent"""
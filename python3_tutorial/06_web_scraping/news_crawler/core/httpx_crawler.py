@@ -4,8 +4,9 @@ HTTPX 기반 비동기 크롤러
 """
 
 import asyncio
+import contextlib
 import httpx
-from typing import List, Dict, Optional, Union
+from typing import List, Dict, Optional, Union, Any, AsyncIterator, Awaitable, Callable, Tuple
 from datetime import datetime
 import logging
 from bs4 import BeautifulSoup
@@ -31,7 +32,7 @@ class HttpxCrawler(BaseCrawler):
         
         self.max_connections = max_connections
         self.http2 = http2
-        self.parser = HTMLParser()
+        self.parser = HTMLParser.shared()
         self.anti_bot = AntiBot()
         
         # 클라이언트 설정
@@ -56,17 +57,119 @@ class HttpxCrawler(BaseCrawler):
                 'http://': self.proxy,
                 'https://': self.proxy
             }
+        
+        # 요청마다 새로 만들지 않고 재사용하는 클라이언트 (keep-alive, HTTP/2 다중화)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # 클라이언트를 쓰고 있는 최상위 호출(또는 async with) 수
+        self._client_users = 0
+        
+        # 동기 래퍼(crawl, crawl_multiple)가 같이 쓰는 이벤트 루프와 그 루프 전용 클라이언트
+        # (호출 사이에도 유지되므로 다른 루프의 클라이언트와 따로 둔다)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_client: Optional[httpx.AsyncClient] = None
+    
+    def _run(self, coro):
+        """공유 이벤트 루프에서 코루틴 실행
+        
+        asyncio.run처럼 호출마다 루프를 새로 만들지 않으므로
+        동기 호출 사이에서도 클라이언트의 커넥션 풀이 유지된다.
+        """
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        
+        return self._loop.run_until_complete(coro)
+    
+    async def _get_client(self) -> httpx.AsyncClient:
+        """현재 이벤트 루프에서 재사용할 클라이언트 (지연 생성)"""
+        loop = asyncio.get_running_loop()
+        
+        if loop is self._loop:
+            if self._loop_client is None:
+                self._loop_client = httpx.AsyncClient(**self.client_config)
+            return self._loop_client
+        
+        # 커넥션 풀은 만들어진 이벤트 루프에 묶이므로 루프가 바뀌면 새로 만든다
+        if self._client is not None and self._client_loop is not loop:
+            old_loop = self._client_loop
+            if not old_loop.is_closed():
+                # 다른 루프의 커넥션은 여기서 닫을 수 없으므로 버리지 않고 거부한다
+                raise RuntimeError(
+                    "HttpxCrawler client is bound to another event loop; "
+                    "call close() (or finish 'async with crawler') before "
+                    "using it from a new loop"
+                )
+            
+            self.logger.warning("Dropping HTTPX client of a closed event loop")
+            self._client = None
+        
+        if self._client is None:
+            self._client = httpx.AsyncClient(**self.client_config)
+            self._client_loop = loop
+        
+        return self._client
+    
+    @contextlib.asynccontextmanager
+    async def _client_session(self) -> AsyncIterator[httpx.AsyncClient]:
+        """최상위 비동기 호출 동안 쓸 클라이언트
+        
+        동기 래퍼의 공유 루프에서는 호출 사이에도 커넥션 풀을 유지하고,
+        그 밖의 루프(asyncio.run 등)에서는 마지막 호출이 끝날 때 닫는다.
+        루프가 끝난 뒤에는 그 루프에 묶인 커넥션을 정리할 수 없기 때문이다.
+        """
+        client = await self._get_client()
+        self._client_users += 1
+        
+        try:
+            yield client
+        finally:
+            self._client_users -= 1
+            if (self._client_users == 0
+                    and asyncio.get_running_loop() is not self._loop):
+                await self.aclose()
+    
+    async def __aenter__(self):
+        """async with 블록 동안 여러 호출이 클라이언트를 공유"""
+        await self._get_client()
+        self._client_users += 1
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self._client_users -= 1
+        if self._client_users == 0:
+            await self.aclose()
     
     def crawl(self, url: str) -> CrawlResult:
         """동기 방식으로 단일 URL 크롤링"""
-        return asyncio.run(self.crawl_async(url))
+        return self._run(self.crawl_async(url))
     
     def crawl_multiple(self, urls: List[str]) -> List[CrawlResult]:
         """동기 방식으로 여러 URL 크롤링"""
-        return asyncio.run(self.crawl_multiple_async(urls))
+        return self._run(self.crawl_multiple_async(urls))
+    
+    async def _throttle(self, url: str) -> None:
+        """호스트별 요청 속도 제한
+        
+        기존처럼 동시 연결마다 delay씩 쉬는 것과 같은 평균 속도
+        (초당 max_connections / delay)를 유지하되, 토큰이 남아 있으면 바로 보낸다.
+        """
+        if self.delay <= 0:
+            return
+        
+        await self.anti_bot.acquire(url,
+                                    rate=self.max_connections / self.delay,
+                                    burst=self.max_connections)
     
-    async def crawl_async(self, url: str) -> CrawlResult:
-        """비동기 단일 URL 크롤링"""
+    async def crawl_async(self,
+                          url: str,
+                          client: Optional[httpx.AsyncClient] = None,
+                          semaphore: Optional[asyncio.Semaphore] = None) -> CrawlResult:
+        """비동기 단일 URL 크롤링
+        
+        semaphore가 주어지면 실제 요청 동안만 슬롯을 잡고,
+        반크롤링 지연이나 재시도 대기 중에는 슬롯을 비워 둔다.
+        """
         if not self.should_crawl(url):
             return CrawlResult(
                 url=url,
@@ -74,47 +177,61 @@ class HttpxCrawler(BaseCrawler):
                 error="Invalid URL or not allowed to crawl"
             )
         
+        # 단독 호출이면 호출이 끝날 때까지만 클라이언트를 잡는다
+        if client is None:
+            async with self._client_session() as client:
+                return await self.crawl_async(url, client, semaphore)
+        
         self.logger.info(f"Async crawling: {url}")
         
         # 통계 시작
         if self.stats["start_time"] is None:
             self.stats["start_time"] = datetime.now()
         
-        async with httpx.AsyncClient(**self.client_config) as client:
-            for attempt in range(self.retry_count):
-                try:
-                    # 반크롤링 회피
-                    await asyncio.sleep(self.anti_bot.get_random_delay(self.delay))
-                    
-                    # 요청 실행
-                    response = await client.get(url, follow_redirects=True)
-                    response.raise_for_status()
-                    
-                    # 통계 업데이트
-                    self.update_stats(True, len(response.content))
-                    
-                    # HTML 파싱
-                    soup = BeautifulSoup(response.text, 'html.parser')
-                    
-                    # 데이터 추출
-                    result = self._extract_data(url, soup, response.text)
-                    
-                    self.logger.info(f"Successfully crawled: {url}")
-                    return result
-                    
-                except httpx.HTTPError as e:
-                    self.logger.warning(f"Attempt {attempt + 1} failed for {url}: {e}")
-                    
-                    if attempt == self.retry_count - 1:
-                        self.update_stats(False)
-                        return CrawlResult(
-                            url=url,
-                            success=False,
-                            error=str(e)
-                        )
-                    
-                    # 재시도 전 대기
-                    await asyncio.sleep(self.delay * (attempt + 1))
+        async def _do_request() -> httpx.Response:
+            if semaphore is None:
+                return await client.get(url, follow_redirects=True)
+            
+            async with semaphore:
+                return await client.get(url, follow_redirects=True)
+        
+        for attempt in range(self.retry_count):
+            try:
+                # 반크롤링 회피 (호스트별 토큰 버킷)
+                await self._throttle(url)
+                
+                # 요청 실행
+                response = await _do_request()
+                response.raise_for_status()
+                
+                # 통계 업데이트
+                self.update_stats(True, len(response.content))
+                
+                # HTML 파싱 (lexbor 또는 BeautifulSoup, 메타 charset으로 인코딩 판단)
+                soup, encoding = self.parser.parse(response.content)
+                raw_html = (self.decode_html(response.content, encoding)
+                            if self.keep_raw_html else None)
+                head = self.parser.head_text(response.content, encoding)
+                
+                # 데이터 추출
+                result = self._extract_data(url, soup, raw_html, head)
+                
+                self.logger.info(f"Successfully crawled: {url}")
+                return result
+            
+            except httpx.HTTPError as e:
+                self.logger.warning(f"Attempt {attempt + 1} failed for {url}: {e}")
+                
+                if attempt == self.retry_count - 1:
+                    self.update_stats(False)
+                    return CrawlResult(
+                        url=url,
+                        success=False,
+                        error=str(e)
+                    )
+                
+                # 재시도 전 대기
+                await asyncio.sleep(self.delay * (attempt + 1))
         
         self.update_stats(False)
         return CrawlResult(
@@ -123,34 +240,95 @@ class HttpxCrawler(BaseCrawler):
             error="Max retries exceeded"
         )
     
-    async def crawl_multiple_async(self, urls: List[str]) -> List[CrawlResult]:
-        """비동기 여러 URL 동시 크롤링"""
+    async def _crawl_pool(self,
+                          urls: List[str]) -> AsyncIterator[Tuple[int, CrawlResult]]:
+        """고정 개수 워커로 크롤링하며 끝나는 순서대로 (인덱스, 결과) 반환
+        
+        URL 큐와 결과 큐 모두 크기를 제한하므로 동시에 메모리에 있는 결과는
+        URL 수가 아니라 max_connections에 비례한다.
+        """
+        # 모든 URL이 하나의 클라이언트(커넥션 풀)를 공유
+        async with self._client_session() as client:
+            # 동시 요청 수는 세마포어가 제한하고, 워커는 그보다 많이 두어
+            # 일부가 재시도 대기 중이어도 연결 슬롯이 놀지 않게 한다
+            semaphore = asyncio.Semaphore(self.max_connections)
+            worker_count = max(1, min(self.max_connections * 2, len(urls)))
+            
+            url_queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_connections * 2)
+            result_queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_connections * 2)
+            
+            async def producer():
+                for item in enumerate(urls):
+                    await url_queue.put(item)
+                
+                # 워커마다 종료 신호
+                for _ in range(worker_count):
+                    await url_queue.put(None)
+            
+            async def worker():
+                while True:
+                    item = await url_queue.get()
+                    if item is None:
+                        break
+                    
+                    index, url = item
+                    try:
+                        result = await self.crawl_async(url, client, semaphore)
+                    except Exception as e:
+                        result = CrawlResult(
+                            url=url,
+                            success=False,
+                            error=str(e)
+                        )
+                    
+                    await result_queue.put((index, result))
+                
+                await result_queue.put(None)
+            
+            tasks = [asyncio.create_task(producer())]
+            tasks.extend(asyncio.create_task(worker()) for _ in range(worker_count))
+            
+            try:
+                finished = 0
+                while finished < worker_count:
+                    item = await result_queue.get()
+                    if item is None:
+                        finished += 1
+                    else:
+                        yield item
+            finally:
+                # 소비자가 중간에 멈춘 경우 남은 작업 정리
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+        
+    async def crawl_multiple_async(self,
+                                   urls: List[str],
+                                   callback: Optional[Callable[[CrawlResult], Awaitable[Any]]] = None
+                                   ) -> List[CrawlResult]:
+        """비동기 여러 URL 동시 크롤링
+        
+        Args:
+            urls: 크롤링할 URL 목록
+            callback: 결과가 나오는 즉시 호출할 비동기 함수
+        
+        Returns:
+            입력 순서대로 정렬된 결과 목록
+        """
         self.logger.info(f"Async crawling {len(urls)} URLs")
         self.reset_stats()
         self.stats["start_time"] = datetime.now()
         
-        # 세마포어로 동시 실행 제한
-        semaphore = asyncio.Semaphore(self.max_connections)
-        
-        async def crawl_with_semaphore(url: str) -> CrawlResult:
-            async with semaphore:
-                return await self.crawl_async(url)
-        
-        # 동시 실행
-        tasks = [crawl_with_semaphore(url) for url in urls]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # 예외 처리
-        processed_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                processed_results.append(CrawlResult(
-                    url=urls[i],
-                    success=False,
-                    error=str(result)
-                ))
-            else:
-                processed_results.append(result)
+        processed_results: List[Optional[CrawlResult]] = [None] * len(urls)
+        pool = self._crawl_pool(urls)
+        try:
+            async for index, result in pool:
+                if callback:
+                    await callback(result)
+                processed_results[index] = result
+        finally:
+            # 콜백이 예외를 내도 워커를 바로 정리
+            await pool.aclose()
         
         self.stats["end_time"] = datetime.now()
         
@@ -161,15 +339,18 @@ class HttpxCrawler(BaseCrawler):
         return processed_results
     
     async def crawl_stream_async(self, urls: List[str], callback=None):
-        """스트리밍 방식으로 크롤링 (결과를 즉시 처리)"""
-        async with httpx.AsyncClient(**self.client_config) as client:
-            for url in urls:
-                result = await self._crawl_single_with_client(client, url)
-                
+        """스트리밍 방식으로 크롤링 (끝나는 순서대로 결과를 즉시 처리)"""
+        pool = self._crawl_pool(urls)
+        try:
+            async for _, result in pool:
                 if callback:
                     await callback(result)
                 
                 yield result
+        finally:
+            # 소비자가 스트림을 닫으면 안쪽 풀도 바로 닫는다
+            # (GC가 aclose를 예약할 때까지 워커가 계속 요청을 보내지 않게)
+            await pool.aclose()
     
     async def _crawl_single_with_client(self, 
                                        client: httpx.AsyncClient, 
@@ -187,12 +368,15 @@ class HttpxCrawler(BaseCrawler):
             response = await client.get(url, follow_redirects=True)
             response.raise_for_status()
             
-            # HTML 파싱
-            soup = BeautifulSoup(response.text, 'html.parser')
+            # HTML 파싱 (lexbor 또는 BeautifulSoup, 메타 charset으로 인코딩 판단)
+            soup, encoding = self.parser.parse(response.content)
+            raw_html = (self.decode_html(response.content, encoding)
+                        if self.keep_raw_html else None)
+            head = self.parser.head_text(response.content, encoding)
             
             # 데이터 추출
-            return self._extract_data(url, soup, response.text)
-            
+            return self._extract_data(url, soup, raw_html, head)
+        
         except httpx.HTTPError as e:
             return CrawlResult(
                 url=url,
@@ -200,30 +384,23 @@ class HttpxCrawler(BaseCrawler):
                 error=str(e)
             )
     
-    def _extract_data(self, url: str, soup: BeautifulSoup, raw_html: str) -> CrawlResult:
-        """HTML에서 데이터 추출"""
+    def _extract_data(self, url: str, soup: BeautifulSoup, raw_html: str,
+                      head: Optional[str] = None) -> CrawlResult:
+        """HTML에서 데이터 추출 (head: 날짜 패턴 검색용 응답 앞부분)"""
+        # 원본 HTML은 요청한 경우에만 결과에 남긴다
+        raw_html = raw_html if self.keep_raw_html else None
+        
         try:
-            title = self.parser.extract_title(soup)
-            content = self.parser.extract_content(soup)
-            metadata = self.parser.extract_metadata(soup)
-            author = metadata.get('author')
-            published_date = self.parser.extract_date(soup, metadata)
-            images = self.parser.extract_images(soup, url)
-            links = self.parser.extract_links(soup, url)
+            # 제목, 본문, 메타데이터, 날짜, 이미지, 링크를 한 번에 추출
+            data = self.parser.extract_all(soup, url, head)
             
             return CrawlResult(
                 url=url,
-                title=title,
-                content=content,
-                author=author,
-                published_date=published_date,
-                images=images,
-                links=links,
-                metadata=metadata,
                 raw_html=raw_html,
-                success=True
+                success=True,
+                **data
             )
-            
+        
         except Exception as e:
             self.logger.error(f"Error extracting data from {url}: {e}")
             return CrawlResult(
@@ -242,7 +419,7 @@ class HttpxCrawler(BaseCrawler):
         rate_limiter = AsyncRateLimiter(rate=rate_limit, per=1.0)
         results = []
         
-        async with httpx.AsyncClient(**self.client_config) as client:
+        async with self._client_session() as client:
             for url in urls:
                 await rate_limiter.acquire()
                 result = await self._crawl_single_with_client(client, url)
@@ -255,7 +432,7 @@ class HttpxCrawler(BaseCrawler):
                                      max_retries: int = 5,
                                      backoff_factor: float = 2.0) -> CrawlResult:
         """지수 백오프를 적용한 재시도"""
-        async with httpx.AsyncClient(**self.client_config) as client:
+        async with self._client_session() as client:
             for attempt in range(max_retries):
                 try:
                     result = await self._crawl_single_with_client(client, url)
@@ -267,7 +444,7 @@ class HttpxCrawler(BaseCrawler):
                     wait_time = self.delay * (backoff_factor ** attempt)
                     self.logger.info(f"Retry {attempt + 1}/{max_retries} after {wait_time}s")
                     await asyncio.sleep(wait_time)
-                    
+                
                 except Exception as e:
                     self.logger.error(f"Attempt {attempt + 1} failed: {e}")
                     
@@ -277,13 +454,63 @@ class HttpxCrawler(BaseCrawler):
                             success=False,
                             error=f"Max retries exceeded: {str(e)}"
                         )
+            
+            return CrawlResult(
+                url=url,
+                success=False,
+                error="Crawling failed"
+            )
+    
+    async def aclose(self):
+        """비동기 리소스 정리 (재사용 클라이언트 닫기)"""
+        if self._loop_client is not None and asyncio.get_running_loop() is self._loop:
+            await self._loop_client.aclose()
+            self._loop_client = None
         
-        return CrawlResult(
-            url=url,
-            success=False,
-            error="Crawling failed"
-        )
+        if self._client is not None:
+            await self._client.aclose()
+        
+        self._client = None
+        self._client_loop = None
+    
+    @staticmethod
+    def _finish_tasks(loop: asyncio.AbstractEventLoop) -> None:
+        """루프에 남은 작업이 모두 끝날 때까지 실행
+        
+        스트림을 중간에 멈추면 비동기 제너레이터의 aclose가 작업으로 예약되어
+        루프에 남는다. 이 작업이 워커를 취소하고 기다리는 중에 루프를 닫으면
+        정리가 끝나지 않으므로 새로 생긴 작업까지 반복해서 기다린다.
+        """
+        pending = asyncio.all_tasks(loop)
+        while pending:
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            pending = asyncio.all_tasks(loop)
     
     def close(self):
         """리소스 정리"""
+        shared_loop = self._loop
+        
+        # 동기 래퍼용 루프에 남은 작업과 비동기 제너레이터를 먼저 정리
+        if shared_loop is not None and not shared_loop.is_closed():
+            self._finish_tasks(shared_loop)
+            shared_loop.run_until_complete(shared_loop.shutdown_asyncgens())
+            self._finish_tasks(shared_loop)
+            
+            if self._loop_client is not None:
+                shared_loop.run_until_complete(self._loop_client.aclose())
+        self._loop_client = None
+        
+        loop = self._client_loop
+        
+        # 클라이언트를 만든 루프가 아직 살아 있으면 그 루프에서 닫는다
+        if loop is not None and not loop.is_closed() and not loop.is_running():
+            loop.run_until_complete(self.aclose())
+        
+        self._client = None
+        self._client_loop = None
+        
+        if shared_loop is not None and not shared_loop.is_closed():
+            shared_loop.close()
+        self._loop = None
+        
         self.logger.info("HTTPX crawler closed")
\ No newline at end of file
@@ -3,10 +3,12 @@ Requests 기반 크롤러
 정적 웹페이지 크롤링에 최적화
 """
 
+import re
 import time
 import requests
 from bs4 import BeautifulSoup
-from typing import List, Dict, Optional
+from lxml import etree
+from typing import List, Dict, Optional, Tuple, Any
 from datetime import datetime
 import logging
 
@@ -18,6 +20,9 @@ from ..utils.anti_bot import AntiBot
 class RequestsCrawler(BaseCrawler):
     """Requests + BeautifulSoup 크롤러"""
     
+    # 다음 페이지 링크 텍스트 패턴
+    _NEXT_RE = re.compile('다음|next', re.I)
+    
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         
@@ -39,17 +44,24 @@ class RequestsCrawler(BaseCrawler):
                 'https': self.proxy
             }
         
-        self.parser = HTMLParser()
+        self.parser = HTMLParser.shared()
         self.anti_bot = AntiBot()
     
     def crawl(self, url: str) -> CrawlResult:
         """단일 URL 크롤링"""
+        return self._crawl_page(url)[0]
+    
+    def _crawl_page(self, url: str, check_next: bool = False) -> Tuple[CrawlResult, bool]:
+        """단일 URL 크롤링 후 (결과, 다음 페이지 존재 여부) 반환
+        
+        check_next가 False면 다음 페이지를 확인하지 않고 항상 False를 돌려준다.
+        """
         if not self.should_crawl(url):
             return CrawlResult(
                 url=url,
                 success=False,
                 error="Invalid URL or not allowed to crawl"
-            )
+            ), False
         
         self.logger.info(f"Crawling: {url}")
         
@@ -71,21 +83,25 @@ class RequestsCrawler(BaseCrawler):
                 
                 response.raise_for_status()
                 
-                # 인코딩 처리
-                response.encoding = response.apparent_encoding
-                
                 # 통계 업데이트
                 self.update_stats(True, len(response.content))
                 
-                # HTML 파싱
-                soup = BeautifulSoup(response.text, 'html.parser')
+                # HTML 파싱 (lexbor 또는 BeautifulSoup, 메타 charset으로 인코딩 판단)
+                soup, encoding = self.parser.parse(response.content)
+                raw_html = (self.decode_html(response.content, encoding)
+                            if self.keep_raw_html else None)
+                head = self.parser.head_text(response.content, encoding)
+                
+                # 다음 페이지 링크는 추출 전에 확인한다
+                # (extract_all이 nav/menu 등 제외 패턴 요소를 트리에서 지우므로)
+                has_next = check_next and self._has_next_page(soup)
                 
                 # 데이터 추출
-                result = self._extract_data(url, soup, response.text)
+                result = self._extract_data(url, soup, raw_html, head)
                 
                 self.logger.info(f"Successfully crawled: {url}")
-                return result
-                
+                return result, has_next
+            
             except requests.exceptions.RequestException as e:
                 self.logger.warning(f"Attempt {attempt + 1} failed for {url}: {e}")
                 
@@ -95,7 +111,7 @@ class RequestsCrawler(BaseCrawler):
                         url=url,
                         success=False,
                         error=str(e)
-                    )
+                    ), False
                 
                 # 재시도 전 대기
                 time.sleep(self.delay * (attempt + 1))
@@ -105,7 +121,7 @@ class RequestsCrawler(BaseCrawler):
             url=url,
             success=False,
             error="Max retries exceeded"
-        )
+        ), False
     
     def crawl_multiple(self, urls: List[str]) -> List[CrawlResult]:
         """여러 URL 순차 크롤링"""
@@ -133,43 +149,23 @@ class RequestsCrawler(BaseCrawler):
         
         return results
     
-    def _extract_data(self, url: str, soup: BeautifulSoup, raw_html: str) -> CrawlResult:
-        """HTML에서 데이터 추출"""
+    def _extract_data(self, url: str, soup: BeautifulSoup, raw_html: str,
+                      head: Optional[str] = None) -> CrawlResult:
+        """HTML에서 데이터 추출 (head: 날짜 패턴 검색용 응답 앞부분)"""
+        # 원본 HTML은 요청한 경우에만 결과에 남긴다
+        raw_html = raw_html if self.keep_raw_html else None
+        
         try:
-            # 제목 추출
-            title = self.parser.extract_title(soup)
-            
-            # 본문 추출
-            content = self.parser.extract_content(soup)
-            
-            # 메타데이터 추출
-            metadata = self.parser.extract_metadata(soup)
-            
-            # 작성자 추출
-            author = metadata.get('author')
-            
-            # 날짜 추출
-            published_date = self.parser.extract_date(soup, metadata)
-            
-            # 이미지 추출
-            images = self.parser.extract_images(soup, url)
-            
-            # 링크 추출
-            links = self.parser.extract_links(soup, url)
+            # 제목, 본문, 메타데이터, 날짜, 이미지, 링크를 한 번에 추출
+            data = self.parser.extract_all(soup, url, head)
             
             return CrawlResult(
                 url=url,
-                title=title,
-                content=content,
-                author=author,
-                published_date=published_date,
-                images=images,
-                links=links,
-                metadata=metadata,
                 raw_html=raw_html,
-                success=True
+                success=True,
+                **data
             )
-            
+        
         except Exception as e:
             self.logger.error(f"Error extracting data from {url}: {e}")
             return CrawlResult(
@@ -189,7 +185,7 @@ class RequestsCrawler(BaseCrawler):
             
             self.logger.info(f"Crawling page {page}: {page_url}")
             
-            result = self.crawl(page_url)
+            result, has_next = self._crawl_page(page_url, check_next=True)
             
             if not result.success:
                 self.logger.warning(f"Failed to crawl page {page}")
@@ -198,8 +194,7 @@ class RequestsCrawler(BaseCrawler):
             results.append(result)
             
             # 다음 페이지 링크가 없으면 중단
-            soup = BeautifulSoup(result.raw_html, 'html.parser')
-            if not self._has_next_page(soup):
+            if not has_next:
                 self.logger.info("No more pages to crawl")
                 break
             
@@ -207,37 +202,111 @@ class RequestsCrawler(BaseCrawler):
         
         return results
     
-    def _has_next_page(self, soup: BeautifulSoup) -> bool:
-        """다음 페이지 존재 여부 확인"""
+    def _has_next_page(self, soup: Any) -> bool:
+        """다음 페이지 존재 여부 확인 (BeautifulSoup 또는 lexbor 문서)"""
         # 사이트별로 구현 필요
-        next_link = soup.find('a', {'class': 'next'}) or \
-                   soup.find('a', string=re.compile('다음|next', re.I))
+        if not isinstance(soup, BeautifulSoup):
+            return soup.css_first('a.next') is not None or \
+                   any(self._NEXT_RE.search(a.text()) for a in soup.css('a'))
+        
+        next_link = soup.select_one('a.next') or \
+                   soup.find('a', string=self._NEXT_RE)
         return next_link is not None
     
-    def crawl_sitemap(self, sitemap_url: str) -> List[str]:
-        """사이트맵에서 URL 목록 추출"""
+    def crawl_listing(self, url: str) -> CrawlResult:
+        """목록 페이지 크롤링 (제목, 메타데이터, 날짜, 링크만 추출)
+        
+        응답을 스트리밍하면서 HTMLParser.extract_from_stream에 넘기므로
+        응답 전체를 메모리에 올리거나 문서 트리를 만들지 않는다.
+        """
+        if not self.should_crawl(url):
+            return CrawlResult(
+                url=url,
+                success=False,
+                error="Invalid URL or not allowed to crawl"
+            )
+        
+        self.logger.info(f"Crawling listing: {url}")
+        
+        if self.stats["start_time"] is None:
+            self.stats["start_time"] = datetime.now()
+        
+        downloaded = 0
+        
         try:
-            response = self.session.get(sitemap_url, timeout=self.timeout)
-            response.raise_for_status()
+            self.anti_bot.random_delay(self.delay)
             
-            soup = BeautifulSoup(response.text, 'xml')
-            urls = []
+            with self.session.get(url, timeout=self.timeout, stream=True) as response:
+                response.raise_for_status()
+                
+                def chunks():
+                    nonlocal downloaded
+                    for chunk in response.iter_content(chunk_size=65536):
+                        downloaded += len(chunk)
+                        yield chunk
+                
+                data = self.parser.extract_from_stream(chunks(), url)
             
-            # 일반 사이트맵
-            for loc in soup.find_all('loc'):
-                urls.append(loc.text)
+            self.update_stats(True, downloaded)
+            return CrawlResult(url=url, success=True, **data)
+        
+        except requests.exceptions.RequestException as e:
+            self.logger.warning(f"Failed to crawl listing {url}: {e}")
+            self.update_stats(False)
+            return CrawlResult(
+                url=url,
+                success=False,
+                error=str(e)
+            )
+    
+    def crawl_sitemap(self, sitemap_url: str) -> List[str]:
+        """사이트맵에서 URL 목록 추출
+        
+        응답을 스트리밍하면서 iterparse로 <loc>만 꺼내고 처리한 요소는 바로 지워
+        사이트맵 크기와 상관없이 메모리를 일정하게 유지한다.
+        """
+        try:
+            with self.session.get(sitemap_url, timeout=self.timeout, stream=True) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True  # gzip 전송 해제
+                
+                # 외부 엔티티는 풀지 않는다 (원격 XML이 로컬 파일을 끌어오지 못하게)
+                context = etree.iterparse(
+                    response.raw,
+                    events=('start', 'end'),
+                    resolve_entities=False,
+                    no_network=True,
+                    huge_tree=False
+                )
+                _, root = next(context)
+                is_index = etree.QName(root).localname == 'sitemapindex'
+                locs = []
+                
+                for event, elem in context:
+                    if event != 'end':
+                        continue
+                    
+                    name = etree.QName(elem).localname
+                    if name == 'loc':
+                        if elem.text:
+                            locs.append(elem.text.strip())
+                    elif name in ('url', 'sitemap'):
+                        # 처리가 끝난 항목과 앞선 형제 요소 제거
+                        elem.clear()
+                        while elem.getprevious() is not None:
+                            del root[0]
             
-            # 사이트맵 인덱스
-            for sitemap in soup.find_all('sitemap'):
-                loc = sitemap.find('loc')
-                if loc:
-                    # 재귀적으로 하위 사이트맵 크롤링
-                    sub_urls = self.crawl_sitemap(loc.text)
-                    urls.extend(sub_urls)
+            if not is_index:
+                urls = locs
+            else:
+                # 사이트맵 인덱스: 재귀적으로 하위 사이트맵 크롤링
+                urls = []
+                for loc in locs:
+                    urls.extend(self.crawl_sitemap(loc))
             
             self.logger.info(f"Found {len(urls)} URLs in sitemap")
             return urls
-            
+        
         except Exception as e:
             self.logger.error(f"Error crawling sitemap {sitemap_url}: {e}")
             return []
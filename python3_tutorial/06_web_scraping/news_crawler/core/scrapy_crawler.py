@@ -247,13 +247,14 @@ class NewsSpider(scrapy.Spider):
         try:
             from scrapy.crawler import CrawlerProcess
             from scrapy.utils.project import get_project_settings
+            from itemadapter import ItemAdapter
             
             # 결과 저장용
             results = []
             
             class InMemoryPipeline:
                 def process_item(self, item, spider):
-                    results.append(dict(item))
+                    results.append(ItemAdapter(item).asdict())
                     return item
             
             # 설정
@@ -42,7 +42,7 @@ class SeleniumCrawler(BaseCrawler):
         self.window_size = window_size
         self.driver = None
         
-        self.parser = HTMLParser()
+        self.parser = HTMLParser.shared()
         self.anti_bot = AntiBot()
         
         # 드라이버 초기화
@@ -243,27 +243,21 @@ class SeleniumCrawler(BaseCrawler):
     
     def _extract_data(self, url: str, soup: BeautifulSoup, raw_html: str) -> CrawlResult:
         """HTML에서 데이터 추출"""
+        # 날짜 패턴은 페이지 소스 앞부분에서 찾는다
+        head = raw_html[:self.parser.HEAD_BYTES] if raw_html else None
+        
+        # 원본 HTML은 요청한 경우에만 결과에 남긴다
+        raw_html = raw_html if self.keep_raw_html else None
+        
         try:
-            # 기본 추출 (RequestsCrawler와 동일)
-            title = self.parser.extract_title(soup)
-            content = self.parser.extract_content(soup)
-            metadata = self.parser.extract_metadata(soup)
-            author = metadata.get('author')
-            published_date = self.parser.extract_date(soup, metadata)
-            images = self.parser.extract_images(soup, url)
-            links = self.parser.extract_links(soup, url)
+            # 제목, 본문, 메타데이터, 날짜, 이미지, 링크를 한 번에 추출
+            data = self.parser.extract_all(soup, url, head)
             
             return CrawlResult(
                 url=url,
-                title=title,
-                content=content,
-                author=author,
-                published_date=published_date,
-                images=images,
-                links=links,
-                metadata=metadata,
                 raw_html=raw_html,
-                success=True
+                success=True,
+                **data
             )
             
         except Exception as e:
@@ -73,7 +73,7 @@ async def example_news_extraction():
         "https://httpbin.org/html",  # 테스트용
     ]
     
-    crawler = RequestsCrawler()
+    crawler = RequestsCrawler(keep_raw_html=True)
     extractor = NewsExtractor()
     
     for url in news_urls:
@@ -17,7 +17,7 @@ class CommentExtractor:
     """댓글 추출기"""
     
     def __init__(self):
-        self.parser = HTMLParser()
+        self.parser = HTMLParser.shared()
         self.logger = logging.getLogger(self.__class__.__name__)
         
         # 댓글 영역 선택자
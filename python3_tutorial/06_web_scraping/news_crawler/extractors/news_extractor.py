@@ -17,7 +17,7 @@ class NewsExtractor:
     """뉴스 기사 추출기"""
     
     def __init__(self):
-        self.parser = HTMLParser()
+        self.parser = HTMLParser.shared()
         self.logger = logging.getLogger(self.__class__.__name__)
         
         # 뉴스 사이트별 선택자
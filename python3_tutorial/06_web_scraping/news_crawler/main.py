@@ -258,7 +258,8 @@ class NewsCrawlerCLI:
             'retry_count': args.retry,
             'delay': args.delay,
             'user_agent': user_agent,
-            'proxy': proxy
+            'proxy': proxy,
+            'keep_raw_html': True  # 추출기와 HTML 저장에서 사용
         }
         
         # 크롤러 타입별 생성
@@ -5,13 +5,45 @@
 
 import time
 import random
+import asyncio
 from typing import Dict, List, Optional
+from urllib.parse import urlparse
 import logging
 
 
 class AntiBot:
     """반크롤링 회피 헬퍼"""
     
+    class TokenBucket:
+        """토큰 버킷 속도 제한기 (asyncio용)
+        
+        초당 rate개씩 토큰이 차고 최대 burst개까지 쌓인다.
+        토큰이 있으면 바로 반환하고, 없으면 모자란 만큼만 비동기로 기다린다.
+        """
+        
+        def __init__(self, rate: float, burst: float = 1.0):
+            """
+            Args:
+                rate: 초당 토큰 충전 속도
+                burst: 버킷 용량 (한 번에 연속으로 보낼 수 있는 요청 수)
+            """
+            self.rate = rate
+            self.burst = burst
+            self.tokens = burst
+            self.last = time.monotonic()
+        
+        async def acquire(self) -> None:
+            """토큰 1개 획득"""
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            
+            # 기다릴 몫까지 await 전에 미리 차감하므로 대기 중에 다른 태스크가
+            # 들어와도 같은 토큰을 두 번 쓰지 않고, 도착 순서대로 뒤에 줄을 선다
+            self.tokens -= 1
+            if self.tokens < 0:
+                await asyncio.sleep(-self.tokens / self.rate)
+    
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
         
@@ -54,6 +86,9 @@ class AntiBot:
             'normal': (0.05, 0.15),
             'fast': (0.02, 0.08)
         }
+        
+        # 호스트(netloc)별 토큰 버킷
+        self.buckets: Dict[str, 'AntiBot.TokenBucket'] = {}
     
     def get_random_headers(self) -> Dict[str, str]:
         """랜덤 헤더 세트 반환"""
@@ -73,6 +108,27 @@ class AntiBot:
         variation = random.uniform(0.2, 0.5)
         return base_delay * (1 + variation)
     
+    def get_bucket(self, url: str, rate: float, burst: float = 1.0) -> 'AntiBot.TokenBucket':
+        """URL 호스트의 토큰 버킷 반환 (처음이면 생성)"""
+        host = urlparse(url).netloc
+        bucket = self.buckets.get(host)
+        
+        if bucket is None:
+            bucket = self.buckets[host] = self.TokenBucket(rate, burst)
+        
+        return bucket
+    
+    async def acquire(self, url: str, rate: float, burst: float = 1.0) -> None:
+        """호스트별 속도 제한 (비동기)
+        
+        random_delay처럼 요청마다 스레드를 재우지 않고,
+        토큰이 남아 있으면 기다리지 않고 바로 반환한다.
+        """
+        if rate <= 0:
+            return
+        
+        await self.get_bucket(url, rate, burst).acquire()
+    
     def human_like_scroll(self, driver) -> None:
         """인간처럼 스크롤 (Selenium용)"""
         current_position = 0
@@ -116,28 +172,75 @@ class AntiBot:
         
         action_chains.perform()
     
+    # 입력창 값에 덧붙이고 input 이벤트를 발생시키는 스크립트 (청크당 WebDriver 호출 1회)
+    _APPEND_TEXT_JS = (
+        "arguments[0].value += arguments[1];"
+        "arguments[0].dispatchEvent(new Event('input', {bubbles: true}));"
+    )
+    
+    # 오타 입력 -> 잠시 후 지우고 나머지 입력을 브라우저 타이머로 처리 (execute_async_script 1회)
+    _TYPO_JS = (
+        "const [el, before, wrong, after, typoDelay, fixDelay, done] = arguments;"
+        "const put = (value) => {"
+        "  el.value = value;"
+        "  el.dispatchEvent(new Event('input', {bubbles: true}));"
+        "};"
+        "put(el.value + before);"
+        "setTimeout(() => {"
+        "  put(el.value + wrong);"
+        "  setTimeout(() => { put(el.value.slice(0, -1) + after); done(); }, fixDelay);"
+        "}, typoDelay);"
+    )
+    
     def human_like_typing(self, element, text: str, speed: str = 'normal') -> None:
-        """인간처럼 타이핑 (Selenium용)"""
+        """인간처럼 타이핑 (Selenium용)
+        
+        글자마다 send_keys를 부르면 키 입력 하나가 WebDriver 왕복 한 번이므로
+        5~10글자씩 묶어 execute_script 한 번으로 입력하고, 지연은 청크 단위로 준다.
+        """
         min_delay, max_delay = self.typing_patterns[speed]
+        driver = element.parent
         
-        for char in text:
-            element.send_keys(char)
+        position = 0
+        while position < len(text):
+            chunk = text[position:position + random.randint(5, 10)]
+            position += len(chunk)
+            
+            # 가끔 오타 시뮬레이션 (글자당 2% 확률을 청크 단위로 환산)
+            if random.random() < 0.02 * len(chunk):
+                self._type_with_typo(element, chunk, min_delay, max_delay)
+                continue
+            
+            driver.execute_script(self._APPEND_TEXT_JS, element, chunk)
             
             # 타이핑 속도 변화
-            delay = random.uniform(min_delay, max_delay)
+            delay = random.uniform(min_delay * len(chunk), max_delay * len(chunk))
             
             # 가끔 더 긴 지연 (생각하는 중)
             if random.random() < 0.1:
-                delay *= random.uniform(2, 4)
+                delay += random.uniform(min_delay, max_delay) * random.uniform(1, 3)
             
             time.sleep(delay)
-            
-            # 가끔 오타 시뮬레이션
-            if random.random() < 0.02:
-                wrong_char = random.choice('abcdefghijklmnopqrstuvwxyz')
-                element.send_keys(wrong_char)
-                time.sleep(random.uniform(0.1, 0.3))
-                element.send_keys('\b')  # 백스페이스
+    
+    def _type_with_typo(self, element, chunk: str, min_delay: float, max_delay: float) -> None:
+        """청크를 입력하면서 한 번 오타를 내고 지우기
+        
+        오타 입력, 대기, 지우기, 나머지 입력을 스크립트 하나로 보내
+        글자마다 send_keys를 부르던 것(청크 길이 + 2회)을 WebDriver 호출 1회로 줄인다.
+        """
+        typo_at = random.randrange(len(chunk))
+        before, after = chunk[:typo_at + 1], chunk[typo_at + 1:]
+        wrong_char = random.choice('abcdefghijklmnopqrstuvwxyz')
+        
+        # 브라우저 쪽 대기 시간 (ms): 오타 전까지의 타이핑, 오타를 알아채는 시간
+        typo_delay = random.uniform(min_delay * len(before), max_delay * len(before)) * 1000
+        fix_delay = random.uniform(0.1, 0.3) * 1000
+        
+        element.parent.execute_async_script(
+            self._TYPO_JS, element, before, wrong_char, after, typo_delay, fix_delay
+        )
+        
+        time.sleep(random.uniform(min_delay * len(after), max_delay * len(after)))
     
     def check_bot_detection(self, driver) -> bool:
         """봇 탐지 확인 (Selenium용)"""
@@ -203,9 +306,20 @@ class AntiBot:
         # 일정 요청 수 이상이면 프록시 사용 권장
         return request_count >= threshold
     
-    def calculate_backoff(self, attempt: int, base_delay: float = 1.0) -> float:
-        """지수 백오프 계산"""
-        # 2^attempt * base_delay + 랜덤 지터
-        delay = (2 ** attempt) * base_delay
-        jitter = random.uniform(0, delay * 0.1)
-        return delay + jitter
\ No newline at end of file
+    def calculate_backoff(self, attempt: int, base_delay: float = 1.0,
+                          cap: float = 60.0, prev: Optional[float] = None) -> float:
+        """지수 백오프 계산 (decorrelated jitter)
+        
+        sleep = min(cap, uniform(base_delay, prev * 3))
+        대기 시간이 이전 값에서 무작위로 퍼지므로 동시에 실패한 요청들이
+        같은 순간에 다시 몰리지 않는다.
+        
+        prev는 호출한 쪽이 직전에 받은 반환값이다. 상태를 인스턴스에 두지 않으므로
+        여러 요청이 동시에 재시도해도 서로의 대기 시간에 섞이지 않는다.
+        prev가 없으면 attempt로 이전 대기 시간을 base_delay * 2**attempt로 추정한다.
+        """
+        if prev is None:
+            # 지수를 제한해 attempt가 커도 float 오버플로가 나지 않게 한다
+            prev = min(cap, base_delay * 2.0 ** min(max(attempt, 0), 64))
+        
+        return min(cap, random.uniform(base_delay, prev * 3))
\ No newline at end of file
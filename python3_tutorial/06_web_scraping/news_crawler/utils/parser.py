@@ -4,29 +4,346 @@ HTML 파싱 유틸리티
 """
 
 import re
-from typing import List, Dict, Optional, Any
+import json
+import codecs
+import functools
+import itertools
+import threading
+from typing import List, Dict, Optional, Any, Callable, Tuple, Iterable
 from datetime import datetime
 from urllib.parse import urljoin, urlparse
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, Tag, UnicodeDammit
+from bs4.dammit import EncodingDetector
+from lxml import etree
 import dateutil.parser
 import logging
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # selectolax 미설치 시 BeautifulSoup 경로만 사용
+    LexborHTMLParser = None
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    json_loads = json.loads
+
+try:
+    import ciso8601
+except ImportError:  # ciso8601 미설치 시 dateutil만 사용
+    ciso8601 = None
+
+try:
+    import hyperscan
+except ImportError:  # hyperscan 미설치 시 re로 검색
+    hyperscan = None
+
+
+# 정규식은 모듈 로드 시 한 번만 컴파일
+_OG_META_RE = re.compile(r'^og:')
+_TW_META_RE = re.compile(r'^twitter:')
+_CONTENT_RE = re.compile('content|article|body|text', re.I)
+_AUTHOR_CLASS_RE = re.compile('author|byline|by', re.I)
+_AUTHOR_PREFIX_RE = re.compile(r'^(by|작성자)\s*:?\s*', re.I)
+_WS_RE = re.compile(r'\s+')
+
+_DATE_PATTERNS = (
+    r'\d{4}[-/]\d{1,2}[-/]\d{1,2}',  # 2024-01-15
+    r'\d{1,2}[-/]\d{1,2}[-/]\d{4}',  # 01/15/2024
+    r'\d{4}년\s*\d{1,2}월\s*\d{1,2}일',  # 2024년 1월 15일
+)
+_DATE_RES = tuple(re.compile(pattern) for pattern in _DATE_PATTERNS)
+
+# 제거할 태그들
+_REMOVE_TAGS = ('script', 'style', 'noscript', 'iframe', 'svg')
+
+# 컨텐츠로 간주하지 않을 클래스/ID 패턴
+_EXCLUDE_PATTERNS = (
+    'sidebar', 'menu', 'nav', 'header', 'footer',
+    'advertisement', 'banner', 'popup', 'modal',
+    'related', 'share', 'social', 'comment'
+)
+
+
+class _Patterns:
+    """태그/패턴 목록으로 만든 검색 구조
+    
+    hyperscan DB 컴파일이 파서 생성 비용의 대부분이므로 모듈 로드 시 한 번만 만들고
+    모든 HTMLParser 인스턴스와 스레드가 같이 쓴다 (fork한 워커는 부모의 것을 물려받는다).
+    """
+    
+    __slots__ = ('remove_names', 'unwanted_css', 'exclude_re', 'hs_db', 'hs_local')
+    
+    def __init__(self):
+        # BeautifulSoup은 태그 이름 집합 + 패턴, lexbor는 CSS 선택자 하나로 검사
+        self.remove_names = frozenset(_REMOVE_TAGS)
+        self.unwanted_css = ', '.join(_REMOVE_TAGS + tuple(
+            f'[class*="{pattern}" i], [id*="{pattern}" i]'
+            for pattern in _EXCLUDE_PATTERNS
+        ))
+        self.exclude_re = re.compile(
+            '|'.join(f'(?:{pattern})' for pattern in _EXCLUDE_PATTERNS), re.I
+        )
+        
+        # hyperscan이 있으면 제외 패턴과 날짜 패턴을 DB 하나로 컴파일해 한 번에 스캔
+        self.hs_db = self._compile_hyperscan() if hyperscan is not None else None
+        self.hs_local = threading.local()  # 스레드별 scratch
+    
+    @staticmethod
+    def _compile_hyperscan() -> Any:
+        """제외 패턴(id 0..n-1)과 날짜 패턴(id n..)을 하나의 hyperscan DB로 컴파일"""
+        exclude_flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH
+        date_flags = hyperscan.HS_FLAG_SOM_LEFTMOST | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+        patterns = _EXCLUDE_PATTERNS + _DATE_PATTERNS
+        flags = [exclude_flags] * len(_EXCLUDE_PATTERNS) + [date_flags] * len(_DATE_PATTERNS)
+        
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[pattern.encode('utf-8') for pattern in patterns],
+            ids=list(range(len(patterns))),
+            elements=len(patterns),
+            flags=flags
+        )
+        return db
+    
+    def hs_scan(self, data: bytes, on_match: Callable) -> None:
+        """hyperscan 스캔 (scratch는 스레드마다 따로 둔다)"""
+        scratch = getattr(self.hs_local, 'scratch', None)
+        if scratch is None:
+            scratch = self.hs_local.scratch = hyperscan.Scratch(self.hs_db)
+        self.hs_db.scan(data, match_event_handler=on_match, scratch=scratch)
+
+
+_PATTERNS = _Patterns()
+
 
 class HTMLParser:
-    """HTML 파싱 헬퍼"""
+    """HTML 파싱 헬퍼
+    
+    상태가 없으므로 크롤러와 추출기는 shared()로 인스턴스 하나를 같이 쓴다.
+    """
+    
+    __slots__ = ('logger',)
+    
+    # 제거할 태그와 컨텐츠가 아닌 클래스/ID 패턴 (검색 구조는 _PATTERNS에 있다)
+    remove_tags = _REMOVE_TAGS
+    exclude_patterns = _EXCLUDE_PATTERNS
+    
+    # 메타데이터로 가져올 일반 메타 태그 이름
+    META_NAMES = ('author', 'description', 'keywords', 'publisher', 'robots')
+    
+    # 날짜 패턴을 찾을 응답 앞부분 크기 (바이트)
+    HEAD_BYTES = 4096
+    
+    _shared: Optional['HTMLParser'] = None
+    
+    @classmethod
+    def shared(cls) -> 'HTMLParser':
+        """공유 인스턴스 반환"""
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
     
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
+    
+    @property
+    def lexbor_available(self) -> bool:
+        return LexborHTMLParser is not None
+    
+    @property
+    def hyperscan_available(self) -> bool:
+        return _PATTERNS.hs_db is not None
+    
+    def parse(self, content: bytes) -> Tuple[Any, Optional[str]]:
+        """응답 바이트를 한 번 파싱해 (문서, 인코딩) 반환
         
-        # 제거할 태그들
-        self.remove_tags = ['script', 'style', 'noscript', 'iframe', 'svg']
+        selectolax가 있으면 C로 구현된 lexbor 트리를, 없으면 BeautifulSoup(lxml)을 만든다.
+        lexbor는 메타 charset을 보지 않으므로 디코딩은 UnicodeDammit이 맡는다.
         
-        # 컨텐츠로 간주하지 않을 클래스/ID 패턴
-        self.exclude_patterns = [
-            'sidebar', 'menu', 'nav', 'header', 'footer',
-            'advertisement', 'banner', 'popup', 'modal',
-            'related', 'share', 'social', 'comment'
-        ]
+        parse_only(SoupStrainer)는 쓰지 않는다. 걸러진 nav/footer 같은 컨테이너 안의 링크가
+        부모 없이 남아 _remove_unwanted_tags가 지우지 못하기 때문이다.
+        """
+        if LexborHTMLParser is None:
+            soup = BeautifulSoup(content, 'lxml')
+            return soup, soup.original_encoding
+        
+        dammit = UnicodeDammit(content, is_html=True)
+        return LexborHTMLParser(dammit.unicode_markup or ''), dammit.original_encoding
+    
+    def head_text(self, content: bytes, encoding: Optional[str] = None) -> str:
+        """날짜 패턴 검색용 응답 앞부분 (HEAD_BYTES만 디코딩)"""
+        return content[:self.HEAD_BYTES].decode(encoding or 'utf-8', errors='replace')
+    
+    def extract_all(self, soup: Any, base_url: str, head: Optional[str] = None) -> Dict[str, Any]:
+        """제목, 본문, 작성자, 날짜, 이미지, 링크, 메타데이터를 한 번에 추출
+        
+        메타데이터는 한 번만 추출해서 작성자와 날짜 추출에 같이 쓴다.
+        extract_content가 불필요한 태그를 지우므로 호출 순서는 유지한다.
+        parse()가 만든 lexbor 트리도 받는다.
+        head(head_text()로 만든 응답 앞부분)를 주면 날짜 패턴은 문서를 다시 직렬화하지 않고 여기서 찾는다.
+        """
+        if LexborHTMLParser is not None and isinstance(soup, LexborHTMLParser):
+            return self._extract_all_lexbor(soup, base_url, head)
+        
+        title = self.extract_title(soup)
+        content = self.extract_content(soup)
+        metadata = self.extract_metadata(soup)
+        
+        return {
+            'title': title,
+            'content': content,
+            'author': metadata.get('author'),
+            'published_date': self.extract_date(soup, metadata, head),
+            'images': self.extract_images(soup, base_url),
+            'links': self.extract_links(soup, base_url),
+            'metadata': metadata,
+        }
+    
+    def extract_from_stream(self,
+                            chunks: Iterable[bytes],
+                            base_url: str,
+                            encoding: Optional[str] = None) -> Dict[str, Any]:
+        """응답 청크를 lxml HTMLPullParser로 흘려 보내며 제목, 메타데이터, 날짜, 링크 추출
+        
+        전체 트리를 만들지 않고, 처리가 끝난 요소는 바로 지워 메모리를 일정하게 유지한다.
+        본문과 이미지는 추출하지 않으므로 링크와 제목만 필요한 목록 페이지용이다.
+        결과 키와 추출 규칙은 extract_all과 같다 (content/images 제외).
+        extract_all이 본문 추출 전에 지우는 요소(remove_tags, 제외 패턴에 걸리는 클래스/ID)
+        안의 메타, 링크, time, article은 건너뛴다. 제목은 extract_all처럼 지우기 전 기준이다.
+        extract_all처럼 script는 보지 않으므로 JSON-LD는 메타데이터에 들어가지 않는다.
+        """
+        # 문서 앞부분을 먼저 모아 메타 charset으로 인코딩 판단 (없으면 UTF-8)
+        chunks = iter(chunks)
+        head = b''
+        for chunk in chunks:
+            head += chunk
+            if len(head) >= 4096:
+                break
+        
+        encoding = encoding or EncodingDetector.find_declared_encoding(head, is_html=True) or 'utf-8'
+        try:
+            codecs.lookup(encoding)
+        except LookupError:
+            encoding = 'utf-8'
+        
+        parser = etree.HTMLPullParser(events=('start', 'end'), encoding=encoding)
+        
+        og_tags, twitter_tags, named_tags = {}, {}, {}
+        og_title = time_value = None
+        links, article_links = {}, {}
+        article = None  # 첫 번째 article (extract_title의 article 내 제목)
+        article_done = False
+        kept_article = None  # 지워지지 않는 첫 번째 article (extract_links는 이 안의 링크만 사용)
+        kept_article_done = False
+        unwanted_depth = 0  # 지워질 요소 안에 있는 동안 열린 요소 수
+        
+        # 문서 순서상 첫 title, 첫 h1, 첫 article 안의 첫 h1/h2 (끝 태그에서 텍스트를 읽는다)
+        targets: Dict[str, Any] = {}
+        texts: Dict[str, str] = {}
+        capture_depth = 0  # 이 요소들 안에 있는 동안은 자식을 지우지 않는다
+        
+        for chunk in itertools.chain((head,), chunks):
+            parser.feed(chunk)
+            
+            for event, elem in parser.read_events():
+                tag = elem.tag
+                
+                if event == 'start':
+                    if unwanted_depth or self._matches_unwanted(tag, elem.get('class'), elem.get('id')):
+                        unwanted_depth += 1  # 안의 메타, 링크, time, article은 보지 않는다
+                    elif tag == 'meta':
+                        attrs = elem.attrib
+                        prop, name, content = attrs.get('property'), attrs.get('name'), attrs.get('content')
+                        if prop == 'og:title' and og_title is None:
+                            og_title = content or ''
+                        if prop and prop.startswith('og:') and content:
+                            og_tags[f"og_{prop.replace('og:', '')}"] = content
+                        if name and name.startswith('twitter:') and content:
+                            twitter_tags[f"twitter_{name.replace('twitter:', '')}"] = content
+                        if name in self.META_NAMES and name not in named_tags:
+                            named_tags[name] = content
+                    elif tag == 'a':
+                        href = elem.get('href')
+                        if href is not None and not (href.startswith('#') or href.startswith('javascript:')):
+                            normalized_url = self._normalize_url(href, base_url)
+                            if normalized_url:
+                                links[normalized_url] = None
+                                if kept_article is not None and not kept_article_done:
+                                    article_links[normalized_url] = None
+                    elif tag == 'time' and time_value is None:
+                        time_value = elem.get('datetime') or ''
+                    elif tag == 'article' and kept_article is None:
+                        kept_article = elem
+                    
+                    if tag == 'article' and article is None:
+                        article = elem
+                    
+                    if tag in ('title', 'h1', 'h2'):
+                        captured = False
+                        if tag != 'h2' and tag not in targets:
+                            targets[tag] = elem
+                            captured = True
+                        if (tag != 'title' and 'heading' not in targets
+                                and article is not None and not article_done):
+                            targets['heading'] = elem
+                            captured = True
+                        if captured:
+                            capture_depth += 1
+                    continue
+                
+                # end 이벤트: 텍스트가 필요한 요소 처리
+                if unwanted_depth:
+                    unwanted_depth -= 1
+                
+                if tag in ('title', 'h1', 'h2'):
+                    roles = [role for role, target in targets.items()
+                             if target is elem and role not in texts]
+                    if roles:
+                        text = ''.join(elem.itertext())
+                        for role in roles:
+                            texts[role] = text
+                        capture_depth -= 1
+                
+                if elem is article:
+                    article_done = True
+                if elem is kept_article:
+                    kept_article_done = True
+                
+                if capture_depth == 0:
+                    # 처리가 끝난 요소와 앞선 형제 요소 제거
+                    elem.clear()
+                    parent = elem.getparent()
+                    while parent is not None and elem.getprevious() is not None:
+                        del parent[0]
+        
+        try:
+            parser.close()
+        except etree.XMLSyntaxError:  # 빈 문서
+            pass
+        
+        # 날짜 패턴 검색용 문서 상단
+        head_text = self.head_text(head, encoding)
+        
+        # extract_metadata와 같은 키 순서 (og, twitter, 일반 메타)
+        metadata = {**og_tags, **twitter_tags}
+        for name in self.META_NAMES:
+            if named_tags.get(name):
+                metadata[name] = named_tags[name]
+        
+        # extract_title과 같은 우선순위
+        if og_title:
+            title = og_title
+        else:
+            title = texts.get('title', texts.get('h1', texts.get('heading')))
+        
+        return {
+            'title': self._clean_text(title) if title is not None else None,
+            'author': metadata.get('author'),
+            'published_date': self._find_date(time_value, metadata, lambda: head_text),
+            'links': list(article_links) if kept_article is not None else list(links),
+            'metadata': metadata,
+        }
     
     def extract_title(self, soup: BeautifulSoup) -> Optional[str]:
         """제목 추출"""
@@ -66,8 +383,8 @@ class HTMLParser:
         
         # 2. 본문 관련 클래스/ID
         content_selectors = [
-            {'class': re.compile('content|article|body|text', re.I)},
-            {'id': re.compile('content|article|body|text', re.I)},
+            {'class': _CONTENT_RE},
+            {'id': _CONTENT_RE},
             {'itemprop': 'articleBody'},
             {'role': 'main'}
         ]
@@ -107,22 +424,21 @@ class HTMLParser:
         metadata = {}
         
         # Open Graph 메타 태그
-        og_tags = soup.find_all('meta', property=re.compile('^og:'))
+        og_tags = soup.find_all('meta', property=_OG_META_RE)
         for tag in og_tags:
             if tag.get('content'):
                 key = tag['property'].replace('og:', '')
                 metadata[f'og_{key}'] = tag['content']
         
         # Twitter 메타 태그
-        twitter_tags = soup.find_all('meta', attrs={'name': re.compile('^twitter:')})
+        twitter_tags = soup.find_all('meta', attrs={'name': _TW_META_RE})
         for tag in twitter_tags:
             if tag.get('content'):
                 key = tag['name'].replace('twitter:', '')
                 metadata[f'twitter_{key}'] = tag['content']
         
         # 일반 메타 태그
-        meta_names = ['author', 'description', 'keywords', 'publisher', 'robots']
-        for name in meta_names:
+        for name in self.META_NAMES:
             tag = soup.find('meta', attrs={'name': name})
             if tag and tag.get('content'):
                 metadata[name] = tag['content']
@@ -131,21 +447,36 @@ class HTMLParser:
         json_ld = soup.find('script', type='application/ld+json')
         if json_ld:
             try:
-                import json
-                ld_data = json.loads(json_ld.string)
+                ld_data = json_loads(json_ld.string)
                 metadata['json_ld'] = ld_data
             except:
                 pass
         
         return metadata
     
-    def extract_date(self, soup: BeautifulSoup, metadata: Dict[str, Any]) -> Optional[datetime]:
-        """날짜 추출"""
-        # 1. time 태그
+    def extract_date(self,
+                     soup: BeautifulSoup,
+                     metadata: Dict[str, Any],
+                     head: Optional[str] = None) -> Optional[datetime]:
+        """날짜 추출 (head가 없으면 문서를 직렬화한 상단 부분에서 패턴 검색)"""
         time_tag = soup.find('time')
-        if time_tag and time_tag.get('datetime'):
+        
+        return self._find_date(
+            time_tag.get('datetime') if time_tag else None,
+            metadata,
+            # 상단 부분만 검색 (formatter=None: 엔티티 이스케이프 없이 직렬화)
+            lambda: head if head is not None else soup.decode(formatter=None)[:1000]
+        )
+    
+    def _find_date(self,
+                   time_value: Optional[str],
+                   metadata: Dict[str, Any],
+                   head_text: Callable[[], str]) -> Optional[datetime]:
+        """time 태그 값, 메타데이터, 문서 상단 텍스트 순으로 날짜 찾기"""
+        # 1. time 태그
+        if time_value:
             try:
-                return dateutil.parser.parse(time_tag['datetime'])
+                return self._parse_iso_date(time_value)
             except:
                 pass
         
@@ -158,29 +489,59 @@ class HTMLParser:
         for key in date_keys:
             if key in metadata:
                 try:
-                    return dateutil.parser.parse(metadata[key])
+                    return self._parse_iso_date(metadata[key])
                 except:
                     pass
         
         # 3. 텍스트에서 날짜 패턴 찾기
-        date_patterns = [
-            r'\d{4}[-/]\d{1,2}[-/]\d{1,2}',  # 2024-01-15
-            r'\d{1,2}[-/]\d{1,2}[-/]\d{4}',  # 01/15/2024
-            r'\d{4}년\s*\d{1,2}월\s*\d{1,2}일',  # 2024년 1월 15일
-        ]
+        text = head_text()
         
-        text = str(soup)[:1000]  # 상단 부분만 검색
-        
-        for pattern in date_patterns:
-            match = re.search(pattern, text)
-            if match:
-                try:
-                    return dateutil.parser.parse(match.group())
-                except:
-                    pass
+        for candidate in self._search_dates(text):
+            try:
+                return dateutil.parser.parse(candidate)
+            except:
+                pass
         
         return None
     
+    def _search_dates(self, text: str) -> List[str]:
+        """날짜 패턴 순서대로 각 패턴의 첫 매치 문자열 반환"""
+        if _PATTERNS.hs_db is None:
+            matches = (pattern.search(text) for pattern in _DATE_RES)
+            return [match.group() for match in matches if match]
+        
+        # 패턴별로 가장 왼쪽 시작점, 같은 시작점이면 가장 긴 매치 (re.search와 같은 결과)
+        offset = len(_EXCLUDE_PATTERNS)
+        spans: Dict[int, Tuple[int, int]] = {}
+        
+        def on_match(pattern_id, start, end, flags, context):
+            if pattern_id < offset:
+                return
+            span = spans.get(pattern_id)
+            if span is None or start < span[0] or (start == span[0] and end > span[1]):
+                spans[pattern_id] = (start, end)
+        
+        data = text.encode('utf-8', 'replace')
+        _PATTERNS.hs_scan(data, on_match)
+        
+        return [
+            data[start:end].decode('utf-8')
+            for _, (start, end) in sorted(spans.items())
+        ]
+    
+    def _parse_iso_date(self, value: str) -> datetime:
+        """ISO 8601 값은 ciso8601(C)로, 그 밖의 형식은 dateutil로 파싱
+        
+        time 태그와 메타 태그 값은 대부분 ISO 8601이다.
+        """
+        if ciso8601 is not None:
+            try:
+                return ciso8601.parse_datetime(value)
+            except ValueError:
+                pass
+        
+        return dateutil.parser.parse(value)
+    
     def extract_author(self, soup: BeautifulSoup) -> Optional[str]:
         """작성자 추출"""
         # 1. 메타 태그
@@ -190,7 +551,7 @@ class HTMLParser:
         
         # 2. 작성자 관련 클래스/속성
         author_selectors = [
-            {'class': re.compile('author|byline|by', re.I)},
+            {'class': _AUTHOR_CLASS_RE},
             {'itemprop': 'author'},
             {'rel': 'author'}
         ]
@@ -200,7 +561,7 @@ class HTMLParser:
             if element:
                 text = self._clean_text(element.text)
                 # "By " 제거
-                text = re.sub(r'^(by|작성자)\s*:?\s*', '', text, flags=re.I)
+                text = _AUTHOR_PREFIX_RE.sub('', text)
                 if text and len(text) < 100:  # 너무 긴 텍스트는 제외
                     return text
         
@@ -208,12 +569,12 @@ class HTMLParser:
     
     def extract_images(self, soup: BeautifulSoup, base_url: str) -> List[str]:
         """이미지 URL 추출"""
-        images = []
+        images = {}  # 삽입 순서를 유지하는 중복 제거용 dict
         
         # 1. og:image
         og_image = soup.find('meta', property='og:image')
         if og_image and og_image.get('content'):
-            images.append(self._normalize_url(og_image['content'], base_url))
+            images[self._normalize_url(og_image['content'], base_url)] = None
         
         # 2. article 내 이미지
         article = soup.find('article') or soup
@@ -222,8 +583,8 @@ class HTMLParser:
             src = img.get('src') or img.get('data-src') or img.get('data-lazy-src')
             if src:
                 normalized_url = self._normalize_url(src, base_url)
-                if normalized_url and normalized_url not in images:
-                    images.append(normalized_url)
+                if normalized_url:
+                    images[normalized_url] = None
         
         # 3. picture 태그 내 source
         for picture in article.find_all('picture'):
@@ -233,14 +594,14 @@ class HTMLParser:
                 srcset = source['srcset'].split(',')[0]
                 url = srcset.split()[0]
                 normalized_url = self._normalize_url(url, base_url)
-                if normalized_url and normalized_url not in images:
-                    images.append(normalized_url)
+                if normalized_url:
+                    images[normalized_url] = None
         
-        return images
+        return list(images)
     
     def extract_links(self, soup: BeautifulSoup, base_url: str) -> List[str]:
         """링크 추출"""
-        links = []
+        links = {}  # 삽입 순서를 유지하는 중복 제거용 dict
         
         article = soup.find('article') or soup
         
@@ -252,27 +613,236 @@ class HTMLParser:
                 continue
             
             normalized_url = self._normalize_url(href, base_url)
-            if normalized_url and normalized_url not in links:
-                links.append(normalized_url)
+            if normalized_url:
+                links[normalized_url] = None
         
-        return links
+        return list(links)
     
-    def _remove_unwanted_tags(self, soup: BeautifulSoup):
-        """불필요한 태그 제거"""
-        # 스크립트, 스타일 등 제거
-        for tag_name in self.remove_tags:
-            for tag in soup.find_all(tag_name):
-                tag.decompose()
-        
-        # 광고, 네비게이션 등 제거
-        for pattern in self.exclude_patterns:
-            # 클래스로 찾기
-            for tag in soup.find_all(class_=re.compile(pattern, re.I)):
-                tag.decompose()
+    # ---- lexbor(selectolax) 경로: BeautifulSoup 메서드와 같은 규칙을 CSS 선택자로 수행 ----
+    
+    def _extract_all_lexbor(self, tree: Any, base_url: str, head: Optional[str] = None) -> Dict[str, Any]:
+        """lexbor 트리에서 extract_all과 같은 필드 추출"""
+        title = self._lexbor_title(tree)
+        content = self._lexbor_content(tree)
+        metadata = self._lexbor_metadata(tree)
+        
+        time_tag = tree.css_first('time')
+        published_date = self._find_date(
+            time_tag.attributes.get('datetime') if time_tag else None,
+            metadata,
+            lambda: head if head is not None else tree.html[:1000]
+        )
+        
+        # 이미지와 링크는 article 안에서만 (없으면 문서 전체)
+        scope = tree.css_first('article') or tree.root
+        
+        return {
+            'title': title,
+            'content': content,
+            'author': metadata.get('author'),
+            'published_date': published_date,
+            'images': self._lexbor_images(tree, scope, base_url),
+            'links': self._lexbor_links(scope, base_url),
+            'metadata': metadata,
+        }
+    
+    def _lexbor_title(self, tree: Any) -> Optional[str]:
+        """제목 추출 (extract_title과 같은 우선순위)"""
+        og_title = tree.css_first('meta[property="og:title"]')
+        if og_title and og_title.attributes.get('content'):
+            return self._clean_text(og_title.attributes['content'])
+        
+        for selector in ('title', 'h1'):
+            node = tree.css_first(selector)
+            if node:
+                return self._clean_text(node.text())
+        
+        article = tree.css_first('article')
+        if article:
+            title = article.css_first('h1, h2')
+            if title:
+                return self._clean_text(title.text())
+        
+        return None
+    
+    def _lexbor_content(self, tree: Any) -> Optional[str]:
+        """본문 추출 (extract_content와 같은 순서)"""
+        # 불필요한 태그와 클래스/ID 패턴을 선택자 하나로 찾고
+        # 자식이 부모보다 먼저 지워지도록 문서 역순으로 제거
+        for node in reversed(tree.css(_PATTERNS.unwanted_css)):
+            node.decompose()
+        
+        # 1. article 태그
+        article = tree.css_first('article')
+        if article:
+            return self._lexbor_text_from_element(article)
+        
+        # 2. 본문 관련 클래스/ID
+        candidates = tree.css('div, section, main')
+        content_checks = [
+            lambda attrs: _CONTENT_RE.search(attrs.get('class') or ''),
+            lambda attrs: _CONTENT_RE.search(attrs.get('id') or ''),
+            lambda attrs: attrs.get('itemprop') == 'articleBody',
+            lambda attrs: attrs.get('role') == 'main'
+        ]
+        
+        for check in content_checks:
+            element = next((node for node in candidates if check(node.attributes)), None)
+            if element:
+                text = self._lexbor_text_from_element(element)
+                if len(text) > 100:  # 최소 길이 확인
+                    return text
+        
+        # 3. 가장 긴 텍스트 블록 찾기
+        paragraphs = tree.css('p')
+        if paragraphs:
+            text_blocks = []
+            current_block = []
+            
+            for p in paragraphs:
+                text = self._clean_text(p.text())
+                if len(text) > 20:
+                    current_block.append(text)
+                elif current_block:
+                    text_blocks.append('\n'.join(current_block))
+                    current_block = []
+            
+            if current_block:
+                text_blocks.append('\n'.join(current_block))
+            
+            if text_blocks:
+                return max(text_blocks, key=len)
+        
+        return None
+    
+    def _lexbor_text_from_element(self, element: Any) -> str:
+        """요소에서 텍스트 추출 (_extract_text_from_element와 같은 규칙)"""
+        paragraphs = []
+        
+        for node in element.css('p, div, section'):
+            # lexbor의 css()는 요소 자신도 포함하므로 건너뛴다
+            if node.mem_id == element.mem_id:
+                continue
+            
+            text = self._clean_text(node.text())
+            if len(text) > 20:  # 최소 길이
+                paragraphs.append(text)
+        
+        if not paragraphs:
+            text = self._clean_text(element.text())
+            if text:
+                paragraphs = [text]
+        
+        return '\n\n'.join(paragraphs)
+    
+    def _lexbor_metadata(self, tree: Any) -> Dict[str, Any]:
+        """메타데이터 추출 (extract_metadata와 같은 키)"""
+        metadata = {}
+        
+        for tag in tree.css('meta[property^="og:"]'):
+            attrs = tag.attributes
+            if attrs.get('content'):
+                key = attrs['property'].replace('og:', '')
+                metadata[f'og_{key}'] = attrs['content']
+        
+        for tag in tree.css('meta[name^="twitter:"]'):
+            attrs = tag.attributes
+            if attrs.get('content'):
+                key = attrs['name'].replace('twitter:', '')
+                metadata[f'twitter_{key}'] = attrs['content']
+        
+        for name in self.META_NAMES:
+            tag = tree.css_first(f'meta[name="{name}"]')
+            if tag and tag.attributes.get('content'):
+                metadata[name] = tag.attributes['content']
+        
+        json_ld = tree.css_first('script[type="application/ld+json"]')
+        if json_ld:
+            try:
+                metadata['json_ld'] = json_loads(json_ld.text())
+            except:
+                pass
+        
+        return metadata
+    
+    def _lexbor_images(self, tree: Any, scope: Any, base_url: str) -> List[str]:
+        """이미지 URL 추출 (extract_images와 같은 순서)"""
+        images = {}
+        
+        og_image = tree.css_first('meta[property="og:image"]')
+        if og_image and og_image.attributes.get('content'):
+            images[self._normalize_url(og_image.attributes['content'], base_url)] = None
+        
+        for img in scope.css('img'):
+            attrs = img.attributes
+            src = attrs.get('src') or attrs.get('data-src') or attrs.get('data-lazy-src')
+            if src:
+                normalized_url = self._normalize_url(src, base_url)
+                if normalized_url:
+                    images[normalized_url] = None
+        
+        for picture in scope.css('picture'):
+            source = picture.css_first('source')
+            if source and source.attributes.get('srcset'):
+                srcset = source.attributes['srcset'].split(',')[0]
+                url = srcset.split()[0]
+                normalized_url = self._normalize_url(url, base_url)
+                if normalized_url:
+                    images[normalized_url] = None
+        
+        return list(images)
+    
+    def _lexbor_links(self, scope: Any, base_url: str) -> List[str]:
+        """링크 추출 (extract_links와 같은 규칙)"""
+        links = {}
+        
+        for a in scope.css('a[href]'):
+            href = a.attributes.get('href') or ''
             
-            # ID로 찾기
-            for tag in soup.find_all(id=re.compile(pattern, re.I)):
-                tag.decompose()
+            # 앵커 링크, 자바스크립트 제외
+            if href.startswith('#') or href.startswith('javascript:'):
+                continue
+            
+            normalized_url = self._normalize_url(href, base_url)
+            if normalized_url:
+                links[normalized_url] = None
+        
+        return list(links)
+    
+    def _remove_unwanted_tags(self, soup: BeautifulSoup):
+        """불필요한 태그 제거
+        
+        스크립트, 스타일 등과 광고, 네비게이션 등을 태그/패턴마다 트리를 도는 대신 한 번 순회로 찾는다.
+        """
+        for tag in soup.find_all(self._is_unwanted):
+            tag.decompose()
+    
+    def _is_unwanted(self, tag: Tag) -> bool:
+        """제거할 태그이거나 클래스/ID가 제외 패턴에 걸리는지 확인"""
+        return self._matches_unwanted(tag.name, tag.get('class'), tag.get('id'))
+    
+    def _matches_unwanted(self, name: str, classes: Any, tag_id: Optional[str]) -> bool:
+        """태그 이름과 class(문자열 또는 리스트), id로 제거 대상인지 확인"""
+        if name in _PATTERNS.remove_names:
+            return True
+        
+        if not classes and not tag_id:
+            return False
+        
+        if isinstance(classes, list):
+            classes = ' '.join(classes)
+        value = f"{classes or ''} {tag_id or ''}"
+        
+        if _PATTERNS.hs_db is None:
+            return _PATTERNS.exclude_re.search(value) is not None
+        
+        offset = len(_EXCLUDE_PATTERNS)
+        found = []
+        _PATTERNS.hs_scan(
+            value.encode('utf-8', 'replace'),
+            lambda pattern_id, start, end, flags, context: found.append(pattern_id < offset)
+        )
+        return any(found)
     
     def _extract_text_from_element(self, element: Tag) -> str:
         """요소에서 텍스트 추출"""
@@ -298,7 +868,7 @@ class HTMLParser:
             return ""
         
         # 공백 정규화
-        text = re.sub(r'\s+', ' ', text)
+        text = _WS_RE.sub(' ', text)
         
         # 앞뒤 공백 제거
         text = text.strip()
@@ -314,12 +884,21 @@ class HTMLParser:
         if not url:
             return None
         
-        # 상대 경로를 절대 경로로
-        url = urljoin(base_url, url)
-        
-        # URL 유효성 검사
-        parsed = urlparse(url)
-        if not parsed.scheme or not parsed.netloc:
-            return None
-        
-        return url
\ No newline at end of file
+        return _normalize_url_cached(url, base_url)
+
+
+@functools.lru_cache(maxsize=8192)
+def _normalize_url_cached(url: str, base_url: str) -> Optional[str]:
+    """URL 정규화 본체 (urljoin/urlparse는 순수 함수라 같은 입력은 캐시에서 반환)
+    
+    네비게이션, 관련 기사 링크처럼 페이지마다 반복되는 href가 많다.
+    """
+    # 상대 경로를 절대 경로로
+    url = urljoin(base_url, url)
+    
+    # URL 유효성 검사
+    parsed = urlparse(url)
+    if not parsed.scheme or not parsed.netloc:
+        return None
+    
+    return url
\ No newline at end of file
@@ -3,11 +3,21 @@ User-Agent 관리
 다양한 브라우저 User-Agent 제공
 """
 
+import re
 import random
 from typing import List, Optional
 from datetime import datetime
 
 
+# 오래된 User-Agent 판별 패턴 (is_outdated에서 사용, 모듈 로드 시 한 번만 컴파일)
+_OUTDATED_RES = (
+    re.compile(r"Chrome/[0-9]{1,2}\."),  # Chrome 99 이하
+    re.compile(r"Firefox/[0-9]{1,2}\."),  # Firefox 99 이하
+    re.compile(r"Windows NT 6"),           # Windows 7/8
+    re.compile(r"Mac OS X 10_[0-9]\b"),   # macOS 10.9 이하
+)
+
+
 class UserAgentManager:
     """User-Agent 관리자"""
     
@@ -36,6 +46,7 @@ class UserAgentManager:
             "X11; Ubuntu; Linux x86_64",
             "X11; Linux i686"
         ]
+        self._desktop_os = self.windows_versions + self.mac_versions + self.linux_versions
         
         # 모바일 디바이스
         self.mobile_devices = [
@@ -44,6 +55,20 @@ class UserAgentManager:
             "Linux; Android 14; SM-S908B",
             "Linux; Android 13; Pixel 7"
         ]
+        
+        # 브라우저별 (OS 목록, 버전 목록, 문자열 템플릿) - 목록 생성 시 일괄 샘플링에 사용
+        self._browser_pools = {
+            'chrome': (self._desktop_os, self.chrome_versions, self._format_chrome),
+            'firefox': (self._desktop_os, self.firefox_versions, self._format_firefox),
+            'safari': (self.mac_versions, self.safari_versions, self._format_safari),
+            'edge': (self.windows_versions, self.edge_versions, self._format_edge)
+        }
+        
+        # 브라우저별로 가능한 모든 User-Agent (rotate_user_agent에서 사용)
+        self._agent_pools = {
+            browser: [formatter(os, version) for os in os_pool for version in version_pool]
+            for browser, (os_pool, version_pool, formatter) in self._browser_pools.items()
+        }
     
     def get_random_user_agent(self, browser: Optional[str] = None, 
                             mobile: bool = False) -> str:
@@ -75,18 +100,40 @@ class UserAgentManager:
     def _get_chrome_user_agent(self) -> str:
         """Chrome User-Agent"""
         version = random.choice(self.chrome_versions)
-        os = random.choice(self.windows_versions + self.mac_versions + self.linux_versions)
+        os = random.choice(self._desktop_os)
         
-        return (
-            f"Mozilla/5.0 ({os}) AppleWebKit/537.36 "
-            f"(KHTML, like Gecko) Chrome/{version}.0.0.0 Safari/537.36"
-        )
+        return self._format_chrome(os, version)
     
     def _get_firefox_user_agent(self) -> str:
         """Firefox User-Agent"""
         version = random.choice(self.firefox_versions)
-        os = random.choice(self.windows_versions + self.mac_versions + self.linux_versions)
+        os = random.choice(self._desktop_os)
+        
+        return self._format_firefox(os, version)
+    
+    def _get_safari_user_agent(self) -> str:
+        """Safari User-Agent (Mac only)"""
+        version = random.choice(self.safari_versions)
+        os = random.choice(self.mac_versions)
+        
+        return self._format_safari(os, version)
+    
+    def _get_edge_user_agent(self) -> str:
+        """Edge User-Agent"""
+        version = random.choice(self.edge_versions)
+        os = random.choice(self.windows_versions)
         
+        return self._format_edge(os, version)
+    
+    @staticmethod
+    def _format_chrome(os: str, version: int) -> str:
+        return (
+            f"Mozilla/5.0 ({os}) AppleWebKit/537.36 "
+            f"(KHTML, like Gecko) Chrome/{version}.0.0.0 Safari/537.36"
+        )
+    
+    @staticmethod
+    def _format_firefox(os: str, version: int) -> str:
         gecko_version = "20100101"
         
         return (
@@ -94,11 +141,8 @@ class UserAgentManager:
             f"Gecko/{gecko_version} Firefox/{version}.0"
         )
     
-    def _get_safari_user_agent(self) -> str:
-        """Safari User-Agent (Mac only)"""
-        version = random.choice(self.safari_versions)
-        os = random.choice(self.mac_versions)
-        
+    @staticmethod
+    def _format_safari(os: str, version: str) -> str:
         webkit_version = "605.1.15"
         
         return (
@@ -106,11 +150,8 @@ class UserAgentManager:
             f"(KHTML, like Gecko) Version/{version} Safari/{webkit_version}"
         )
     
-    def _get_edge_user_agent(self) -> str:
-        """Edge User-Agent"""
-        version = random.choice(self.edge_versions)
-        os = random.choice(self.windows_versions)
-        
+    @staticmethod
+    def _format_edge(os: str, version: int) -> str:
         return (
             f"Mozilla/5.0 ({os}) AppleWebKit/537.36 "
             f"(KHTML, like Gecko) Chrome/{version}.0.0.0 Safari/537.36 Edg/{version}.0.0.0"
@@ -142,27 +183,31 @@ class UserAgentManager:
         return "curl/8.4.0"
     
     def get_user_agent_list(self, count: int = 10) -> List[str]:
-        """여러 User-Agent 목록 생성"""
-        agents = []
+        """여러 User-Agent 목록 생성
+        
+        get_random_user_agent()를 count번 부르는 대신 브라우저, OS, 버전을
+        필드마다 random.choices(k=...)로 한 번에 뽑아 템플릿에 채운다.
+        """
+        browsers = random.choices(list(self._browser_pools), k=count)
+        
+        streams = {}
+        for browser, (os_pool, version_pool, formatter) in self._browser_pools.items():
+            k = browsers.count(browser)
+            streams[browser] = map(
+                formatter,
+                random.choices(os_pool, k=k),
+                random.choices(version_pool, k=k)
+            )
         
-        for _ in range(count):
-            agents.append(self.get_random_user_agent())
+        agents = [next(streams[browser]) for browser in browsers]
         
-        return list(set(agents))  # 중복 제거
+        return list(dict.fromkeys(agents))  # 순서를 유지하며 중복 제거
     
     def is_outdated(self, user_agent: str) -> bool:
         """User-Agent가 오래되었는지 확인"""
         # 간단한 버전 체크
-        outdated_patterns = [
-            "Chrome/[0-9]{1,2}\\.",  # Chrome 99 이하
-            "Firefox/[0-9]{1,2}\\.",  # Firefox 99 이하
-            "Windows NT 6",           # Windows 7/8
-            "Mac OS X 10_[0-9]\\b",   # macOS 10.9 이하
-        ]
-        
-        import re
-        for pattern in outdated_patterns:
-            if re.search(pattern, user_agent):
+        for pattern in _OUTDATED_RES:
+            if pattern.search(user_agent):
                 return True
         
         return False
@@ -180,10 +225,10 @@ class UserAgentManager:
             elif "Edg" in current:
                 browser_type = "edge"
         
-        new_agent = self.get_random_user_agent(browser=browser_type)
-        
-        # 이전과 다른 것 보장
-        while new_agent == current:
-            new_agent = self.get_random_user_agent(browser=browser_type)
+        pool = self._agent_pools.get(browser_type.lower() if browser_type else None)
+        if pool is None:
+            pool = random.choice(list(self._agent_pools.values()))
         
-        return new_agent
\ No newline at end of file
+        # 이전과 다른 것 보장 (후보가 하나뿐이면 그대로 사용)
+        candidates = [agent for agent in pool if agent != current]
+        return random.choice(candidates or pool)
\ No newline at end of file
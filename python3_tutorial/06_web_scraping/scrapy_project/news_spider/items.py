@@ -2,36 +2,42 @@
 #
 # See documentation in:
 # https://docs.scrapy.org/en/latest/topics/items.html
+#
+# scrapy.Item 대신 slots 데이터클래스를 쓴다. Scrapy의 ItemAdapter가
+# 데이터클래스를 그대로 지원하므로 파이프라인과 Feed exporter는 별도 등록 없이 동작한다.
 
-import scrapy
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
 
 
-class NewsItem(scrapy.Item):
+@dataclass(slots=True)
+class NewsItem:
     """뉴스 아이템"""
-    url = scrapy.Field()
-    title = scrapy.Field()
-    content = scrapy.Field()
-    author = scrapy.Field()
-    published_date = scrapy.Field()
-    category = scrapy.Field()
-    tags = scrapy.Field()
-    images = scrapy.Field()
-    links = scrapy.Field()
-    metadata = scrapy.Field()
-    word_count = scrapy.Field()
-    reading_time = scrapy.Field()
-    language = scrapy.Field()
-    crawled_at = scrapy.Field()
+    url: str = ''
+    title: Optional[str] = None
+    content: Optional[str] = None
+    author: Optional[str] = None
+    published_date: Optional[str] = None
+    category: Optional[str] = None
+    tags: List[str] = field(default_factory=list)
+    images: List[Dict[str, Any]] = field(default_factory=list)
+    links: List[Dict[str, str]] = field(default_factory=list)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    word_count: Optional[int] = None
+    reading_time: Optional[int] = None
+    language: Optional[str] = None
+    crawled_at: Optional[str] = None
 
 
-class CommentItem(scrapy.Item):
+@dataclass(slots=True)
+class CommentItem:
     """댓글 아이템"""
-    article_url = scrapy.Field()
-    comment_id = scrapy.Field()
-    author = scrapy.Field()
-    content = scrapy.Field()
-    date = scrapy.Field()
-    likes = scrapy.Field()
-    replies = scrapy.Field()
-    is_reply = scrapy.Field()
-    parent_id = scrapy.Field()
\ No newline at end of file
+    article_url: str = ''
+    comment_id: Optional[str] = None
+    author: Optional[str] = None
+    content: Optional[str] = None
+    date: Optional[str] = None
+    likes: int = 0
+    replies: int = 0
+    is_reply: bool = False
+    parent_id: Optional[str] = None
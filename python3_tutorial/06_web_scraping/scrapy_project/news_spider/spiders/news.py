@@ -45,28 +45,30 @@ class NewsSpider(scrapy.Spider):
     
     def parse_article(self, response):
         """개별 기사 파싱"""
-        item = NewsItem()
+        content = self.extract_content(response)
         
         # 기본 정보
-        item['url'] = response.url
-        item['title'] = self.extract_title(response)
-        item['content'] = self.extract_content(response)
-        item['author'] = self.extract_author(response)
-        item['published_date'] = self.extract_date(response)
-        item['category'] = self.extract_category(response)
-        item['tags'] = self.extract_tags(response)
-        item['images'] = self.extract_images(response)
-        item['links'] = self.extract_links(response)
-        item['crawled_at'] = datetime.now().isoformat()
+        item = NewsItem(
+            url=response.url,
+            title=self.extract_title(response),
+            content=content,
+            author=self.extract_author(response),
+            published_date=self.extract_date(response),
+            category=self.extract_category(response),
+            tags=self.extract_tags(response),
+            images=self.extract_images(response),
+            links=self.extract_links(response),
+            crawled_at=datetime.now().isoformat()
+        )
         
         # 추가 처리
-        if item['content']:
-            item['word_count'] = len(item['content'].split())
-            item['reading_time'] = max(1, item['word_count'] // 200)
-            item['language'] = self.detect_language(item['content'])
+        if content:
+            item.word_count = len(content.split())
+            item.reading_time = max(1, item.word_count // 200)
+            item.language = self.detect_language(content)
         
         # 메타데이터
-        item['metadata'] = {
+        item.metadata = {
             'source_page': response.meta.get('source_page'),
             'scrapy_spider': self.name,
             'response_status': response.status,
@@ -2,10 +2,31 @@
 크롤러 테스트
 """
 
+import io
 import pytest
 import asyncio
+import httpx
+import requests
 from unittest.mock import Mock, patch
+from bs4 import BeautifulSoup
 from news_crawler.core import RequestsCrawler, HttpxCrawler
+from news_crawler.utils.parser import HTMLParser
+
+
+def _make_response(url: str, body: bytes, status_code: int = 200) -> requests.Response:
+    """스트리밍(iter_content, raw)도 되는 실제 requests.Response 생성"""
+    response = requests.Response()
+    response.url = url
+    response.status_code = status_code
+    response.raw = io.BytesIO(body)
+    return response
+
+
+def _mock_httpx_crawler(handler, **kwargs) -> HttpxCrawler:
+    """네트워크 대신 handler가 응답하는 HTTPX 크롤러"""
+    crawler = HttpxCrawler(http2=False, delay=0, **kwargs)
+    crawler.client_config['transport'] = httpx.MockTransport(handler)
+    return crawler
 
 
 class TestRequestsCrawler:
@@ -43,8 +64,7 @@ class TestRequestsCrawler:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.text = '<html><head><title>Test</title></head><body><p>Content</p></body></html>'
-        mock_response.content = b'test content'
-        mock_response.apparent_encoding = 'utf-8'
+        mock_response.content = mock_response.text.encode('utf-8')
         mock_get.return_value = mock_response
         
         crawler = RequestsCrawler()
@@ -89,6 +109,254 @@ class TestHttpxCrawler:
         assert crawler.client_config['limits'] is not None
 
 
+
+class TestRequestsCrawlerPaths:
+    """Requests 크롤러의 페이지네이션, 목록, 사이트맵 테스트"""
+    
+    LIST_URL = "https://news.example.com/list"
+    
+    PAGE_HTML = """<html><head><title>목록 {page}</title>
+<meta name="author" content="편집부"></head>
+<body>
+<nav class="main-nav"><a href="/nav">홈</a></nav>
+<article><h1>목록 {page}</h1><time datetime="2024-02-0{page}T08:00:00"></time>
+<a href="/news/{page}-1">기사 1</a> <a href="/news/{page}-2">기사 2</a></article>
+{paging}
+</body></html>"""
+    
+    # 다음 페이지 링크가 추출 시 지워지는 menu 컨테이너 안에 있다
+    PAGING_HTML = '<div class="paging-menu"><a class="next" href="?page={next}">다음</a></div>'
+    
+    SITEMAP_NS = 'xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"'
+    
+    def _page(self, page: int, last: int) -> bytes:
+        paging = self.PAGING_HTML.format(next=page + 1) if page < last else ''
+        return self.PAGE_HTML.format(page=page, paging=paging).encode('utf-8')
+    
+    @patch('requests.Session.get')
+    def test_pagination_checks_next_before_extraction(self, mock_get):
+        """다음 페이지 링크가 nav/menu 안에 있어도 끝까지 따라감"""
+        pages = {f"{self.LIST_URL}?page={n}": self._page(n, 3) for n in range(1, 4)}
+        mock_get.side_effect = lambda url, **kwargs: _make_response(url, pages[url])
+        
+        crawler = RequestsCrawler(delay=0)
+        results = crawler.crawl_with_pagination(self.LIST_URL, max_pages=10)
+        
+        assert [r.title for r in results] == ["목록 1", "목록 2", "목록 3"]
+        assert mock_get.call_count == 3
+        crawler.close()
+    
+    @pytest.mark.parametrize("chunked", [False, True])
+    @patch('requests.Session.get')
+    def test_crawl_listing_matches_extract_all(self, mock_get, chunked):
+        """스트리밍 목록 크롤링 결과가 전체 파싱(extract_all)과 같음"""
+        body = self._page(1, 2)
+        url = f"{self.LIST_URL}?page=1"
+        
+        def get(url, **kwargs):
+            response = _make_response(url, body)
+            if chunked:
+                # 작은 청크로 나눠 받도록 iter_content 크기 고정
+                chunks = [body[i:i + 16] for i in range(0, len(body), 16)]
+                response.iter_content = lambda chunk_size=1, **kw: iter(chunks)
+            return response
+        
+        mock_get.side_effect = get
+        
+        crawler = RequestsCrawler(delay=0)
+        result = crawler.crawl_listing(url)
+        
+        parser = HTMLParser.shared()
+        expected = parser.extract_all(BeautifulSoup(body, 'lxml'), url, parser.head_text(body))
+        
+        assert result.success
+        for key in ('title', 'author', 'published_date', 'links', 'metadata'):
+            assert getattr(result, key) == expected[key]
+        assert result.content is None
+        assert crawler.stats["total_bytes"] == len(body)
+        crawler.close()
+    
+    @patch('requests.Session.get')
+    def test_crawl_sitemap_streaming(self, mock_get):
+        """사이트맵 인덱스를 따라가며 모든 loc를 순서대로 반환"""
+        def urlset(start: int, count: int) -> bytes:
+            entries = ''.join(
+                f"<url><loc>\n  https://news.example.com/news/{i}\n</loc><lastmod>2024-01-01</lastmod></url>"
+                for i in range(start, start + count)
+            )
+            return f'<?xml version="1.0" encoding="UTF-8"?><urlset {self.SITEMAP_NS}>{entries}</urlset>'.encode()
+        
+        index = (f'<?xml version="1.0" encoding="UTF-8"?><sitemapindex {self.SITEMAP_NS}>'
+                 '<sitemap><loc>https://news.example.com/sitemap-1.xml</loc></sitemap>'
+                 '<sitemap><loc>https://news.example.com/sitemap-2.xml</loc></sitemap>'
+                 '</sitemapindex>').encode()
+        documents = {
+            "https://news.example.com/sitemap.xml": index,
+            "https://news.example.com/sitemap-1.xml": urlset(0, 1500),
+            "https://news.example.com/sitemap-2.xml": urlset(1500, 3),
+        }
+        mock_get.side_effect = lambda url, **kwargs: _make_response(url, documents[url])
+        
+        crawler = RequestsCrawler(delay=0)
+        urls = crawler.crawl_sitemap("https://news.example.com/sitemap.xml")
+        
+        assert urls == [f"https://news.example.com/news/{i}" for i in range(1503)]
+        crawler.close()
+    
+    @patch('requests.Session.get')
+    def test_crawl_sitemap_error(self, mock_get, tmp_path):
+        """깨진 사이트맵은 빈 목록, 외부 엔티티는 풀지 않음"""
+        mock_get.side_effect = lambda url, **kwargs: _make_response(url, b'<urlset><url><loc>x')
+        
+        crawler = RequestsCrawler(delay=0)
+        assert crawler.crawl_sitemap("https://news.example.com/sitemap.xml") == []
+        
+        secret = tmp_path / "secret.txt"
+        secret.write_text("https://attacker.example.com/leaked")
+        document = (
+            f'<?xml version="1.0"?>'
+            f'<!DOCTYPE urlset [<!ENTITY xxe SYSTEM "{secret.as_uri()}">]>'
+            f'<urlset><url><loc>&xxe;</loc></url></urlset>'
+        ).encode()
+        mock_get.side_effect = lambda url, **kwargs: _make_response(url, document)
+        
+        urls = crawler.crawl_sitemap("https://news.example.com/sitemap.xml")
+        assert not any("leaked" in url for url in urls)
+        crawler.close()
+
+
+class TestHttpxCrawlPool:
+    """HTTPX 워커 풀 순서/취소/정리 테스트"""
+    
+    URLS = [f"https://news.example.com/news/{i}" for i in range(12)]
+    
+    @staticmethod
+    async def _handler(request: httpx.Request) -> httpx.Response:
+        index = int(request.url.path.rsplit('/', 1)[1])
+        if index == 5:
+            return httpx.Response(500)
+        
+        # 뒤 URL일수록 먼저 끝나도록 지연
+        await asyncio.sleep(0.002 * (12 - index))
+        return httpx.Response(200, html=f"<html><head><title>기사 {index}</title></head><body></body></html>")
+    
+    @pytest.mark.asyncio
+    async def test_crawl_multiple_keeps_input_order(self):
+        """끝나는 순서와 상관없이 입력 순서대로 결과 반환"""
+        crawler = _mock_httpx_crawler(self._handler, max_connections=4, retry_count=1)
+        results = await crawler.crawl_multiple_async(self.URLS)
+        
+        assert [r.url for r in results] == self.URLS
+        assert [r.success for r in results] == [i != 5 for i in range(12)]
+        assert [r.title for r in results if r.success] == [f"기사 {i}" for i in range(12) if i != 5]
+        
+        # 공유 루프 밖에서 쓴 클라이언트는 호출이 끝나면 닫힘
+        assert crawler._client is None
+    
+    @pytest.mark.asyncio
+    async def test_stream_yields_every_result(self):
+        crawler = _mock_httpx_crawler(self._handler, max_connections=4, retry_count=1)
+        
+        results = [r async for r in crawler.crawl_stream_async(self.URLS)]
+        
+        assert sorted(r.url for r in results) == sorted(self.URLS)
+    
+    @pytest.mark.asyncio
+    async def test_stream_cancel_stops_workers(self):
+        """스트림을 중간에 닫으면 진행 중인 요청과 워커가 모두 정리됨"""
+        state = {'started': 0, 'active': 0}
+        
+        async def handler(request):
+            state['started'] += 1
+            state['active'] += 1
+            try:
+                await asyncio.sleep(0.01)
+                return httpx.Response(200, html="<html><title>t</title></html>")
+            finally:
+                state['active'] -= 1
+        
+        crawler = _mock_httpx_crawler(handler, max_connections=2)
+        urls = [f"https://news.example.com/news/{i}" for i in range(50)]
+        
+        stream = crawler.crawl_stream_async(urls)
+        async for _ in stream:
+            break
+        await stream.aclose()
+        
+        assert state['active'] == 0
+        assert state['started'] < len(urls)
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+        assert crawler._client is None
+    
+    def test_sync_close_after_abandoned_stream(self):
+        """동기 래퍼 루프에서 멈춘 스트림도 close()가 끝까지 정리"""
+        state = {'active': 0}
+        
+        async def handler(request):
+            state['active'] += 1
+            try:
+                await asyncio.sleep(0.01)
+                return httpx.Response(200, html="<html><title>t</title></html>")
+            except asyncio.CancelledError:
+                # 연결 정리처럼 취소 후에도 잠시 걸리는 작업
+                await asyncio.sleep(0.01)
+                raise
+            finally:
+                state['active'] -= 1
+        
+        crawler = _mock_httpx_crawler(handler, max_connections=2)
+        urls = [f"https://news.example.com/news/{i}" for i in range(20)]
+        
+        async def consume_first():
+            async for result in crawler.crawl_stream_async(urls):
+                return result
+        
+        assert crawler._run(consume_first()).success
+        loop = crawler._loop
+        crawler.close()
+        
+        assert state['active'] == 0
+        assert not asyncio.all_tasks(loop)
+        assert crawler._loop is None and crawler._client is None
+    
+    def test_reuse_across_event_loops(self):
+        """asyncio.run을 여러 번 불러도 이전 루프의 클라이언트를 남기지 않음"""
+        crawler = _mock_httpx_crawler(self._handler, max_connections=4, retry_count=1)
+        
+        for _ in range(2):
+            results = asyncio.run(crawler.crawl_multiple_async(self.URLS[:3]))
+            assert all(r.success for r in results)
+            assert crawler._client is None
+    
+    def test_sync_then_asyncio_run(self):
+        """동기 호출 뒤에도 asyncio.run에서 비동기 호출 가능 (공유 루프 클라이언트는 그대로)"""
+        crawler = _mock_httpx_crawler(self._handler, max_connections=4, retry_count=1)
+        
+        assert crawler.crawl(self.URLS[0]).success
+        loop_client = crawler._loop_client
+        
+        assert asyncio.run(crawler.crawl_async(self.URLS[1])).success
+        assert crawler._client is None
+        
+        assert crawler.crawl(self.URLS[2]).success
+        assert crawler._loop_client is loop_client
+        
+        crawler.close()
+        assert loop_client.is_closed and crawler._loop_client is None
+    
+    @pytest.mark.asyncio
+    async def test_async_with_shares_client(self):
+        crawler = _mock_httpx_crawler(self._handler, retry_count=1)
+        
+        async with crawler:
+            client = crawler._client
+            await crawler.crawl_async(self.URLS[0])
+            await crawler.crawl_multiple_async(self.URLS[:2])
+            assert crawler._client is client
+        
+        assert crawler._client is None
+
+
 @pytest.mark.integration
 class TestCrawlerIntegration:
     """크롤러 통합 테스트"""
@@ -0,0 +1,219 @@
+"""
+파서 테스트
+빠른 경로(lexbor, hyperscan, 스트리밍)가 BeautifulSoup/re 경로와 같은 결과를 내는지 확인
+"""
+
+import pytest
+from bs4 import BeautifulSoup
+from news_crawler.utils import parser as parser_module
+from news_crawler.utils.parser import HTMLParser
+
+
+BASE_URL = "https://news.example.com/section/"
+
+ARTICLE_HTML = """<html><head><title>목록 제목</title>
+<meta property="og:title" content="OG 제목">
+<meta property="og:type" content="article">
+<meta name="twitter:card" content="summary">
+<meta name="author" content="홍길동">
+<meta name="description" content="기사 설명">
+</head>
+<body>
+<nav class="main-nav"><a href="/nav1">홈</a><a href="/nav2">정치</a></nav>
+<div id="sidebar"><a href="/side">많이 본 뉴스</a></div>
+<article>
+<h1>기사 <b>제목</b></h1>
+<time datetime="2024-03-05T09:30:00">3월 5일</time>
+<p>첫 문단입니다. 본문으로 인정받을 만큼 충분히 긴 문장을 여러 번 씁니다.
+본문으로 인정받을 만큼 충분히 긴 문장을 여러 번 씁니다.</p>
+<p><a href="/news/1">관련 기사</a> <a href="https://other.example/x">외부</a>
+<a href="#top">위로</a> <a href="javascript:void(0)">스크립트</a> <a href="/news/1">중복</a></p>
+<img src="/img/a.png">
+</article>
+<footer><a href="/about">소개</a></footer>
+</body></html>""".encode('utf-8')
+
+# article 없이 본문과 네비게이션 링크가 섞인 페이지 (날짜는 본문 텍스트에만 있음)
+LISTING_HTML = """<html><head><title>오늘의 뉴스</title></head>
+<body>
+<nav class="main-nav"><a href="/nav1">홈</a><a href="/nav2">정치</a></nav>
+<ul id="gnb-menu"><li><a href="/menu1">메뉴</a></li></ul>
+<div class="list">
+<p>2024-01-15 업데이트</p>
+<a href="/news/10">첫 번째 기사</a>
+<a href="/news/11">두 번째 기사</a>
+</div>
+<div class="paging-menu"><a class="next" href="?page=2">다음</a></div>
+</body></html>""".encode('utf-8')
+
+
+@pytest.fixture
+def parser():
+    return HTMLParser()
+
+
+@pytest.fixture
+def no_lexbor(monkeypatch):
+    """selectolax 미설치 환경처럼 BeautifulSoup 경로 사용"""
+    monkeypatch.setattr(parser_module, 'LexborHTMLParser', None)
+
+
+def _extract_bs4(parser, content):
+    """기준 결과: BeautifulSoup 경로의 extract_all"""
+    return parser.extract_all(BeautifulSoup(content, 'lxml'), BASE_URL,
+                              parser.head_text(content))
+
+
+class TestExtractAll:
+    """extract_all 회귀 테스트"""
+    
+    def test_article_fields(self, parser):
+        """article 안의 링크만 정규화/중복 제거해서 추출"""
+        data = _extract_bs4(parser, ARTICLE_HTML)
+        
+        assert data['title'] == "OG 제목"
+        assert data['author'] == "홍길동"
+        assert data['published_date'].isoformat() == "2024-03-05T09:30:00"
+        assert data['links'] == [
+            "https://news.example.com/news/1",
+            "https://other.example/x",
+        ]
+        assert data['images'] == ["https://news.example.com/img/a.png"]
+    
+    @pytest.mark.parametrize("use_lexbor", [False, True])
+    def test_nav_links_excluded(self, parser, monkeypatch, use_lexbor):
+        """parse()를 거쳐도 nav/menu 안의 링크는 결과에 남지 않음"""
+        if use_lexbor and not parser.lexbor_available:
+            pytest.skip("selectolax not installed")
+        if not use_lexbor:
+            monkeypatch.setattr(parser_module, 'LexborHTMLParser', None)
+        
+        soup, encoding = parser.parse(LISTING_HTML)
+        data = parser.extract_all(soup, BASE_URL, parser.head_text(LISTING_HTML, encoding))
+        
+        assert "https://news.example.com/news/10" in data['links']
+        assert "https://news.example.com/news/11" in data['links']
+        for url in data['links']:
+            assert "/nav" not in url and "/menu" not in url
+            assert "page=2" not in url
+        assert data['published_date'].date().isoformat() == "2024-01-15"
+
+
+class TestLexborPath:
+    """lexbor 트리 추출이 BeautifulSoup 경로와 같은지 확인"""
+    
+    @pytest.mark.parametrize("content", [ARTICLE_HTML, LISTING_HTML])
+    def test_matches_beautifulsoup(self, parser, content):
+        if not parser.lexbor_available:
+            pytest.skip("selectolax not installed")
+        
+        tree, encoding = parser.parse(content)
+        assert isinstance(tree, parser_module.LexborHTMLParser)
+        
+        expected = _extract_bs4(parser, content)
+        actual = parser._extract_all_lexbor(tree, BASE_URL, parser.head_text(content, encoding))
+        
+        assert actual == expected
+    
+    def test_no_lexbor_parse_returns_soup(self, parser, no_lexbor):
+        """selectolax가 없으면 parse()는 BeautifulSoup 문서 반환"""
+        soup, encoding = parser.parse(ARTICLE_HTML)
+        
+        assert isinstance(soup, BeautifulSoup)
+        assert encoding == 'utf-8'
+
+
+class TestHyperscanPath:
+    """hyperscan 검색이 re 검색과 같은지 확인"""
+    
+    DATE_TEXTS = [
+        "게시일 2024-01-15, 수정 01/20/2024",
+        "2023년 12월 3일 오전 / 2023/12/03",
+        "12-31-2023 then 2024-1-2 and 2024-01-02",
+        "날짜 없음",
+        "",
+    ]
+    
+    TAG_HTML = """
+    <div class="article-body">본문</div>
+    <div class="Top-Banner">광고</div>
+    <div id="commentList">댓글</div>
+    <section class="hero wide">일반</section>
+    <ul id="GNB-Menu"></ul>
+    <script>var x = 1;</script>
+    <p>클래스 없음</p>
+    <span class="">빈 클래스</span>
+    """
+    
+    @pytest.fixture(autouse=True)
+    def _require_hyperscan(self, parser):
+        if not parser.hyperscan_available:
+            pytest.skip("hyperscan not installed")
+    
+    @pytest.mark.parametrize("text", DATE_TEXTS)
+    def test_search_dates(self, parser, monkeypatch, text):
+        actual = parser._search_dates(text)
+        
+        monkeypatch.setattr(parser_module._PATTERNS, 'hs_db', None)
+        expected = parser._search_dates(text)
+        
+        assert actual == expected
+    
+    def test_is_unwanted(self, parser, monkeypatch):
+        tags = BeautifulSoup(self.TAG_HTML, 'lxml').find_all(True)
+        actual = [parser._is_unwanted(tag) for tag in tags]
+        
+        monkeypatch.setattr(parser_module._PATTERNS, 'hs_db', None)
+        expected = [parser._is_unwanted(tag) for tag in tags]
+        
+        assert actual == expected
+        assert any(expected) and not all(expected)
+
+
+class TestExtractFromStream:
+    """스트리밍 추출이 extract_all과 같은지 확인"""
+    
+    KEYS = ('title', 'author', 'published_date', 'links', 'metadata')
+    
+    @pytest.mark.parametrize("document", [ARTICLE_HTML, LISTING_HTML], ids=["article", "listing"])
+    @pytest.mark.parametrize("chunk_size", [1, 7, 64, 1 << 16])
+    def test_matches_extract_all(self, parser, document, chunk_size):
+        """article이 없는 목록 페이지도 네비게이션/메뉴 링크는 제외"""
+        chunks = [document[i:i + chunk_size]
+                  for i in range(0, len(document), chunk_size)]
+        
+        actual = parser.extract_from_stream(chunks, BASE_URL)
+        expected = _extract_bs4(parser, document)
+        
+        assert set(actual) == set(self.KEYS)
+        assert {key: expected[key] for key in self.KEYS} == actual
+    
+    def test_skips_removed_containers(self, parser):
+        """지워질 요소 안의 article, time, 링크는 extract_all처럼 보지 않음"""
+        content = """<html><head><title>목록</title></head><body>
+<div class="related"><article><time datetime="2020-01-01"></time><a href="/old">옛 기사</a></article></div>
+<svg><a href="/icon">아이콘</a></svg>
+<article><a href="/news/20">기사</a><div class="article-footer"><a href="/about">소개</a></div></article>
+</body></html>""".encode('utf-8')
+        
+        actual = parser.extract_from_stream([content], BASE_URL)
+        expected = _extract_bs4(parser, content)
+        
+        assert actual['links'] == expected['links'] == ["https://news.example.com/news/20"]
+        assert actual['published_date'] == expected['published_date']
+    
+    def test_declared_encoding(self, parser):
+        """메타 charset으로 선언된 인코딩 사용"""
+        content = ('<html><head><meta charset="euc-kr"><title>한글 제목</title></head>'
+                   '<body><a href="/x">링크</a></body></html>').encode('euc-kr')
+        
+        data = parser.extract_from_stream([content], BASE_URL)
+        
+        assert data['title'] == "한글 제목"
+        assert data['links'] == ["https://news.example.com/x"]
+    
+    def test_empty_document(self, parser):
+        data = parser.extract_from_stream([b''], BASE_URL)
+        
+        assert data['title'] is None
+        assert data['links'] == []